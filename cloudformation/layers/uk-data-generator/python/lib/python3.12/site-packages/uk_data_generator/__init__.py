@@ -10,6 +10,15 @@ Main components:
 - UKAddressGenerator: Generate valid UK addresses with proper postcode formats
 - CouncilServiceGenerator: Generate council service requests across categories
 - CouncilDataGenerator: Main orchestrator for comprehensive data generation
+- generate_councils / CouncilSpec: Batch generation for many councils
+- DatasetStream: Lazily generated dataset with constant memory use
+- AsyncRecordStream: Async batches of a dataset with queue backpressure
+- NDJSONWriter / CSVWriter: Buffered streaming writers with optional gzip
+- GenerationProfiler: Optional per-stage timings and throughput metrics
+- ArrivalSimulator: Time-ordered service request arrivals over years
+- FOILetterGenerator: FOI request letters with ground-truth PII offsets
+- CarParkSensorHistory: Days or weeks of smart car park sensor readings
+- DatasetCache: Opt-in on-disk cache of generated datasets
 
 Usage:
     from uk_data_generator import CouncilDataGenerator
@@ -23,17 +32,69 @@ Usage:
     data = generator.generate(data_volume=100)
 """
 
-from .generators import (
-    UKNameGenerator,
-    UKAddressGenerator,
-    CouncilServiceGenerator,
-    CouncilDataGenerator
-)
+from importlib import import_module
+
+# typing.TYPE_CHECKING without importing typing, which alone costs more than
+# the rest of the package import
+TYPE_CHECKING = False
 
 __version__ = "1.0.0"
-__all__ = [
-    "UKNameGenerator",
-    "UKAddressGenerator",
-    "CouncilServiceGenerator",
-    "CouncilDataGenerator"
-]
+
+# Public names and the submodules defining them. Submodules are imported on
+# first attribute access, so importing the package on a Lambda cold start
+# loads nothing until a generator is actually used.
+_LAZY_ATTRIBUTES = {
+    "UKNameGenerator": ".generators",
+    "UKAddressGenerator": ".generators",
+    "CouncilServiceGenerator": ".generators",
+    "CouncilDataGenerator": ".generators",
+    "NameSpaceExhaustedError": ".generators",
+    "AddressSpaceExhaustedError": ".generators",
+    "CouncilSpec": ".parallel",
+    "generate_councils": ".parallel",
+    "DatasetStream": ".streaming",
+    "AsyncRecordStream": ".aio",
+    "NDJSONWriter": ".writers",
+    "CSVWriter": ".writers",
+    "GenerationProfiler": ".profiling",
+    "DatasetCache": ".cache",
+    "ArrivalSimulator": ".arrivals",
+    "FOILetterGenerator": ".foi",
+    "CarParkSensorHistory": ".car_park"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .generators import (
+        UKNameGenerator,
+        UKAddressGenerator,
+        CouncilServiceGenerator,
+        CouncilDataGenerator,
+        NameSpaceExhaustedError,
+        AddressSpaceExhaustedError
+    )
+    from .parallel import CouncilSpec, generate_councils
+    from .streaming import DatasetStream
+    from .aio import AsyncRecordStream
+    from .writers import NDJSONWriter, CSVWriter
+    from .profiling import GenerationProfiler
+    from .cache import DatasetCache
+    from .arrivals import ArrivalSimulator
+    from .foi import FOILetterGenerator
+    from .car_park import CarParkSensorHistory
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,111 @@
+"""
+Command line entry point for the UK data generator.
+
+Usage:
+    python -m uk_data_generator --seed 42 --volume 100000 --parallel 8 \
+        --council "Birmingham City Council" --region "West Midlands" \
+        --output dataset.json
+
+--parallel above 1 implies --counter-based, so the output is identical to
+--counter-based --parallel 1 for the same seed. Add --reference-time to make
+the timestamps reproducible as well.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+from .generators import CouncilDataGenerator
+from .profiling import SERIALISATION, GenerationProfiler
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="uk_data_generator",
+        description="Generate synthetic UK council sample data"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--volume", type=int, default=100, help="Number of residents (default: 100)")
+    parser.add_argument("--council", default="Sample Council", help="Council name")
+    parser.add_argument("--region", default="Sample Region", help="Geographic region")
+    parser.add_argument(
+        "--no-service-requests",
+        action="store_true",
+        help="Generate residents only"
+    )
+    parser.add_argument(
+        "--counter-based",
+        action="store_true",
+        help="Derive each record from (seed, index) alone"
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Worker processes; values above 1 imply --counter-based (default: 1)"
+    )
+    parser.add_argument(
+        "--reference-time",
+        type=datetime.fromisoformat,
+        default=None,
+        help="ISO 8601 time that timestamps are relative to (default: now)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and throughput to stderr"
+    )
+    parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    parser.add_argument("--indent", type=int, default=None, help="JSON indentation")
+
+    return parser
+
+
+def _write_dataset(data, path: Optional[str], indent: Optional[int]) -> None:
+    """Write the dataset as JSON to a file, or stdout if no path is given."""
+    if path:
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(data, output, indent=indent)
+    else:
+        json.dump(data, sys.stdout, indent=indent)
+        sys.stdout.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the generator from the command line."""
+    args = build_parser().parse_args(argv)
+
+    if args.parallel < 1:
+        build_parser().error("--parallel must be at least 1")
+
+    profiler = GenerationProfiler(trace_memory=True) if args.profile else None
+    generator = CouncilDataGenerator(
+        seed=args.seed,
+        council_name=args.council,
+        region=args.region,
+        counter_based=args.counter_based or args.parallel > 1,
+        reference_time=args.reference_time,
+        profiler=profiler
+    )
+    data = generator.generate(
+        data_volume=args.volume,
+        include_service_requests=not args.no_service_requests,
+        parallel=args.parallel
+    )
+
+    if profiler is None:
+        _write_dataset(data, args.output, args.indent)
+    else:
+        with profiler.stage(SERIALISATION):
+            _write_dataset(data, args.output, args.indent)
+        json.dump(profiler.report(), sys.stderr, indent=2)
+        sys.stderr.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Bijective index mapping over the UK address space.
+
+Every address is a combination of a postcode (city, outward code, sector,
+unit) and a street part (street number, street name, street type).
+AddressSpace maps each index in [0, size) to a distinct combination with
+two seeded permutations, so drawing millions of unique addresses needs no
+seen-set and costs constant time per address.
+
+Index i is split as i = epoch * postcodes + offset. The offset selects the
+postcode through one permutation; the street part is selected through a
+second permutation at (epoch + offset) mod streets. Distinct offsets give
+distinct postcodes and, for one offset, distinct epochs give distinct
+street parts, so postcodes are unique for the first `postcodes` indices
+and whole addresses for all `size` indices.
+"""
+
+import random
+from bisect import bisect_right
+from typing import List, NamedTuple, Optional, Sequence
+from .compiled import CompiledCity, CompiledConfig
+from .permutation import IndexPermutation
+
+# Postcode sectors (0-9) per outward code
+_SECTORS = 10
+
+
+class AddressParts(NamedTuple):
+    """Components of one address from the address space."""
+    city: CompiledCity
+    street_number: int
+    street_name: str
+    street_type: str
+    postcode: str
+
+
+class AddressSpace:
+    """
+    Seeded bijection from indices to unique address combinations.
+
+    Example:
+        space = AddressSpace(get_compiled_config(), key=42)
+        space[0], space[1], ...  # never the same address twice
+    """
+
+    def __init__(self, config: CompiledConfig, key: Optional[int] = None):
+        """
+        Initialize address space.
+
+        Args:
+            config: Compiled configuration providing cities, postcode
+                outward codes and street vocabularies
+            key: Permutation key; None draws a random key
+        """
+        self.config = config
+        key_random = random.Random(key)
+
+        # Outward codes per city: data pack codes, else prefix + 1..99
+        self._outward_codes: List[Sequence[str]] = [
+            city.postcode_districts or [f"{city.postcode_prefix}{n}" for n in range(1, 100)]
+            for city in config.cities
+        ]
+        units = len(config.postcode_unit_letters)
+        self._units = units * units
+        self._postcodes_per_outward = _SECTORS * self._units
+
+        # Cumulative postcode counts: city i owns [_city_starts[i], _city_starts[i + 1])
+        self._city_starts = [0]
+        for codes in self._outward_codes:
+            self._city_starts.append(
+                self._city_starts[-1] + len(codes) * self._postcodes_per_outward
+            )
+
+        self.postcodes = self._city_starts[-1]
+        self.streets = 999 * len(config.street_names) * len(config.street_types)
+        self.size = self.postcodes * self.streets
+
+        self._postcode_permutation = IndexPermutation(
+            self.postcodes, key=key_random.getrandbits(64)
+        )
+        self._street_permutation = IndexPermutation(self.streets, key=key_random.getrandbits(64))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> AddressParts:
+        if not 0 <= index < self.size:
+            raise IndexError("Address space index out of range")
+
+        epoch, offset = divmod(index, self.postcodes)
+        postcode_index = self._postcode_permutation[offset]
+        street_index = self._street_permutation[(epoch + offset) % self.streets]
+
+        city_index = bisect_right(self._city_starts, postcode_index) - 1
+        local = postcode_index - self._city_starts[city_index]
+        outward_index, local = divmod(local, self._postcodes_per_outward)
+        sector, unit = divmod(local, self._units)
+        letters = self.config.postcode_unit_letters
+        first, second = divmod(unit, len(letters))
+
+        street_names = self.config.street_names
+        street_types = self.config.street_types
+        street_index, number = divmod(street_index, 999)
+        name_index, type_index = divmod(street_index, len(street_types))
+
+        outward = self._outward_codes[city_index][outward_index]
+
+        return AddressParts(
+            self.config.cities[city_index],
+            number + 1,
+            street_names[name_index],
+            street_types[type_index],
+            f"{outward} {sector}{letters[first]}{letters[second]}"
+        )
@@ -0,0 +1,140 @@
+"""
+Asyncio support for UK council sample data.
+
+AsyncRecordStream runs a DatasetStream in a worker thread and hands records
+to an asyncio consumer in batches through a bounded asyncio.Queue. When the
+consumer falls behind (e.g. waiting on network writes), the queue fills and
+the producer thread blocks, so at most max_pending batches are held in
+memory while generation and I/O overlap.
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from .streaming import DatasetStream
+
+# Sentinel marking the end of the record stream
+_DONE = object()
+
+
+class _ProducerError:
+    """Exception raised in the producer thread, re-raised in the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class AsyncRecordStream:
+    """
+    Async iterator over batches of a lazily generated dataset.
+
+    Each batch is a list of (record_kind, record) tuples in the same order
+    as DatasetStream. Once exhausted, metadata and record_counts are
+    populated. A stream can only be consumed once.
+
+    Example:
+        async with generator.aiter_records(10_000, batch_size=500) as stream:
+            async for batch in stream:
+                await writer.put_records(batch)
+        stream.metadata
+
+    Leaving the async with block (or calling aclose()) stops the producer
+    thread early. The generator must not be used elsewhere while the
+    stream is running.
+    """
+
+    def __init__(self, stream: DatasetStream, batch_size: int = 1000, max_pending: int = 4):
+        """
+        Initialize async record stream.
+
+        Args:
+            stream: Dataset stream to consume in the producer thread
+            batch_size: Records per batch
+            max_pending: Batches the producer may queue ahead of the consumer
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self._stream = stream
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._batches: Optional[AsyncIterator[List[Tuple[str, Dict[str, Any]]]]] = None
+
+    def __aiter__(self) -> AsyncIterator[List[Tuple[str, Dict[str, Any]]]]:
+        if self._batches is not None:
+            raise RuntimeError("AsyncRecordStream can only be consumed once")
+        self._batches = self._run()
+        return self._batches
+
+    async def __aenter__(self) -> "AsyncRecordStream":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop the producer thread and wait for it to exit."""
+        if self._batches is not None:
+            await self._batches.aclose()
+
+    async def _run(self) -> AsyncIterator[List[Tuple[str, Dict[str, Any]]]]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending)
+        stop = threading.Event()
+        batch_size = self.batch_size
+
+        def put(item: Any) -> None:
+            # Blocks this thread while the queue is full
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce() -> None:
+            try:
+                batch = []
+                for record in self._stream:
+                    if stop.is_set():
+                        return
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        put(batch)
+                        batch = []
+                if batch:
+                    put(batch)
+                put(_DONE)
+            except Exception as error:
+                if not stop.is_set():
+                    put(_ProducerError(error))
+
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _ProducerError):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+            # Drain the queue so a producer blocked on a full queue can exit
+            while not producer.done():
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.wait({producer}, timeout=0.01)
+            await producer
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every record has been produced."""
+        return self._stream.exhausted
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Dataset metadata, available once the stream is exhausted."""
+        return self._stream.metadata
+
+    @property
+    def record_counts(self) -> Dict[str, int]:
+        """Record counts, available once the stream is exhausted."""
+        return self._stream.record_counts
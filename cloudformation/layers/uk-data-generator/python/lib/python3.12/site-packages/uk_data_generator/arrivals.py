@@ -0,0 +1,348 @@
+"""
+Time-series service request arrivals for dashboard load testing.
+
+CouncilServiceGenerator spreads requests uniformly over the last 30 days.
+ArrivalSimulator instead models each category as a non-homogeneous Poisson
+process over any span of time, with rates shaped by hour of day, day of
+week, month (e.g. Council Tax peaking in January) and storm bursts for
+Highways (config.SERVICE_ARRIVAL_PATTERNS).
+
+The rate is held constant within each hour. Every hour draws one Poisson
+count per category and uniform arrival times within the hour, then sorts
+that hour's arrivals, so the stream is time-ordered while memory stays at
+one hour of requests however many years are simulated. Each hour's draws
+are seeded from a counter stream keyed by the hour itself, so overlapping
+windows agree on the arrival times they share.
+
+Reference indices are keyed the same way: the hour's offset within its
+month times REFERENCE_STRIDE, plus the arrival's position in the hour. A
+request keeps its reference in any window that contains it, and separate
+windows (or processes) never issue the same reference.
+
+Status and lastUpdated follow each request's lifecycle (submitted, then
+triaged to in_progress, then resolved) as seen at the end of the window.
+Times are whole seconds.
+"""
+
+import random
+from datetime import datetime, timedelta
+from math import log
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from . import config as default_config
+from .compiled import CompiledConfig, get_compiled_config
+from .records import ServiceRequestRecord
+from .rng import CounterStream
+from .sampling import poisson
+
+_HOUR = timedelta(hours=1)
+_SECONDS_PER_DAY = 86400.0
+
+# Reference indices reserved per hour; references carry the month, so
+# indices only need to be unique within it
+REFERENCE_STRIDE = 10000
+
+
+def _normalised(factors: Sequence[float]) -> Tuple[float, ...]:
+    """Scale factors to average 1."""
+    mean = sum(factors) / len(factors)
+    if mean <= 0:
+        raise ValueError("Arrival pattern factors must have a positive mean")
+    return tuple(factor / mean for factor in factors)
+
+
+def _hour_number(when: datetime) -> int:
+    """Hours since 0001-01-01, used to key each hour's draws."""
+    return (when.replace(tzinfo=None) - datetime.min) // _HOUR
+
+
+class Storm:
+    """Burst of extra arrivals for one category."""
+
+    __slots__ = ("category", "start", "end", "peak_multiplier")
+
+    def __init__(self, category: str, start: datetime, end: datetime, peak_multiplier: float):
+        self.category = category
+        self.start = start
+        self.end = end
+        self.peak_multiplier = peak_multiplier
+
+    def multiplier(self, when: datetime) -> float:
+        """Rate multiplier at a time: the peak at the start, decaying to 1 at the end."""
+        if not self.start <= when < self.end:
+            return 1.0
+        remaining = (self.end - when) / (self.end - self.start)
+        return 1.0 + (self.peak_multiplier - 1.0) * remaining
+
+    def __repr__(self) -> str:
+        return (
+            f"Storm({self.category!r}, {self.start.isoformat()}, "
+            f"{self.end.isoformat()}, {self.peak_multiplier:.2f})"
+        )
+
+
+class ArrivalSimulator:
+    """
+    Non-homogeneous Poisson arrivals of service requests by category.
+
+    Example:
+        simulator = ArrivalSimulator(
+            seed=42, start=datetime(2023, 1, 1), end=datetime(2026, 1, 1),
+            daily_volume=20_000
+        )
+        for request in simulator.iter_requests():  # sorted by submittedAt
+            ...
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int],
+        start: datetime,
+        end: datetime,
+        daily_volume: float = 1000.0,
+        config: Optional[CompiledConfig] = None,
+        patterns: Optional[Dict[str, Any]] = None,
+        compact: bool = False
+    ):
+        """
+        Initialize arrival simulator.
+
+        Args:
+            seed: Random seed for deterministic arrivals; None draws one
+            start: Start of the simulated window (inclusive)
+            end: End of the simulated window (exclusive); statuses are as
+                seen at this time
+            daily_volume: Long-run average requests per day across all
+                categories, before storms
+            config: Compiled configuration tables; defaults to the shared
+                process-wide tables
+            patterns: Arrival patterns in the format of
+                config.SERVICE_ARRIVAL_PATTERNS (the default)
+            compact: Emit ServiceRequestRecord objects instead of dicts
+        """
+        if end <= start:
+            raise ValueError("end must be after start")
+        if daily_volume < 0:
+            raise ValueError("daily_volume must be non-negative")
+
+        self.start = start
+        self.end = end
+        self.daily_volume = daily_volume
+        self.compact = compact
+        self.config = config or get_compiled_config()
+        patterns = patterns or default_config.SERVICE_ARRIVAL_PATTERNS
+
+        self._stream = CounterStream(seed, "arrivals")
+        self._storm_stream = CounterStream(self._stream.seed, "storms")
+        self.seed = self._stream.seed
+
+        categories = self.config.categories
+        weights = [
+            category.get("weight", 1)
+            for category in default_config.COUNCIL_SERVICES["categories"]
+        ]
+        if len(weights) != len(categories):
+            weights = [1] * len(categories)
+        total_weight = float(sum(weights))
+
+        # Base hourly rate per category, shaped by the normalised tables
+        self._base_rates = [
+            daily_volume * weight / total_weight / 24.0 for weight in weights
+        ]
+        self._weekday = _normalised(patterns["weekday"])
+        self._hourly = _normalised(patterns["hourly"])
+        monthly = patterns.get("monthly", {})
+        self._monthly = [
+            _normalised(monthly.get(category.name, [1.0] * 12)) for category in categories
+        ]
+
+        self._storm_pattern = patterns.get("storms")
+        self._triage_days = float(patterns["triageDays"])
+        self._resolution_days = dict(patterns["resolutionDays"])
+        self.storms = self._schedule_storms()
+
+    def _schedule_storms(self) -> List[Storm]:
+        """Storms overlapping the window, drawn per calendar month."""
+        pattern = self._storm_pattern
+        if not pattern or self.config.category(pattern["category"]) is None:
+            return []
+
+        months = set(pattern["months"])
+        rate = pattern["perYear"] / len(months)
+        low_hours, high_hours = pattern["durationHours"]
+        low_peak, high_peak = pattern["peakMultiplier"]
+
+        # Start a month early so storms running into the window are included
+        year, month = self.start.year, self.start.month - 1
+        if month == 0:
+            year, month = year - 1, 12
+
+        storms = []
+        while (year, month) <= (self.end.year, self.end.month):
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            if month in months:
+                month_start = self.start.replace(
+                    year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0
+                )
+                month_end = month_start.replace(year=next_year, month=next_month)
+                rng = self._storm_stream.at(year * 12 + month)
+                for _ in range(poisson(rng, rate)):
+                    start = month_start + (month_end - month_start) * rng.random()
+                    duration = timedelta(hours=low_hours + (high_hours - low_hours) * rng.random())
+                    storm = Storm(
+                        pattern["category"],
+                        start,
+                        start + duration,
+                        low_peak + (high_peak - low_peak) * rng.random()
+                    )
+                    if storm.end > self.start and storm.start < self.end:
+                        storms.append(storm)
+            year, month = next_year, next_month
+
+        storms.sort(key=lambda storm: storm.start)
+        return storms
+
+    def hourly_rates(self, hour_start: datetime) -> List[float]:
+        """
+        Expected arrivals per category in the hour starting at hour_start.
+
+        Args:
+            hour_start: Start of the hour
+
+        Returns:
+            Rate per category, in config category order
+        """
+        shared = self._weekday[hour_start.weekday()] * self._hourly[hour_start.hour]
+        month = hour_start.month - 1
+        rates = [
+            base * shared * monthly[month]
+            for base, monthly in zip(self._base_rates, self._monthly)
+        ]
+
+        # Storm multipliers are taken at the middle of the hour
+        middle = hour_start + _HOUR / 2
+        for storm in self.storms:
+            if storm.start > middle:
+                break
+            index = self.config.category_index[storm.category]
+            rates[index] *= storm.multiplier(middle)
+        return rates
+
+    def expected_count(self) -> float:
+        """Expected number of requests in the window."""
+        total = 0.0
+        hour_start = self.start.replace(minute=0, second=0, microsecond=0)
+        while hour_start < self.end:
+            overlap = (min(hour_start + _HOUR, self.end) - max(hour_start, self.start)) / _HOUR
+            total += sum(self.hourly_rates(hour_start)) * overlap
+            hour_start += _HOUR
+        return total
+
+    def iter_requests(self) -> Iterator[Any]:
+        """
+        Generate the window's requests in submission order.
+
+        Yields:
+            Service request dicts (ServiceRequestRecord objects in compact
+            mode) with non-decreasing submittedAt
+        """
+        categories = self.config.categories
+        priorities = self.config.priorities
+        priority_count = len(priorities)
+        triage_days = self._triage_days
+        resolution_days = self._resolution_days
+        start, end = self.start, self.end
+
+        hour_start = start.replace(minute=0, second=0, microsecond=0)
+        while hour_start < end:
+            # One keyed hash per hour seeds a fast generator for its draws
+            rng = random.Random(self._stream.at(_hour_number(hour_start)).getrandbits(128))
+            rand = rng.random
+
+            # Draw every category's arrivals for the hour, then order them
+            arrivals = []
+            for category_index, rate in enumerate(self.hourly_rates(hour_start)):
+                for _ in range(poisson(rng, rate)):
+                    arrivals.append((int(rand() * 3600), category_index))
+            arrivals.sort()
+            if len(arrivals) > REFERENCE_STRIDE:
+                raise ValueError(
+                    f"More than {REFERENCE_STRIDE} arrivals in the hour from "
+                    f"{hour_start.isoformat()}; lower daily_volume"
+                )
+
+            # Submission times share the hour's date, hour and UTC offset
+            hour_iso = hour_start.isoformat()
+            prefix, suffix = hour_iso[:14], hour_iso[19:]
+            month = f"{hour_start.year:04d}{hour_start.month:02d}"
+            first = max((start - hour_start).total_seconds(), 0)
+            limit = (end - hour_start).total_seconds()
+            base_index = ((hour_start.day - 1) * 24 + hour_start.hour) * REFERENCE_STRIDE
+
+            for position, (second, category_index) in enumerate(arrivals):
+                if second < first or second >= limit:
+                    continue
+
+                category = categories[category_index]
+                types = category.types
+                request_type = types[int(rand() * len(types))]
+                priority = priorities[int(rand() * priority_count)]
+                submitted_at = f"{prefix}{second // 60:02d}:{second % 60:02d}{suffix}"
+
+                # Lifecycle as seen at the end of the window, from
+                # exponential triage and resolution delays in days
+                triage = -log(1.0 - rand()) * triage_days
+                resolution = triage - log(1.0 - rand()) * resolution_days[priority]
+                age = (limit - second) / _SECONDS_PER_DAY
+                if age < triage:
+                    status, last_updated = "new", submitted_at
+                else:
+                    status, days = (
+                        ("in_progress", triage) if age < resolution else ("resolved", resolution)
+                    )
+                    last_updated = (
+                        hour_start + timedelta(seconds=second + int(days * _SECONDS_PER_DAY))
+                    ).isoformat()
+
+                yield self._make_request(
+                    base_index + position, category, request_type, status, priority, month,
+                    submitted_at, last_updated
+                )
+
+            hour_start += _HOUR
+
+    def _make_request(
+        self,
+        index: int,
+        category: Any,
+        request_type: str,
+        status: str,
+        priority: str,
+        month: str,
+        submitted_at: str,
+        last_updated_at: str
+    ) -> Any:
+        """Build a request in the generators' service request format."""
+
+        if self.compact:
+            return ServiceRequestRecord(
+                index,
+                category.name,
+                category.code,
+                request_type,
+                status,
+                priority,
+                month,
+                submitted_at,
+                last_updated_at
+            )
+
+        return {
+            "reference": f"{self.config.sample_prefix} {category.code}-{month}-{index:05d}",
+            "category": category.name,
+            "requestType": request_type,
+            "status": status,
+            "priority": priority,
+            "submittedAt": submitted_at,
+            "lastUpdated": last_updated_at,
+            "sampleMarker": self.config.sample_marker
+        }
@@ -0,0 +1,344 @@
+"""
+Batch generation engine for UK council sample data.
+
+Draws the indices for each column of a batch with one random.choices()
+call and holds them as compact struct-of-arrays columns. Record dicts are
+only built when a caller asks for them, so a batch of a million records
+costs a few megabytes of integer arrays rather than a million nested dicts.
+
+This is not vectorisation: random.choices() still draws one element at a
+time in the interpreter. The gain comes from replacing several generator
+method calls per record with one call per column, and from deferring dict
+construction. The layer deliberately has no third-party dependencies, so
+columns use the standard library array module rather than NumPy.
+"""
+
+import random
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from .config import SAMPLE_DATA_MARKER, SAMPLE_DATA_PREFIX
+from .compiled import CompiledConfig
+from .clock import ReferenceClock
+
+
+def index_typecode(size: int) -> str:
+    """Smallest array typecode holding every index into a table of size entries."""
+    if size <= 1 << 8:
+        return "B"
+    if size <= 1 << 16:
+        return "H"
+    if size <= 1 << 32:
+        return "I"
+    return "Q"
+
+
+def draw_indices(
+    rng: random.Random,
+    size: int,
+    count: int,
+    typecode: Optional[str] = None
+) -> array:
+    """
+    Draw count uniform indices in [0, size) with one random.choices() call.
+
+    Args:
+        rng: Random source
+        size: Exclusive upper bound of each index
+        count: Number of indices to draw
+        typecode: array typecode wide enough to hold size - 1; defaults to
+            the smallest that fits, so data pack tables of any size work
+
+    Returns:
+        array of indices
+    """
+    return array(typecode or index_typecode(size), rng.choices(range(size), k=count))
+
+
+def draw_scaled_indices(rng: random.Random, sizes: Sequence[int], typecode: str = "B") -> array:
+    """
+    Draw one uniform index per row where each row has its own table size.
+
+    Used for columns whose choice table depends on another column, such as
+    a district within the row's city.
+
+    Args:
+        rng: Random source
+        sizes: Exclusive upper bound for each row
+        typecode: array typecode wide enough to hold the largest index
+
+    Returns:
+        array of indices
+    """
+    rand = rng.random
+    return array(typecode, [int(rand() * size) for size in sizes])
+
+
+def draw_weighted_first_names(config: CompiledConfig, rng: random.Random, genders: array) -> array:
+    """Draw one frequency-weighted first name index per row's gender."""
+    samplers = [config.first_name_sampler[g] for g in config.genders]
+    typecode = index_typecode(max(len(config.first_names[g]) for g in config.genders))
+    return array(typecode, [samplers[gender].sample(rng) for gender in genders])
+
+
+class ResidentBatch(Sequence):
+    """
+    Struct-of-arrays batch of resident records.
+
+    Indexing or iterating builds resident dicts on demand in the same
+    format as CouncilDataGenerator.generate_resident().
+    """
+
+    def __init__(
+        self,
+        config: CompiledConfig,
+        rng: random.Random,
+        count: int,
+        start_index: int,
+        council_name: str,
+        region: str,
+        created_at: str,
+        weighted: bool = False
+    ):
+        """
+        Draw all columns for a batch of residents.
+
+        Args:
+            config: Compiled configuration tables
+            rng: Random source shared by every column
+            count: Number of residents in the batch
+            start_index: Resident id of the first record
+            council_name: Council name stamped on every record
+            region: Region stamped on every record
+            created_at: createdAt timestamp stamped on every record
+            weighted: Draw names and cities from the config alias tables
+        """
+        self.config = config
+        self.start_index = start_index
+        self.council_name = council_name
+        self.region = region
+        self.created_at = created_at
+        self._count = count
+
+        # Names
+        self.gender = draw_indices(rng, len(config.genders), count, "B")
+        if weighted:
+            self.first_name = draw_weighted_first_names(config, rng, self.gender)
+            self.surname = array(
+                index_typecode(len(config.surnames)),
+                config.surname_sampler.sample_many(rng, count)
+            )
+        else:
+            first_name_counts = [len(config.first_names[g]) for g in config.genders]
+            self.first_name = draw_scaled_indices(
+                rng, [first_name_counts[g] for g in self.gender],
+                index_typecode(max(first_name_counts))
+            )
+            self.surname = draw_indices(rng, len(config.surnames), count)
+
+        # Addresses
+        if weighted:
+            self.city = array("B", config.city_sampler.sample_many(rng, count))
+        else:
+            self.city = draw_indices(rng, len(config.cities), count, "B")
+        self.street_number = array("H", [i + 1 for i in draw_indices(rng, 999, count, "H")])
+        self.street_name = draw_indices(rng, len(config.street_names), count)
+        self.street_type = draw_indices(rng, len(config.street_types), count)
+        district_counts = [len(c.districts) for c in config.cities]
+        self.district = draw_scaled_indices(rng, [district_counts[c] for c in self.city])
+        if any(c.postcode_districts for c in config.cities):
+            # Real outward codes from a data pack; cities without them use 1-99
+            outward_counts = [len(c.postcode_districts or range(99)) for c in config.cities]
+            self.postcode_district = draw_scaled_indices(
+                rng, [outward_counts[c] for c in self.city], "I"
+            )
+        else:
+            self.postcode_district = draw_indices(rng, 99, count, "B")
+        self.postcode_sector = draw_indices(rng, 10, count, "B")
+        self.postcode_unit = draw_indices(
+            rng, len(config.postcode_unit_letters) ** 2, count, "H"
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("ResidentBatch index out of range")
+        return self._build(i)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._count):
+            yield self._build(i)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialise every resident as a dict."""
+        return list(self)
+
+    def _build(self, i: int) -> Dict[str, Any]:
+        config = self.config
+        gender = config.genders[self.gender[i]]
+        first_name = config.first_names[gender][self.first_name[i]]
+        last_name = config.surnames[self.surname[i]]
+
+        city = config.cities[self.city[i]]
+        district = city.districts[self.district[i]]
+        letters = config.postcode_unit_letters
+        unit_first, unit_second = divmod(self.postcode_unit[i], len(letters))
+        if city.postcode_districts:
+            outward = city.postcode_districts[self.postcode_district[i]]
+        else:
+            outward = f"{city.postcode_prefix}{self.postcode_district[i] + 1}"
+        postcode = (
+            f"{outward} {self.postcode_sector[i]}{letters[unit_first]}{letters[unit_second]}"
+        )
+        address_line1 = (
+            f"{self.street_number[i]} {config.street_names[self.street_name[i]]} "
+            f"{config.street_types[self.street_type[i]]}"
+        )
+
+        return {
+            "residentId": f"{SAMPLE_DATA_PREFIX} RES-{self.start_index + i:06d}",
+            "name": {
+                "firstName": first_name,
+                "lastName": last_name,
+                "fullName": f"{first_name} {last_name}",
+                "gender": gender,
+                "sampleMarker": SAMPLE_DATA_MARKER
+            },
+            "address": {
+                "addressLine1": address_line1,
+                "addressLine2": district,
+                "city": city.name,
+                "postcode": postcode,
+                "formattedAddress": f"{address_line1}, {district}, {city.name}, {postcode}",
+                "sampleMarker": SAMPLE_DATA_MARKER
+            },
+            "councilName": self.council_name,
+            "region": self.region,
+            "createdAt": self.created_at,
+            "sampleMarker": SAMPLE_DATA_MARKER
+        }
+
+
+class ServiceRequestBatch(Sequence):
+    """
+    Struct-of-arrays batch of service requests.
+
+    Categories follow the same round-robin order as
+    CouncilServiceGenerator.generate_requests(), or are drawn by weight in
+    weighted mode. Dicts are built on demand.
+    """
+
+    def __init__(
+        self,
+        config: CompiledConfig,
+        rng: random.Random,
+        count: int,
+        start_index: int,
+        clock: ReferenceClock,
+        weighted: bool = False
+    ):
+        """
+        Draw all columns for a batch of service requests.
+
+        Args:
+            config: Compiled configuration tables
+            rng: Random source shared by every column
+            count: Number of requests in the batch
+            start_index: Reference index of the first request
+            clock: Reference clock that submitted/updated offsets count back from
+            weighted: Draw categories by configured volume instead of
+                rotating through them
+        """
+        categories = config.categories
+
+        self.config = config
+        self.start_index = start_index
+        self.clock = clock
+        self._count = count
+
+        type_counts = [len(c.types) for c in categories]
+        if weighted:
+            self.category = array("B", config.category_sampler.sample_many(rng, count))
+        else:
+            self.category = array("B", [
+                (start_index + i) % len(categories) for i in range(count)
+            ])
+        self.request_type = draw_scaled_indices(rng, [type_counts[c] for c in self.category])
+        self.status = draw_indices(rng, len(config.statuses), count, "B")
+        self.priority = draw_indices(rng, len(config.priorities), count, "B")
+        self.submitted_days_ago = draw_indices(rng, 31, count, "B")
+        self.updated_days_ago = draw_indices(rng, 8, count, "B")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("ServiceRequestBatch index out of range")
+        return self._build(i)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._count):
+            yield self._build(i)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialise every service request as a dict."""
+        return list(self)
+
+    def _build(self, i: int) -> Dict[str, Any]:
+        config = self.config
+        category = config.categories[self.category[i]]
+        clock = self.clock
+
+        return {
+            "reference": (
+                f"{SAMPLE_DATA_PREFIX} {category.code}-"
+                f"{clock.month}-{self.start_index + i:05d}"
+            ),
+            "category": category.name,
+            "requestType": category.types[self.request_type[i]],
+            "status": config.statuses[self.status[i]],
+            "priority": config.priorities[self.priority[i]],
+            "submittedAt": clock.days_ago(self.submitted_days_ago[i]),
+            "lastUpdated": clock.days_ago(self.updated_days_ago[i]),
+            "sampleMarker": SAMPLE_DATA_MARKER
+        }
+
+
+class RecordBatch:
+    """
+    A batch of residents and service requests held as struct-of-arrays.
+
+    Attributes:
+        residents: ResidentBatch sequence
+        service_requests: ServiceRequestBatch sequence (empty if not requested)
+    """
+
+    def __init__(
+        self,
+        residents: ResidentBatch,
+        service_requests: Sequence[Dict[str, Any]]
+    ):
+        self.residents = residents
+        self.service_requests = service_requests
+
+    def __len__(self) -> int:
+        return len(self.residents) + len(self.service_requests)
+
+    @property
+    def record_counts(self) -> Dict[str, int]:
+        """Record counts in the same shape as generate()['recordCounts']."""
+        return {
+            "residents": len(self.residents),
+            "serviceRequests": len(self.service_requests),
+            "total": len(self)
+        }
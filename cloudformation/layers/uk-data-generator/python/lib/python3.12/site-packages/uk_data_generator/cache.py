@@ -0,0 +1,322 @@
+"""
+On-disk cache of generated datasets.
+
+The same (seed, volume, council, region, version) dataset is otherwise
+regenerated on every stack Create/Update and test run. DatasetCache stores
+each dataset as a gzip-compressed JSON file named by a hash of its
+generation parameters, under a configurable directory such as Lambda /tmp.
+
+- Keys cover every generator setting that affects the output, plus the
+  layer version, so a cached dataset is exactly what generation would
+  return.
+- Files carry a SHA-256 digest of their payload, checked on every read;
+  corrupt or truncated files are discarded and treated as misses.
+- Total size is capped; the least recently used files are evicted first
+  (recency is tracked with file modification times).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV_VAR = "UK_DATA_GENERATOR_CACHE_DIR"
+
+# Default cap on the total size of cached files
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Cache file format version, part of every key
+CACHE_FORMAT_VERSION = 1
+
+_SUFFIX = ".json.gz"
+
+
+def default_cache_dir() -> str:
+    """Cache directory from UK_DATA_GENERATOR_CACHE_DIR, else under the temp dir."""
+    return os.environ.get(CACHE_DIR_ENV_VAR) or os.path.join(
+        tempfile.gettempdir(), "uk-data-generator-cache"
+    )
+
+
+def cache_key(params: Dict[str, Any]) -> str:
+    """
+    Hash generation parameters into a cache key.
+
+    Args:
+        params: JSON-serialisable generation parameters
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(
+        {"cacheFormat": CACHE_FORMAT_VERSION, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _config_params(config: Any) -> Optional[Dict[str, Any]]:
+    """Identify a config's data pack for cache keys; None for config.py alone."""
+    pack = config.data_pack
+    if pack is None:
+        return None
+    stat = os.stat(pack.path)
+    return {
+        "dataPack": os.path.abspath(pack.path),
+        "size": stat.st_size,
+        "mtimeNs": stat.st_mtime_ns
+    }
+
+
+class DatasetCache:
+    """
+    Size-capped LRU cache of generated datasets on disk.
+
+    Example:
+        cache = DatasetCache("/tmp/uk-data", max_bytes=100 * 1024 * 1024)
+        generator = CouncilDataGenerator(
+            seed=42, council_name="Leeds City Council", reference_time=datetime(2025, 11, 1)
+        )
+        data = cache.generate(generator, data_volume=10_000)  # cached after first call
+
+    Attributes:
+        hits / misses: Lookup counters
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compress_level: int = 6
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Cache directory, created if missing; defaults to
+                default_cache_dir()
+            max_bytes: Cap on the total size of cached files
+            compress_level: gzip compression level (1-9)
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a dataset.
+
+        Args:
+            params: Generation parameters the dataset was stored under
+
+        Returns:
+            The cached dataset, or None on a miss or failed integrity check
+        """
+        key = cache_key(params)
+        path = self._path(key)
+
+        try:
+            with gzip.open(path, "rb") as f:
+                header = json.loads(f.readline())
+                payload = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, ValueError, zlib.error):
+            self._discard(path)
+            self.misses += 1
+            return None
+
+        if (
+            not isinstance(header, dict)
+            or header.get("key") != key
+            or header.get("sha256") != hashlib.sha256(payload).hexdigest()
+        ):
+            self._discard(path)
+            self.misses += 1
+            return None
+
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            self._discard(path)
+            self.misses += 1
+            return None
+
+        # Mark as most recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return data
+
+    def put(self, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """
+        Store a dataset, then evict least recently used files over the cap.
+
+        Args:
+            params: Generation parameters to store the dataset under
+            data: JSON-serialisable dataset
+        """
+        key = cache_key(params)
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        header = json.dumps({
+            "key": key,
+            "sha256": hashlib.sha256(payload).hexdigest(),
+            "params": params
+        }, default=str).encode("utf-8")
+
+        # Write to a temporary file and rename so readers never see a
+        # partially written entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=self.compress_level
+            ) as f:
+                f.write(header + b"\n")
+                f.write(payload)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            self._discard(temp_path)
+            raise
+
+        self.evict()
+
+    def generate(
+        self,
+        generator: Any,
+        data_volume: int = 100,
+        include_service_requests: bool = True,
+        parallel: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Return a cached dataset, generating and storing it on a miss.
+
+        Only datasets that start at record 0 are cached. The generator is
+        left where it started on a hit and on a miss, so later calls to
+        generator.generate() return the same records either way.
+
+        Args:
+            generator: CouncilDataGenerator with a fixed seed and reference time
+            data_volume: Number of resident records
+            include_service_requests: Whether to generate service requests
+            parallel: Worker processes used on a miss
+
+        Returns:
+            Dataset as returned by generator.generate()
+
+        Raises:
+            ValueError: If the generator has no seed or reference time, emits
+                compact records or has already generated records sequentially
+        """
+        params = self.dataset_params(generator, data_volume, include_service_requests)
+        data = self.get(params)
+        if data is None:
+            # Sequential generation advances the generator; rewind it so a
+            # miss leaves it in the same state as a hit
+            state = None if generator.counter_based else generator.get_state()
+            data = generator.generate(
+                data_volume=data_volume,
+                include_service_requests=include_service_requests,
+                parallel=parallel,
+                start_index=0
+            )
+            if state is not None:
+                generator.set_state(state)
+            self.put(params, data)
+        return data
+
+    @staticmethod
+    def dataset_params(
+        generator: Any,
+        data_volume: int,
+        include_service_requests: bool
+    ) -> Dict[str, Any]:
+        """Cache parameters identifying a generator's dataset."""
+        # Imported here to avoid a circular import with generators
+        from . import __version__
+
+        if generator.seed is None:
+            raise ValueError("Only datasets with a fixed seed can be cached")
+        if not generator.clock.fixed:
+            # Timestamps (and so the key) would change on every call
+            raise ValueError("Only datasets with a fixed reference_time can be cached")
+        if generator.compact:
+            raise ValueError("Compact record datasets cannot be cached")
+        if not generator.counter_based and generator.next_index:
+            raise ValueError("Only datasets starting at record 0 can be cached")
+
+        params = dict(generator._shard_config())
+        params["config"] = _config_params(generator.config)
+        params.update(
+            data_volume=data_volume,
+            include_service_requests=include_service_requests,
+            digest=generator.digest,
+            version=__version__
+        )
+        return params
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) for every cache file."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        """Total size of cached files."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """
+        Delete least recently used files until the cache fits its cap.
+
+        Returns:
+            Number of files deleted
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._discard(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Delete every cached dataset."""
+        for _, _, path in self._entries():
+            self._discard(path)
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
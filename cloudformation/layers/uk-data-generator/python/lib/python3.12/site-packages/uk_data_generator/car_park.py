@@ -0,0 +1,240 @@
+"""
+Smart car park sensor history for backfilling and load testing.
+
+The smart-car-park scenario publishes one live batch of sensor readings a
+minute. CarParkSensorHistory generates days or weeks of the same readings
+at once, using the simulator's zone layout and peak, off-peak and night
+occupancy targets (config.CAR_PARK_SENSORS), so dashboards and queries can
+be exercised without waiting for the table's TTL window to fill.
+
+Unlike the simulator, which redraws every space independently each minute,
+each space is a two-state Markov chain. Its transition probabilities keep
+the zone's target occupancy as the long-run average while a persistence
+factor keeps cars parked for realistic stays, so occupancy ramps between
+time bands instead of jumping. Battery levels drain steadily, faster for
+busy spaces, and are replaced when low.
+
+Every time step updates all sensors together from per-band transition
+columns, and steps are emitted in time order, so readings can be bulk
+loaded batch by batch in constant memory. The stdlib has no array maths,
+so the columns are plain lists updated with one comprehension per step.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from . import config as default_config
+from .rng import spawn_random
+
+_MINUTES_PER_DAY = 1440.0
+
+# DynamoDB BatchWriteItem limit
+DEFAULT_BATCH_SIZE = 25
+
+
+def _utc(when: datetime) -> datetime:
+    """Aware UTC datetime; naive datetimes are taken to be UTC."""
+    if when.tzinfo is None:
+        return when.replace(tzinfo=timezone.utc)
+    return when.astimezone(timezone.utc)
+
+
+class CarParkSensorHistory:
+    """
+    Time-ordered occupancy and battery readings for every car park sensor.
+
+    Readings have the fields the scenario's processor writes to DynamoDB
+    (sensor_id, timestamp, zone, occupied, confidence, battery_level, ttl)
+    plus sampleMarker. Numbers are floats; convert to Decimal for boto3.
+
+    Example:
+        history = CarParkSensorHistory(
+            seed=42, start=datetime(2025, 11, 1), end=datetime(2025, 11, 8)
+        )
+        with table.batch_writer() as writer:
+            for batch in history.iter_batches():
+                for reading in batch:
+                    writer.put_item(Item=to_item(reading))
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int],
+        start: datetime,
+        end: datetime,
+        interval_minutes: int = 1,
+        ttl_days: Optional[float] = 7,
+        settings: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize sensor history.
+
+        Args:
+            seed: Random seed for deterministic readings; None draws one
+            start: Time of the first reading; naive datetimes are UTC
+            end: End of the history (exclusive)
+            interval_minutes: Minutes between readings of each sensor
+            ttl_days: Days each reading lives after its timestamp, used
+                for the ttl attribute; None omits ttl
+            settings: Sensor settings in the format of
+                config.CAR_PARK_SENSORS (the default)
+        """
+        if end <= start:
+            raise ValueError("end must be after start")
+        if interval_minutes < 1:
+            raise ValueError("interval_minutes must be at least 1")
+
+        self.seed = seed
+        self.start = _utc(start)
+        self.end = _utc(end)
+        self.interval_minutes = interval_minutes
+        self.ttl_days = ttl_days
+        self.settings = settings or default_config.CAR_PARK_SENSORS
+
+        # Sensors in the simulator's order, e.g. ("GF-01", "ground")
+        self.sensors: List[Tuple[str, str]] = [
+            (f"{zone['prefix']}-{number:02d}", zone_name)
+            for zone_name, zone in self.settings["zones"].items()
+            for number in range(1, zone["sensors"] + 1)
+        ]
+        self._bands = self._transition_columns()
+
+    def _transition_columns(self) -> Dict[str, Tuple[List[float], List[float], List[float]]]:
+        """
+        Per-band columns of (target, enter, stay) probabilities per sensor.
+
+        With target occupancy p and persistence r per step, a free space
+        becomes occupied with probability p(1 - r) and an occupied one
+        stays occupied with probability 1 - (1 - p)(1 - r), which keeps p
+        as the chain's long-run average.
+        """
+        persistence = self.settings["persistence"] ** self.interval_minutes
+        columns = {}
+        for band, targets in self.settings["targets"].items():
+            target = [targets[zone] for _, zone in self.sensors]
+            columns[band] = (
+                target,
+                [p * (1.0 - persistence) for p in target],
+                [1.0 - (1.0 - p) * (1.0 - persistence) for p in target]
+            )
+        return columns
+
+    def band(self, hour: int) -> str:
+        """Time band for a UTC hour: peak, night or offPeak."""
+        if hour in self.settings["peakHours"]:
+            return "peak"
+        if hour in self.settings["nightHours"]:
+            return "night"
+        return "offPeak"
+
+    @property
+    def step_count(self) -> int:
+        """Readings per sensor in the history."""
+        step = timedelta(minutes=self.interval_minutes)
+        return -((self.start - self.end) // step)
+
+    @property
+    def reading_count(self) -> int:
+        """Total readings in the history."""
+        return self.step_count * len(self.sensors)
+
+    def iter_steps(self) -> Iterator[Tuple[str, List[bool], List[float], List[float]]]:
+        """
+        Generate every sensor's state at each time step, in time order.
+
+        Yields:
+            (timestamp, occupied, confidence, battery_level) per step, with
+            one list entry per sensor in self.sensors order. The lists are
+            new objects each step.
+        """
+        rng = spawn_random(self.seed, "carParkSensors")
+        rand = rng.random
+        sensor_count = len(self.sensors)
+        bands = self._bands
+        hour_bands = [self.band(hour) for hour in range(24)]
+
+        low_confidence, high_confidence = self.settings["confidence"]
+        confidence_span = high_confidence - low_confidence
+        battery = self.settings["battery"]
+        low_battery, high_battery = battery["initial"]
+        per_step = battery["drainPerDay"] * self.interval_minutes / _MINUTES_PER_DAY
+        per_change = battery["drainPerChange"]
+        replace_below = battery["replaceBelow"]
+
+        # Sensors drain at individual rates, 80-120% of the configured one
+        drain = [per_step * (0.8 + 0.4 * rand()) for _ in range(sensor_count)]
+        level = [low_battery + (high_battery - low_battery) * rand() for _ in range(sensor_count)]
+        target = bands[hour_bands[self.start.hour]][0]
+        occupied = [rand() < p for p in target]
+
+        step = timedelta(minutes=self.interval_minutes)
+        when = self.start
+        for _ in range(self.step_count):
+            timestamp = when.isoformat().replace("+00:00", "Z")
+            _, enter, stay = bands[hour_bands[when.hour]]
+
+            changed = [
+                (rand() < (s if o else e)) != o for o, e, s in zip(occupied, enter, stay)
+            ]
+            occupied = [o != c for o, c in zip(occupied, changed)]
+            level = [
+                b - d - (per_change if c else 0.0) for b, d, c in zip(level, drain, changed)
+            ]
+            level = [high_battery if b < replace_below else b for b in level]
+            confidence = [
+                round(low_confidence + confidence_span * rand(), 2) for _ in range(sensor_count)
+            ]
+
+            yield timestamp, occupied, confidence, [round(b, 1) for b in level]
+            when += step
+
+    def iter_readings(self) -> Iterator[Dict[str, Any]]:
+        """
+        Generate individual readings in time order.
+
+        Yields:
+            Reading dicts, every sensor for one timestamp before the next
+        """
+        sensors = self.sensors
+        marker = default_config.SAMPLE_DATA_MARKER
+        ttl_seconds = None if self.ttl_days is None else int(self.ttl_days * 86400)
+        epoch = int(self.start.timestamp())
+        step_seconds = self.interval_minutes * 60
+
+        for timestamp, occupied, confidence, battery in self.iter_steps():
+            for (sensor_id, zone), o, c, b in zip(sensors, occupied, confidence, battery):
+                reading = {
+                    "sensor_id": sensor_id,
+                    "timestamp": timestamp,
+                    "zone": zone,
+                    "occupied": o,
+                    "confidence": c,
+                    "battery_level": b,
+                    "sampleMarker": marker
+                }
+                if ttl_seconds is not None:
+                    reading["ttl"] = epoch + ttl_seconds
+                yield reading
+            epoch += step_seconds
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Generate readings in time-ordered batches for bulk loading.
+
+        Args:
+            batch_size: Readings per batch; the default matches DynamoDB's
+                BatchWriteItem limit
+
+        Yields:
+            Lists of reading dicts; only the last may be short
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        batch = []
+        for reading in self.iter_readings():
+            batch.append(reading)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -0,0 +1,75 @@
+"""
+Reference clock for generated timestamps.
+
+Generators stamp records relative to a single reference time instead of
+calling datetime.now() per record. Timestamps are looked up in a small
+precomputed table of ISO strings indexed by day offset, so the hot path
+does no datetime arithmetic or formatting, and a dataset generated with a
+fixed reference time and seed is fully reproducible.
+
+Tables are shared between clocks with the same reference time, so
+generators created for one batch (e.g. many councils at one reference
+time) do not rebuild them.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Day offsets precomputed up front; larger offsets are added on demand
+DEFAULT_MAX_DAYS = 30
+
+
+@lru_cache(maxsize=64)
+def _day_table(reference_time: datetime, days: int) -> Tuple[str, ...]:
+    """ISO timestamps for day offsets 0..days before reference_time."""
+    return tuple(
+        (reference_time - timedelta(days=offset)).isoformat() for offset in range(days + 1)
+    )
+
+
+class ReferenceClock:
+    """
+    Fixed reference time with precomputed ISO timestamp tables.
+
+    Attributes:
+        reference_time: The datetime every timestamp is relative to
+        iso: reference_time.isoformat()
+        month: reference_time as YYYYMM, used in service references
+        fixed: True if reference_time was given rather than taken from the
+            current time
+    """
+
+    def __init__(
+        self,
+        reference_time: Optional[datetime] = None,
+        max_days: int = DEFAULT_MAX_DAYS
+    ):
+        """
+        Initialize clock.
+
+        Args:
+            reference_time: Fixed reference time; defaults to the current
+                time, captured once
+            max_days: Day offsets to precompute
+        """
+        self.fixed = reference_time is not None
+        self.reference_time = reference_time or datetime.now()
+        self.iso = self.reference_time.isoformat()
+        self.month = self.reference_time.strftime("%Y%m")
+        self._days_ago: Tuple[str, ...] = _day_table(self.reference_time, max_days)
+
+    def _extend(self, days: int) -> None:
+        # Replaces rather than appends to the shared table
+        self._days_ago = self._days_ago + tuple(
+            (self.reference_time - timedelta(days=offset)).isoformat()
+            for offset in range(len(self._days_ago), days + 1)
+        )
+
+    def days_ago(self, days: int) -> str:
+        """ISO timestamp for the reference time minus a number of days."""
+        if days < 0:
+            raise ValueError("days must be non-negative")
+        if days >= len(self._days_ago):
+            self._extend(days)
+        return self._days_ago[days]
@@ -0,0 +1,227 @@
+"""
+Compiled configuration tables for UK council sample data.
+
+config.py holds the human-edited source data. CompiledConfig turns it into
+tuple-backed choice tables, name -> index maps and precomputed category
+codes with interned strings. It is built once per process and shared by
+every generator, so per-record lookups are constant time and each
+generator instance pays no setup cost.
+
+Vocabularies can be replaced by tables from a memory-mapped data pack
+(see datapack.py); those are decoded lazily rather than copied into tuples.
+"""
+
+import os
+import sys
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Sequence, Tuple
+from . import config
+from .sampling import AliasTable
+
+if TYPE_CHECKING:
+    from .datapack import DataPack
+
+# Environment variable naming a data pack used by get_compiled_config()
+DATA_PACK_ENV_VAR = "UK_DATA_GENERATOR_PACK"
+
+# Data pack table names that replace config.py vocabularies
+PACK_FIRST_NAMES = "first_names.{gender}"
+PACK_SURNAMES = "surnames"
+PACK_STREET_NAMES = "street_names"
+PACK_STREET_TYPES = "street_types"
+PACK_POSTCODE_DISTRICTS = "postcode_districts.{city}"
+
+
+class CompiledCity(NamedTuple):
+    """City entry with postcode prefix, districts and optional outward codes."""
+    name: str
+    postcode_prefix: str
+    districts: Tuple[str, ...]
+    postcode_districts: Optional[Sequence[str]] = None
+
+
+class CompiledCategory(NamedTuple):
+    """Service category entry with its precomputed reference code."""
+    name: str
+    code: str
+    types: Tuple[str, ...]
+
+
+def _intern_all(values) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+def category_code(name: str) -> str:
+    """Reference code for a category, e.g. 'Waste & Recycling' -> 'W&R'."""
+    return ''.join(word[0] for word in name.split()).upper()
+
+
+class CompiledConfig:
+    """
+    Immutable, indexed view of the generator configuration.
+
+    Attributes:
+        genders: Supported genders
+        first_names: Gender -> sequence of first names
+        surnames: Sequence of surnames
+        street_names / street_types: Sequences of street components
+        cities: Tuple of CompiledCity
+        city_index: City name -> index into cities
+        categories: Tuple of CompiledCategory
+        category_index: Category name -> index into categories
+        statuses / priorities: Service request choice tables
+        household_sizes: Residents per household for household mode
+        postcode_unit_letters: Letters valid in a postcode unit
+        sample_marker / sample_prefix: Synthetic data markers
+        first_name_sampler / surname_sampler / city_sampler /
+        category_sampler: AliasTables over the optional config weights
+            (uniform where no weights are configured, or where a data pack
+            replaces the vocabulary); built on first use
+        household_size_sampler: AliasTable over household_sizes
+    """
+
+    def __init__(self, data_pack: Optional["DataPack"] = None):
+        """
+        Compile tables from config.py.
+
+        Args:
+            data_pack: Optional data pack whose tables replace the matching
+                config.py vocabularies (first_names.male, first_names.female,
+                surnames, street_names, street_types) or add real postcode
+                outward codes per city (postcode_districts.<city name>)
+        """
+        self.data_pack = data_pack
+        self._packed = set()
+
+        self.genders = _intern_all(("male", "female"))
+        self.first_names: Dict[str, Sequence[str]] = {
+            gender: self._vocabulary(
+                PACK_FIRST_NAMES.format(gender=gender), config.UK_FIRST_NAMES[gender]
+            )
+            for gender in self.genders
+        }
+        self.surnames = self._vocabulary(PACK_SURNAMES, config.UK_SURNAMES)
+        self.street_names = self._vocabulary(PACK_STREET_NAMES, config.STREET_NAMES)
+        self.street_types = self._vocabulary(PACK_STREET_TYPES, config.STREET_TYPES)
+
+        self.cities = tuple(
+            CompiledCity(
+                sys.intern(city["name"]),
+                sys.intern(city["postcodePrefix"]),
+                _intern_all(city["districts"]),
+                self._pack_table(PACK_POSTCODE_DISTRICTS.format(city=city["name"]))
+            )
+            for city in config.UK_CITIES
+        )
+        self.city_index = {city.name: i for i, city in enumerate(self.cities)}
+
+        self.categories = tuple(
+            CompiledCategory(
+                sys.intern(category["name"]),
+                sys.intern(category_code(category["name"])),
+                _intern_all(category["types"])
+            )
+            for category in config.COUNCIL_SERVICES["categories"]
+        )
+        self.category_index = {
+            category.name: i for i, category in enumerate(self.categories)
+        }
+
+        self.statuses = _intern_all(("new", "in_progress", "resolved"))
+        self.priorities = _intern_all(("low", "medium", "high"))
+        self.household_sizes = tuple(entry["size"] for entry in config.UK_HOUSEHOLD_SIZES)
+        self.postcode_unit_letters = sys.intern("ABCDEFGHJKLMNOPQRSTUVWXYZ")
+        self.sample_marker = sys.intern(config.SAMPLE_DATA_MARKER)
+        self.sample_prefix = sys.intern(config.SAMPLE_DATA_PREFIX)
+
+    def _pack_table(self, name: str) -> Optional[Sequence[str]]:
+        """Return a data pack table, or None if there is no such table."""
+        if self.data_pack is None or name not in self.data_pack:
+            return None
+        return self.data_pack[name]
+
+    def _vocabulary(self, pack_name: str, values: Sequence[str]) -> Sequence[str]:
+        """Use a lazily decoded pack table if present, else interned config values."""
+        table = self._pack_table(pack_name)
+        if table is not None:
+            self._packed.add(pack_name)
+            return table
+        return _intern_all(values)
+
+    def _weights(self, pack_name: str, weights: Optional[Sequence[float]], size: int):
+        """Configured weights, or uniform if absent or the vocabulary is packed."""
+        if pack_name in self._packed or not weights:
+            return [1] * size
+        return weights
+
+    @cached_property
+    def first_name_sampler(self) -> Dict[str, AliasTable]:
+        return {
+            gender: AliasTable(self._weights(
+                PACK_FIRST_NAMES.format(gender=gender),
+                config.UK_FIRST_NAME_WEIGHTS.get(gender),
+                len(self.first_names[gender])
+            ))
+            for gender in self.genders
+        }
+
+    @cached_property
+    def surname_sampler(self) -> AliasTable:
+        return AliasTable(self._weights(
+            PACK_SURNAMES, config.UK_SURNAME_WEIGHTS, len(self.surnames)
+        ))
+
+    @cached_property
+    def city_sampler(self) -> AliasTable:
+        return AliasTable([city.get("weight", 1) for city in config.UK_CITIES])
+
+    @cached_property
+    def category_sampler(self) -> AliasTable:
+        return AliasTable(
+            [category.get("weight", 1) for category in config.COUNCIL_SERVICES["categories"]]
+        )
+
+    @cached_property
+    def household_size_sampler(self) -> AliasTable:
+        return AliasTable([entry["weight"] for entry in config.UK_HOUSEHOLD_SIZES])
+
+    def __reduce__(self):
+        # Pickled as the data pack path, so worker processes map the same
+        # pack (once per process) instead of receiving copies of the tables
+        pack = self.data_pack
+        return _load_compiled_config, (os.path.abspath(pack.path) if pack else None,)
+
+    def city(self, name: str):
+        """Look up a city by name, or None if unknown."""
+        index = self.city_index.get(name)
+        return None if index is None else self.cities[index]
+
+    def category(self, name: str):
+        """Look up a service category by name, or None if unknown."""
+        index = self.category_index.get(name)
+        return None if index is None else self.categories[index]
+
+
+@lru_cache(maxsize=None)
+def _load_compiled_config(pack_path: Optional[str]) -> CompiledConfig:
+    if not pack_path:
+        return CompiledConfig()
+
+    # Imported on use: packs are optional and mmap is not needed without one
+    from .datapack import DataPack
+
+    return CompiledConfig(DataPack(pack_path))
+
+
+def get_compiled_config(pack_path: Optional[str] = None) -> CompiledConfig:
+    """
+    Return the process-wide CompiledConfig, building it on first use.
+
+    Args:
+        pack_path: Optional data pack to load vocabularies from; defaults to
+            the UK_DATA_GENERATOR_PACK environment variable
+
+    Returns:
+        Shared CompiledConfig for the pack (or for config.py alone)
+    """
+    return _load_compiled_config(pack_path or os.environ.get(DATA_PACK_ENV_VAR) or None)
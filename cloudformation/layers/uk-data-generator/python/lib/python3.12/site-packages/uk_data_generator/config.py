@@ -24,6 +24,25 @@ UK_FIRST_NAMES = {
     ]
 }
 
+# Optional relative frequencies for weighted sampling, aligned with
+# UK_FIRST_NAMES. Approximate birth-registration counts, not exact figures.
+UK_FIRST_NAME_WEIGHTS = {
+    "male": [
+        3000, 2700, 4200, 4000, 3500,
+        3200, 3000, 3900, 3400, 2900,
+        3300, 3700, 2600, 3100, 3800,
+        3100, 2400, 2900, 2300, 2700,
+        2200, 3600, 2800, 2200, 2000
+    ],
+    "female": [
+        4000, 3800, 3400, 3300, 2600,
+        2700, 2500, 2900, 2800, 3100,
+        2300, 2600, 2500, 2400, 2500,
+        2600, 2200, 2100, 2200, 2000,
+        2100, 2400, 1900, 1800, 1900
+    ]
+}
+
 # UK Surnames - Common UK surnames from general statistics
 UK_SURNAMES = [
     "Smith", "Jones", "Williams", "Taylor", "Brown",
@@ -34,6 +53,17 @@ UK_SURNAMES = [
     "Martin", "Clarke", "James", "Morgan", "Hughes"
 ]
 
+# Optional relative frequencies aligned with UK_SURNAMES (approximate
+# bearers in thousands)
+UK_SURNAME_WEIGHTS = [
+    546, 421, 303, 240, 223,
+    212, 171, 153, 151, 128,
+    125, 122, 118, 109, 108,
+    106, 104, 101, 100, 99,
+    97, 95, 93, 91, 90,
+    89, 88, 87, 86, 85
+]
+
 # UK Address Components - Generic UK address patterns
 STREET_TYPES = [
     "Street", "Road", "Lane", "Avenue", "Close",
@@ -47,10 +77,12 @@ STREET_NAMES = [
 ]
 
 # UK Cities with Postcode Patterns
+# Optional "weight" is approximate population in thousands
 UK_CITIES = [
     {
         "name": "Birmingham",
         "postcodePrefix": "B",
+        "weight": 1145,
         "districts": [
             "Edgbaston", "Moseley", "Selly Oak",
             "Erdington", "Sutton Coldfield"
@@ -59,6 +91,7 @@ UK_CITIES = [
     {
         "name": "Manchester",
         "postcodePrefix": "M",
+        "weight": 553,
         "districts": [
             "Didsbury", "Chorlton", "Salford",
             "Stockport", "Trafford"
@@ -67,6 +100,7 @@ UK_CITIES = [
     {
         "name": "Leeds",
         "postcodePrefix": "LS",
+        "weight": 812,
         "districts": [
             "Headingley", "Roundhay", "Chapel Allerton",
             "Horsforth", "Morley"
@@ -75,10 +109,12 @@ UK_CITIES = [
 ]
 
 # Council Service Categories and Request Types
+# Optional "weight" is the relative share of request volume
 COUNCIL_SERVICES = {
     "categories": [
         {
             "name": "Waste & Recycling",
+            "weight": 40,
             "types": [
                 "Missed bin collection",
                 "Bin replacement request",
@@ -88,6 +124,7 @@ COUNCIL_SERVICES = {
         },
         {
             "name": "Highways",
+            "weight": 30,
             "types": [
                 "Pothole report",
                 "Street light fault",
@@ -97,6 +134,7 @@ COUNCIL_SERVICES = {
         },
         {
             "name": "Housing",
+            "weight": 15,
             "types": [
                 "Housing application",
                 "Repair request",
@@ -106,6 +144,7 @@ COUNCIL_SERVICES = {
         },
         {
             "name": "Council Tax",
+            "weight": 15,
             "types": [
                 "Payment query",
                 "Discount application",
@@ -116,6 +155,83 @@ COUNCIL_SERVICES = {
     ]
 }
 
+# Service request arrival patterns for the arrival simulator (arrivals.py).
+# Each table is a relative factor on a category's hourly arrival rate and is
+# normalised to average 1, so a simulation's long-run volume is its daily
+# volume however the shape is changed. Storms add short bursts on top.
+SERVICE_ARRIVAL_PATTERNS = {
+    # Monday .. Sunday
+    "weekday": [1.3, 1.2, 1.15, 1.1, 1.0, 0.65, 0.6],
+    # Hour of day 00 .. 23
+    "hourly": [
+        0.1, 0.05, 0.05, 0.05, 0.05, 0.1, 0.3, 0.8, 1.6, 2.0, 2.0, 1.8,
+        1.5, 1.6, 1.7, 1.6, 1.4, 1.2, 1.0, 0.9, 0.8, 0.6, 0.4, 0.2
+    ],
+    # January .. December per category; categories not listed are flat
+    "monthly": {
+        # Missed and extra collections after Christmas
+        "Waste & Recycling": [1.3, 0.9, 0.9, 1.0, 1.0, 1.0, 1.05, 1.05, 1.0, 0.95, 0.9, 1.0],
+        # Potholes after winter freeze-thaw
+        "Highways": [1.3, 1.3, 1.1, 0.9, 0.8, 0.75, 0.75, 0.8, 0.9, 1.05, 1.15, 1.2],
+        # January reminders and final notices, March annual bills
+        "Council Tax": [2.6, 1.1, 1.6, 1.4, 0.8, 0.7, 0.6, 0.6, 0.7, 0.7, 0.8, 0.9]
+    },
+    # Storm bursts: per-year count in the listed months, each multiplying the
+    # category's rate by a peak factor that decays linearly over the storm
+    "storms": {
+        "category": "Highways",
+        "perYear": 6,
+        "months": [10, 11, 12, 1, 2, 3],
+        "durationHours": [24, 72],
+        "peakMultiplier": [3.0, 6.0]
+    },
+    # Mean days from submission to triage (in_progress), and from triage to
+    # resolution by priority
+    "triageDays": 1.0,
+    "resolutionDays": {"high": 2.0, "medium": 5.0, "low": 10.0}
+}
+
+# Smart car park sensors, matching the smart-car-park scenario simulator:
+# sensors per zone, target occupancy per time band (UTC hours) and battery
+# behaviour for history generation
+CAR_PARK_SENSORS = {
+    "zones": {
+        "ground": {"prefix": "GF", "sensors": 20},
+        "level1": {"prefix": "L1", "sensors": 15},
+        "level2": {"prefix": "L2", "sensors": 15}
+    },
+    "targets": {
+        "peak": {"ground": 0.90, "level1": 0.87, "level2": 0.73},
+        "offPeak": {"ground": 0.65, "level1": 0.60, "level2": 0.53},
+        "night": {"ground": 0.15, "level1": 0.20, "level2": 0.27}
+    },
+    "peakHours": [8, 9, 12, 13, 17, 18],
+    "nightHours": [22, 23, 0, 1, 2, 3, 4, 5, 6, 7],
+    # Chance per minute that a space keeps its state beyond what the target
+    # requires; higher values mean longer stays and smoother occupancy
+    "persistence": 0.97,
+    "confidence": [0.92, 0.99],
+    # Battery percentage: initial range, drain per day and per state change,
+    # and the level at which a sensor's battery is replaced
+    "battery": {
+        "initial": [20.0, 100.0],
+        "drainPerDay": 0.5,
+        "drainPerChange": 0.01,
+        "replaceBelow": 10.0
+    }
+}
+
+# Residents per household for household mode, with approximate share of
+# UK households (%) from ONS household size patterns
+UK_HOUSEHOLD_SIZES = [
+    {"size": 1, "weight": 30},
+    {"size": 2, "weight": 35},
+    {"size": 3, "weight": 15},
+    {"size": 4, "weight": 13},
+    {"size": 5, "weight": 5},
+    {"size": 6, "weight": 2}
+]
+
 # Sample data marker to clearly identify synthetic data
 SAMPLE_DATA_MARKER = "SAMPLE"
 SAMPLE_DATA_PREFIX = "[SAMPLE]"
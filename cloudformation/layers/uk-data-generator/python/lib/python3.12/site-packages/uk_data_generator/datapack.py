@@ -0,0 +1,197 @@
+"""
+Memory-mapped binary data packs for large vocabularies.
+
+A data pack stores named string tables (surnames, street names, postcode
+districts, ...) in a compact binary file that is memory-mapped and decoded
+lazily, one string at a time. Opening a pack reads only its small table
+directory, so start-up cost stays flat however large the vocabularies are.
+
+File layout (all integers little-endian):
+
+    header     magic b"UKDP", version u16, table count u16
+    directory  per table: name length u16, name (UTF-8), string count u32,
+               index offset u64, data offset u64
+    tables     per table: (count + 1) u32 offsets into its data block,
+               followed by the concatenated UTF-8 strings
+"""
+
+import mmap
+import struct
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple, Union
+
+MAGIC = b"UKDP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_NAME_LENGTH = struct.Struct("<H")
+_DIRECTORY_ENTRY = struct.Struct("<IQQ")
+_OFFSET = struct.Struct("<I")
+_OFFSET_PAIR = struct.Struct("<II")
+
+
+class DataPackError(ValueError):
+    """Raised when a file is not a valid data pack."""
+    pass
+
+
+class PackTable(Sequence):
+    """
+    Lazily decoded string table backed by a memory-mapped data pack.
+
+    Supports len(), indexing and iteration like a tuple of strings; each
+    string is decoded from the mapping only when it is accessed.
+    """
+
+    __slots__ = ("name", "_buffer", "_count", "_index_offset", "_data_offset")
+
+    def __init__(self, name: str, buffer: mmap.mmap, count: int, index_offset: int, data_offset: int):
+        self.name = name
+        self._buffer = buffer
+        self._count = count
+        self._index_offset = index_offset
+        self._data_offset = data_offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(f"{self.name} index out of range")
+
+        start, end = _OFFSET_PAIR.unpack_from(self._buffer, self._index_offset + 4 * i)
+        base = self._data_offset
+        return self._buffer[base + start:base + end].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"PackTable({self.name!r}, {self._count} strings)"
+
+
+class DataPack(Mapping):
+    """
+    Read-only, memory-mapped collection of named string tables.
+
+    Example:
+        with DataPack("/opt/uk-vocab.ukdp") as pack:
+            surnames = pack["surnames"]  # PackTable, decoded lazily
+    """
+
+    def __init__(self, path: str):
+        """
+        Open and map a data pack.
+
+        Args:
+            path: Path to the pack file
+
+        Raises:
+            DataPackError: If the file is not a valid data pack
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise DataPackError(f"Cannot map data pack {path}: {e}")
+
+        try:
+            self._tables = self._read_directory()
+        except (struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise DataPackError(f"Malformed data pack {path}: {e}")
+
+    def _read_directory(self) -> Dict[str, PackTable]:
+        magic, version, table_count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise DataPackError(f"{self.path} is not a data pack")
+        if version != VERSION:
+            raise DataPackError(f"Unsupported data pack version {version}")
+
+        tables = {}
+        position = _HEADER.size
+        for _ in range(table_count):
+            (name_length,) = _NAME_LENGTH.unpack_from(self._buffer, position)
+            position += _NAME_LENGTH.size
+            name = self._buffer[position:position + name_length].decode("utf-8")
+            position += name_length
+            count, index_offset, data_offset = _DIRECTORY_ENTRY.unpack_from(self._buffer, position)
+            position += _DIRECTORY_ENTRY.size
+
+            if data_offset > len(self._buffer) or index_offset + 4 * (count + 1) > len(self._buffer):
+                raise DataPackError(f"Table {name!r} extends beyond the end of {self.path}")
+
+            tables[name] = PackTable(name, self._buffer, count, index_offset, data_offset)
+
+        return tables
+
+    def __getitem__(self, name: str) -> PackTable:
+        return self._tables[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def close(self) -> None:
+        """Unmap and close the pack file."""
+        if not self._buffer.closed:
+            self._buffer.close()
+        self._file.close()
+
+    def __enter__(self) -> "DataPack":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def write_datapack(path: str, tables: Mapping[str, Sequence[str]]) -> None:
+    """
+    Write string tables to a data pack file.
+
+    Args:
+        path: Output file path
+        tables: Table name -> sequence of strings
+    """
+    encoded: List[Tuple[bytes, List[bytes]]] = [
+        (name.encode("utf-8"), [value.encode("utf-8") for value in values])
+        for name, values in tables.items()
+    ]
+
+    directory_size = sum(
+        _NAME_LENGTH.size + len(name) + _DIRECTORY_ENTRY.size for name, _ in encoded
+    )
+    position = _HEADER.size + directory_size
+
+    directory = bytearray()
+    blocks: List[Union[bytes, bytearray]] = []
+    for name, values in encoded:
+        offsets = bytearray()
+        cursor = 0
+        for value in values:
+            offsets += _OFFSET.pack(cursor)
+            cursor += len(value)
+        offsets += _OFFSET.pack(cursor)
+
+        index_offset = position
+        data_offset = index_offset + len(offsets)
+        position = data_offset + cursor
+
+        directory += _NAME_LENGTH.pack(len(name)) + name
+        directory += _DIRECTORY_ENTRY.pack(len(values), index_offset, data_offset)
+        blocks.append(offsets)
+        blocks.append(b"".join(values))
+
+    with open(path, "wb") as output:
+        output.write(_HEADER.pack(MAGIC, VERSION, len(encoded)))
+        output.write(directory)
+        for block in blocks:
+            output.write(block)
@@ -0,0 +1,311 @@
+"""
+Synthetic Freedom of Information request letters with PII ground truth.
+
+FOILetterGenerator fills letter templates with names, addresses and service
+request references from the other generators, plus email addresses, phone
+numbers, postcodes and dates, and records the exact character span of every
+PII entity. The spans use Amazon Comprehend's DetectPiiEntities format
+(Type, BeginOffset, EndOffset) so corpora can score the FOI redaction
+scenario's recall and throughput offline.
+
+The council's own FOI mailbox (foi@<council>.example) and name are the
+recipient's published contact details, not personal data, so they are
+deliberately left unlabelled, as a redaction pass should keep them.
+
+Contact details are never real: email addresses use the reserved
+example.com/.org/.net domains and .example TLD (RFC 2606), and phone
+numbers use Ofcom's ranges set aside for drama and fiction.
+
+Templates are parsed once at import into literal and slot parts, so
+building a letter is one pass of string appends with a running offset.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .compiled import CompiledConfig, get_compiled_config
+from .generators import CouncilServiceGenerator, UKAddressGenerator, UKNameGenerator
+from .rng import spawn_random
+
+# Comprehend PII entity types emitted
+NAME = "NAME"
+ADDRESS = "ADDRESS"
+EMAIL = "EMAIL"
+PHONE = "PHONE"
+DATE_TIME = "DATE_TIME"
+
+# Entity type of each template slot; other slots (council, council_domain,
+# topic, context, reference) are not PII
+SLOT_TYPES = {
+    "name": NAME,
+    "third_party": NAME,
+    "address": ADDRESS,
+    "address_line": ADDRESS,
+    "postcode": ADDRESS,
+    "email": EMAIL,
+    "phone": PHONE,
+    "date": DATE_TIME,
+}
+
+_EMAIL_DOMAINS = ("example.com", "example.org", "example.net")
+
+# Ofcom drama ranges: 07700 900000-900999 and 0xxx 496 0000-0999
+_LANDLINE_CODES = {"Birmingham": "0121", "Manchester": "0161", "Leeds": "0113"}
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December"
+)
+
+TEMPLATES = (
+    "{name}\n{address}\n{email}\n{phone}\n\n{date}\n\n"
+    "Freedom of Information Officer\n{council}\n\n"
+    "Dear Sir or Madam,\n\n"
+    "Freedom of Information request\n\n"
+    "Under the Freedom of Information Act 2000, please provide {topic}.\n\n"
+    "I live near {postcode} and {context} My previous report reference was "
+    "{reference}.\n\n"
+    "Please send your response by email to {email} or call me on {phone}.\n\n"
+    "Yours faithfully,\n\n{name}\n",
+
+    "{date}\n\n"
+    "Dear FOI Team,\n\n"
+    "I am writing to {council} to request {topic}. I would also like to know "
+    "what happened to the report I made about the area around {postcode} "
+    "(reference {reference}).\n\n"
+    "{context} My neighbour, {third_party}, raised the same issue last month.\n\n"
+    "My contact details are:\n{name}\n{address}\nTel: {phone}\nEmail: {email}\n\n"
+    "Kind regards,\n{name}\n",
+
+    "From: {name} <{email}>\nSent: {date}\nTo: foi@{council_domain}\n"
+    "Subject: FOI request - {reference}\n\n"
+    "Hello,\n\n"
+    "Please treat this as a request under the Freedom of Information Act 2000 "
+    "for {topic}.\n\n"
+    "{context} This affects my home at {address_line}, {postcode}.\n\n"
+    "If anything is unclear please phone {phone}.\n\n"
+    "Thanks,\n{name}\n",
+
+    "{name}\n{address}\n\n{date}\n\n"
+    "To the Information Governance Team, {council}\n\n"
+    "Request for information\n\n"
+    "I would be grateful if you could provide {topic}, and any internal "
+    "correspondence about case {reference}.\n\n"
+    "{context} I am acting on behalf of {third_party}, who has given consent "
+    "for me to do so.\n\n"
+    "You can reach me on {phone} or at {email}.\n\n"
+    "Yours sincerely,\n{name}\n",
+)
+
+# Request topics per service category
+TOPICS = {
+    "Waste & Recycling": (
+        "the number of missed bin collections recorded on my street over the last twelve months",
+        "the contract value and performance reports for the waste collection service",
+        "the number of fly tipping reports received and prosecutions brought in my ward",
+        "the recycling rate for my area and the criteria used to calculate it",
+    ),
+    "Highways": (
+        "the number of pothole reports received for my road and the average repair time",
+        "the inspection schedule and most recent inspection results for local street lights",
+        "the budget allocated to pavement repairs in my ward this financial year",
+        "all correspondence relating to the resurfacing programme for my road",
+    ),
+    "Housing": (
+        "the current length of the housing register and average waiting times by band",
+        "the number of repair requests outstanding for council properties in my area",
+        "the policy and response times for anti-social behaviour reports",
+        "the number of households placed in temporary accommodation this year",
+    ),
+    "Council Tax": (
+        "the number of Council Tax band reviews requested and their outcomes",
+        "the total value of Council Tax discounts awarded in my ward",
+        "the guidance staff use when handling Council Tax payment queries",
+        "the number of Council Tax reminder and summons notices issued",
+    ),
+}
+
+CONTEXTS = (
+    "The problem has been ongoing for several months.",
+    "I have reported this more than once without a clear answer.",
+    "Several residents on my street have the same concern.",
+    "I understand the council publishes some of this information already.",
+    "This information would help a local residents' association meeting.",
+)
+
+# Appended to every letter so documents are identifiable as synthetic
+FOOTER = "\n{prefix} Synthetic FOI request generated for testing; not a real request.\n"
+
+_SLOT = re.compile(r"\{(\w+)\}")
+
+
+def _parse(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a template into (literal, slot) parts; the last slot is None."""
+    parts = []
+    position = 0
+    for match in _SLOT.finditer(template):
+        parts.append((template[position:match.start()], match.group(1)))
+        position = match.end()
+    parts.append((template[position:], None))
+    return tuple(parts)
+
+
+_PARSED_TEMPLATES = tuple(_parse(template) for template in TEMPLATES)
+
+
+def _render(
+    parts: Tuple[Tuple[str, Optional[str]], ...],
+    values: Dict[str, str]
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Fill parsed template parts; returns the text pieces and PII entities."""
+    pieces: List[str] = []
+    entities: List[Dict[str, Any]] = []
+    offset = 0
+    for literal, slot in parts:
+        pieces.append(literal)
+        offset += len(literal)
+        if slot is None:
+            continue
+        value = values[slot]
+        pieces.append(value)
+        entity_type = SLOT_TYPES.get(slot)
+        if entity_type is not None:
+            entities.append({
+                "Type": entity_type,
+                "BeginOffset": offset,
+                "EndOffset": offset + len(value)
+            })
+        offset += len(value)
+    return pieces, entities
+
+
+class FOILetterGenerator:
+    """
+    Generate FOI request letters with ground-truth PII offsets.
+
+    Example:
+        generator = FOILetterGenerator(seed=42, council_name="Leeds City Council")
+        letter = generator.generate_letter(0)
+        for entity in letter["entities"]:
+            letter["text"][entity["BeginOffset"]:entity["EndOffset"]]
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        council_name: str = "Sample Council",
+        config: Optional[CompiledConfig] = None
+    ):
+        """
+        Initialize FOI letter generator.
+
+        Args:
+            seed: Random seed for deterministic generation
+            council_name: Council the letters are addressed to
+            config: Compiled configuration tables; defaults to the shared
+                process-wide tables
+        """
+        self.seed = seed
+        self.council_name = council_name
+        self.config = config or get_compiled_config()
+        self.random = spawn_random(seed, "foiLetters")
+
+        self.name_generator = UKNameGenerator(seed, allow_reuse=True, config=self.config)
+        self.address_generator = UKAddressGenerator(seed, config=self.config)
+        self.service_generator = CouncilServiceGenerator(seed, config=self.config)
+
+        domain = re.sub(r"[^a-z]+", "", council_name.lower().replace(" council", ""))
+        self._council_domain = f"{domain or 'council'}.example"
+        self._footer = FOOTER.format(prefix=self.config.sample_prefix)
+        self._topics = [
+            (category, TOPICS.get(category.name, TOPICS["Waste & Recycling"]))
+            for category in self.config.categories
+        ]
+
+    def _email(self, name: Dict[str, str]) -> str:
+        rng = self.random
+        first = name["firstName"].lower()
+        last = name["lastName"].lower()
+        style = rng.randrange(4)
+        if style == 0:
+            local = f"{first}.{last}"
+        elif style == 1:
+            local = f"{first[0]}{last}"
+        elif style == 2:
+            local = f"{first}{last}{rng.randrange(1, 100)}"
+        else:
+            local = f"{first}_{last}"
+        return f"{local}@{rng.choice(_EMAIL_DOMAINS)}"
+
+    def _phone(self, city: str) -> str:
+        rng = self.random
+        code = _LANDLINE_CODES.get(city)
+        if code is None or rng.random() < 0.5:
+            return f"07700 900{rng.randrange(1000):03d}"
+        return f"{code} 496 0{rng.randrange(1000):03d}"
+
+    def _date(self) -> str:
+        rng = self.random
+        return f"{rng.randint(1, 28)} {rng.choice(_MONTHS)} {rng.randint(2022, 2025)}"
+
+    def generate_letter(self, index: int = 0) -> Dict[str, Any]:
+        """
+        Generate one letter.
+
+        Args:
+            index: Letter index, used in the document id and reference
+
+        Returns:
+            Dict with documentId, text, entities (Type, BeginOffset,
+            EndOffset, sorted by offset) and sampleMarker
+        """
+        rng = self.random
+        name = self.name_generator.generate_name()
+        address = self.address_generator.generate_address()
+        category, topics = rng.choice(self._topics)
+        request = self.service_generator.generate_request(category.name, index)
+
+        values = {
+            "name": name["fullName"],
+            "third_party": self.name_generator.generate_name()["fullName"],
+            "address": "\n".join((
+                address["addressLine1"], address["addressLine2"],
+                address["city"], address["postcode"]
+            )),
+            "address_line": address["addressLine1"],
+            "postcode": address["postcode"],
+            "email": self._email(name),
+            "phone": self._phone(address["city"]),
+            "date": self._date(),
+            "council": self.council_name,
+            "council_domain": self._council_domain,
+            "topic": rng.choice(topics),
+            "context": rng.choice(CONTEXTS),
+            "reference": request["reference"],
+        }
+
+        pieces, entities = _render(rng.choice(_PARSED_TEMPLATES), values)
+        pieces.append(self._footer)
+
+        return {
+            "documentId": f"{self.config.sample_prefix} FOI-{index:06d}",
+            "text": "".join(pieces),
+            "entities": entities,
+            "sampleMarker": self.config.sample_marker
+        }
+
+    def iter_letters(self, count: int, start_index: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generate letters.
+
+        Args:
+            count: Number of letters
+            start_index: Index of the first letter
+
+        Yields:
+            Letter dicts as from generate_letter()
+        """
+        return (self.generate_letter(i) for i in range(start_index, start_index + count))
+
+    def generate_letters(self, count: int) -> List[Dict[str, Any]]:
+        """Generate count letters as a list."""
+        return list(self.iter_letters(count))
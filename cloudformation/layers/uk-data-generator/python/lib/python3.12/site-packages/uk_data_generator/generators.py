@@ -6,20 +6,53 @@ enabling reproducible test data generation.
 """
 
 import random
-import hashlib
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from bisect import bisect_right
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, Any
 from .config import (
-    UK_FIRST_NAMES,
-    UK_SURNAMES,
-    STREET_TYPES,
-    STREET_NAMES,
-    UK_CITIES,
-    COUNCIL_SERVICES,
     SAMPLE_DATA_MARKER,
     SAMPLE_DATA_PREFIX
 )
+from .compiled import CompiledConfig, get_compiled_config
+from .address_space import AddressSpace
+from .clock import ReferenceClock
+from .permutation import IndexPermutation
+from .rng import CounterStream, dump_random_state, load_random_state, spawn_random
+
+# Profiling, compact records, batches, streams and digests are imported
+# where they are used, so a cold start that only generates dicts does not
+# load them (or tracemalloc, array and json behind them)
+if TYPE_CHECKING:
+    from .aio import AsyncRecordStream
+    from .batch import RecordBatch
+    from .profiling import GenerationProfiler
+    from .streaming import DatasetStream
+
+# Version of the checkpoint format returned by CouncilDataGenerator.get_state()
+STATE_VERSION = 3
+
+# Counter-based household mode partitions resident indices into blocks of
+# this size and draws household sizes per block, so any resident's
+# household is computable without generating earlier ones
+HOUSEHOLD_BLOCK_SIZE = 64
+
+
+def _compact_record_type(name: str) -> type:
+    """Compact record class from records.py for compact=True generators."""
+    # Imported on use: compact records are opt-in and records.py loads json
+    from . import records
+
+    return getattr(records, name)
+
+
+class NameSpaceExhaustedError(ValueError):
+    """Raised when every unique name combination for a gender has been used."""
+    pass
+
+
+class AddressSpaceExhaustedError(ValueError):
+    """Raised when every unique address combination has been used."""
+    pass
 
 
 class UKNameGenerator:
@@ -29,15 +62,97 @@ class UKNameGenerator:
     Features:
     - Deterministic generation with seed
     - Gender-aware name selection
-    - Unique name combinations
+    - Unique name combinations via a seeded bijective permutation
+    - Optional frequency-weighted names (not deduplicated)
     - SAMPLE markers for synthetic data identification
     """
 
-    def __init__(self, seed: Optional[int] = None):
-        """Initialize name generator with optional seed."""
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        allow_reuse: bool = False,
+        config: Optional[CompiledConfig] = None,
+        weighted: bool = False,
+        compact: bool = False
+    ):
+        """
+        Initialize name generator with optional seed.
+
+        Args:
+            seed: Random seed for deterministic generation
+            allow_reuse: Start a fresh permutation once every combination for
+                a gender has been used, instead of raising
+                NameSpaceExhaustedError
+            config: Compiled configuration tables; defaults to the shared
+                process-wide tables
+            weighted: Sample first names and surnames by configured frequency
+                with alias tables. Like real populations, weighted names
+                repeat, so uniqueness is not enforced.
+            compact: Return NameRecord objects instead of dicts
+        """
         self.seed = seed
-        self.random = random.Random(seed)
-        self._used_combinations = set()
+        self.allow_reuse = allow_reuse
+        self.weighted = weighted
+        self.compact = compact
+        if compact:
+            self._record_type = _compact_record_type("NameRecord")
+        self.config = config or get_compiled_config()
+        self.random = spawn_random(seed, "names")
+
+        # Each unique (first name, surname) pair is an index into the
+        # per-gender combination space; a permutation walks that space in a
+        # seeded random order so the next unique name costs constant time.
+        self._permutations = {
+            gender: self._new_permutation(gender) for gender in ('male', 'female')
+        }
+        self._allocated = {'male': 0, 'female': 0}
+        self._retired_cycle_walks = 0
+
+        # Random-access mode: one permutation over the combined male and
+        # female space per epoch, keyed from a counter stream
+        self.counter_stream = CounterStream(seed, "names")
+        self._epoch_permutation: Optional[Tuple[int, IndexPermutation]] = None
+        self._weighted_stream = CounterStream(seed, "weightedNames")
+
+    def _new_permutation(self, gender: str, key: Optional[int] = None) -> IndexPermutation:
+        """Create a permutation over the combination space for a gender."""
+        if key is None:
+            key = self.random.getrandbits(64)
+        size = len(self.config.first_names[gender]) * len(self.config.surnames)
+        return IndexPermutation(size, key=key)
+
+    def _allocate_combination(self, gender: str) -> Tuple[str, str]:
+        """
+        Allocate the next unused (first name, surname) pair for a gender.
+
+        Raises:
+            NameSpaceExhaustedError: If every combination has been used and
+                reuse is not allowed
+        """
+        permutation = self._permutations[gender]
+        allocated = self._allocated[gender]
+
+        if allocated >= permutation.size:
+            if not self.allow_reuse:
+                raise NameSpaceExhaustedError(
+                    f"All {permutation.size} unique {gender} name combinations have been used"
+                )
+            self._retired_cycle_walks += permutation.cycle_walks
+            permutation = self._permutations[gender] = self._new_permutation(gender)
+            allocated = 0
+
+        self._allocated[gender] = allocated + 1
+        surnames = self.config.surnames
+        first_index, surname_index = divmod(permutation[allocated], len(surnames))
+
+        return self.config.first_names[gender][first_index], surnames[surname_index]
+
+    def _sample_weighted(self, gender: str, rng: Any) -> Tuple[str, str]:
+        """Draw a frequency-weighted (first name, surname) pair."""
+        config = self.config
+        first_name = config.first_names[gender][config.first_name_sampler[gender].sample(rng)]
+        last_name = config.surnames[config.surname_sampler.sample(rng)]
+        return first_name, last_name
 
     def generate_name(self, gender: Optional[str] = None) -> Dict[str, str]:
         """
@@ -48,34 +163,129 @@ class UKNameGenerator:
 
         Returns:
             Dict with firstName, lastName, fullName, gender fields
+
+        Raises:
+            NameSpaceExhaustedError: If no unique combination is left for the
+                gender and reuse is not allowed
         """
         if gender is None:
-            gender = self.random.choice(['male', 'female'])
+            gender = self.random.choice(self.config.genders)
 
-        if gender not in ['male', 'female']:
+        if gender not in self.config.first_names:
             raise ValueError("Gender must be 'male', 'female', or None")
 
-        # Select name ensuring uniqueness
-        max_attempts = 100
-        for _ in range(max_attempts):
-            first_name = self.random.choice(UK_FIRST_NAMES[gender])
-            last_name = self.random.choice(UK_SURNAMES)
-            combination = (first_name, last_name)
+        if self.weighted:
+            first_name, last_name = self._sample_weighted(gender, self.random)
+        else:
+            first_name, last_name = self._allocate_combination(gender)
+
+        return self._make_name(first_name, last_name, gender)
+
+    def name_at(self, index: int) -> Dict[str, str]:
+        """
+        Generate the name for a record index in random-access mode.
+
+        The result depends only on (seed, index). Unweighted names are
+        unique within each run of consecutive indices the size of the
+        combined male and female combination space.
+
+        Args:
+            index: Record index
+
+        Returns:
+            Dict with firstName, lastName, fullName, gender fields
+        """
+        if self.weighted:
+            rng = self._weighted_stream.at(index)
+            gender = rng.choice(self.config.genders)
+            first_name, last_name = self._sample_weighted(gender, rng)
+            return self._make_name(first_name, last_name, gender)
+
+        first_names = self.config.first_names
+        surnames = self.config.surnames
+        male_size = len(first_names['male']) * len(surnames)
+        space = male_size + len(first_names['female']) * len(surnames)
+        epoch, offset = divmod(index, space)
+
+        if self._epoch_permutation is None or self._epoch_permutation[0] != epoch:
+            if self._epoch_permutation is not None:
+                self._retired_cycle_walks += self._epoch_permutation[1].cycle_walks
+            key = self.counter_stream.at(epoch).getrandbits(64)
+            self._epoch_permutation = (epoch, IndexPermutation(space, key=key))
+
+        combination = self._epoch_permutation[1][offset]
+        if combination < male_size:
+            gender = 'male'
+        else:
+            gender = 'female'
+            combination -= male_size
+
+        first_index, surname_index = divmod(combination, len(surnames))
+        first_name = first_names[gender][first_index]
+        last_name = surnames[surname_index]
 
-            if combination not in self._used_combinations:
-                self._used_combinations.add(combination)
-                break
+        return self._make_name(first_name, last_name, gender)
 
-        full_name = f"{first_name} {last_name}"
+    def _make_name(self, first_name: str, last_name: str, gender: str) -> Any:
+        """Build a name dict, or a NameRecord in compact mode."""
+        if self.compact:
+            return self._record_type(first_name, last_name, gender)
 
         return {
             "firstName": first_name,
             "lastName": last_name,
-            "fullName": full_name,
+            "fullName": f"{first_name} {last_name}",
             "gender": gender,
             "sampleMarker": SAMPLE_DATA_MARKER
         }
 
+    @property
+    def cycle_walks(self) -> int:
+        """Permutation cycle walks so far: the retries spent keeping names unique."""
+        walks = self._retired_cycle_walks
+        walks += sum(permutation.cycle_walks for permutation in self._permutations.values())
+        if self._epoch_permutation is not None:
+            walks += self._epoch_permutation[1].cycle_walks
+        return walks
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Return the sequential generation state as a JSON-serialisable dict.
+
+        Random-access draws (name_at) are stateless and not included.
+        """
+        return {
+            "random": dump_random_state(self.random),
+            "permutationKeys": {
+                gender: permutation.key for gender, permutation in self._permutations.items()
+            },
+            "allocated": dict(self._allocated)
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore state captured by get_state().
+
+        Raises:
+            ValueError: If the state is malformed
+        """
+        try:
+            permutations = {
+                gender: self._new_permutation(gender, int(state["permutationKeys"][gender]))
+                for gender in self._permutations
+            }
+            allocated = {gender: int(state["allocated"][gender]) for gender in self._allocated}
+            random_state = state["random"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid name generator state: {e}")
+
+        load_random_state(self.random, random_state)
+        self._retired_cycle_walks += sum(
+            permutation.cycle_walks for permutation in self._permutations.values()
+        )
+        self._permutations = permutations
+        self._allocated = allocated
+
     def generate_names(self, count: int) -> List[Dict[str, str]]:
         """
         Generate multiple unique UK names.
@@ -103,26 +313,75 @@ class UKAddressGenerator:
     - Valid UK postcode patterns (B12 3AB, M1 4BN, LS6 2QR)
     - Realistic street address combinations
     - City and district assignment
+    - Optional population-weighted city selection
+    - Optional guaranteed-unique addresses and postcodes
     - SAMPLE markers for synthetic data
     """
 
-    def __init__(self, seed: Optional[int] = None):
-        """Initialize address generator with optional seed."""
-        self.seed = seed
-        self.random = random.Random(seed)
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        config: Optional[CompiledConfig] = None,
+        weighted: bool = False,
+        compact: bool = False,
+        unique: bool = False
+    ):
+        """
+        Initialize address generator.
 
-    def _generate_postcode(self, prefix: str) -> str:
+        Args:
+            seed: Random seed for deterministic generation
+            config: Compiled configuration tables; defaults to the shared
+                process-wide tables
+            weighted: Pick random cities in proportion to configured weight
+            compact: Return AddressRecord objects instead of dicts
+            unique: Never repeat an address. Addresses come from a seeded
+                bijection over (postcode, street number, street) combinations,
+                so postcodes are also unique until every postcode has been
+                used. Cities are then spread evenly over the postcode space
+                (weighted city selection does not apply) and city_name
+                cannot be used.
+        """
+        self.seed = seed
+        self.weighted = weighted
+        self.compact = compact
+        if compact:
+            self._record_type = _compact_record_type("AddressRecord")
+        self.unique = unique
+        self.config = config or get_compiled_config()
+        self.random = spawn_random(seed, "addresses")
+        self.counter_stream = CounterStream(seed, "addresses")
+
+        self._address_space: Optional[AddressSpace] = None
+        self._unique_next = 0
+        if unique:
+            key = CounterStream(seed, "uniqueAddresses").at(0).getrandbits(64)
+            self._address_space = AddressSpace(self.config, key=key)
+
+    def _generate_postcode(
+        self,
+        prefix: str,
+        rng: Optional[Any] = None,
+        outward_codes: Optional[Sequence[str]] = None
+    ) -> str:
         """
         Generate a valid UK postcode format.
 
         Format: PREFIX + DISTRICT (1-2 digits) + SPACE + SECTOR (digit) + UNIT (2 letters)
         Example: B12 3AB, M1 4BN, LS6 2QR
+
+        If the city has real outward codes (from a data pack), PREFIX +
+        DISTRICT is drawn from those instead.
         """
-        district = self.random.randint(1, 99)
-        sector = self.random.randint(0, 9)
-        unit = ''.join(self.random.choices('ABCDEFGHJKLMNOPQRSTUVWXYZ', k=2))
+        rng = rng or self.random
+        if outward_codes:
+            outward = rng.choice(outward_codes)
+        else:
+            outward = f"{prefix}{rng.randint(1, 99)}"
+        sector = rng.randint(0, 9)
+        unit = ''.join(rng.choices(self.config.postcode_unit_letters, k=2))
 
-        return f"{prefix}{district} {sector}{unit}"
+        return f"{outward} {sector}{unit}"
 
     def generate_address(self, city_name: Optional[str] = None) -> Dict[str, str]:
         """
@@ -133,21 +392,96 @@ class UKAddressGenerator:
 
         Returns:
             Dict with address components and full formatted address
+
+        Raises:
+            AddressSpaceExhaustedError: In unique mode, if every address has
+                been used
         """
-        # Select city
+        if self.unique:
+            index = self._unique_next
+            address = self._build_unique_address(self.random, index, city_name)
+            self._unique_next = index + 1
+            return address
+
+        return self._build_address(self.random, city_name)
+
+    def address_at(self, index: int, city_name: Optional[str] = None) -> Dict[str, str]:
+        """
+        Generate the address for a record index in random-access mode.
+
+        The result depends only on (seed, index, city_name). In unique mode
+        distinct indices always give distinct addresses.
+
+        Args:
+            index: Record index
+            city_name: Specific city name or None for random selection
+
+        Returns:
+            Dict with address components and full formatted address
+        """
+        if self.unique:
+            return self._build_unique_address(self.counter_stream.at(index), index, city_name)
+
+        return self._build_address(self.counter_stream.at(index), city_name)
+
+    def _build_unique_address(self, rng: Any, index: int, city_name: Optional[str]) -> Any:
+        """Build the address at an index of the unique address space."""
         if city_name:
-            city = next((c for c in UK_CITIES if c["name"] == city_name), None)
-            if not city:
-                city = self.random.choice(UK_CITIES)
-        else:
-            city = self.random.choice(UK_CITIES)
+            raise ValueError("Unique addresses cannot be restricted to a city")
+
+        space = self._address_space
+        if index >= space.size:
+            raise AddressSpaceExhaustedError(
+                f"All {space.size} unique address combinations have been used"
+            )
+
+        parts = space[index]
+        return self._make_address(
+            parts.street_number,
+            parts.street_name,
+            parts.street_type,
+            rng.choice(parts.city.districts),
+            parts.city.name,
+            parts.postcode
+        )
+
+    def _build_address(self, rng: Any, city_name: Optional[str]) -> Dict[str, str]:
+        """Build an address from a random.Random-compatible draw source."""
+        config = self.config
+
+        # Select city
+        city = config.city(city_name) if city_name else None
+        if city is None:
+            if self.weighted:
+                city = config.cities[config.city_sampler.sample(rng)]
+            else:
+                city = rng.choice(config.cities)
 
         # Generate address components
-        street_number = self.random.randint(1, 999)
-        street_name = self.random.choice(STREET_NAMES)
-        street_type = self.random.choice(STREET_TYPES)
-        district = self.random.choice(city["districts"])
-        postcode = self._generate_postcode(city["postcodePrefix"])
+        street_number = rng.randint(1, 999)
+        street_name = rng.choice(config.street_names)
+        street_type = rng.choice(config.street_types)
+        district = rng.choice(city.districts)
+        postcode = self._generate_postcode(city.postcode_prefix, rng, city.postcode_districts)
+
+        return self._make_address(
+            street_number, street_name, street_type, district, city.name, postcode
+        )
+
+    def _make_address(
+        self,
+        street_number: int,
+        street_name: str,
+        street_type: str,
+        district: str,
+        city_name: str,
+        postcode: str
+    ) -> Any:
+        """Build an address dict, or an AddressRecord in compact mode."""
+        if self.compact:
+            return self._record_type(
+                street_number, street_name, street_type, district, city_name, postcode
+            )
 
         # Build full address
         address_line1 = f"{street_number} {street_name} {street_type}"
@@ -155,12 +489,29 @@ class UKAddressGenerator:
         return {
             "addressLine1": address_line1,
             "addressLine2": district,
-            "city": city["name"],
+            "city": city_name,
             "postcode": postcode,
-            "formattedAddress": f"{address_line1}, {district}, {city['name']}, {postcode}",
+            "formattedAddress": f"{address_line1}, {district}, {city_name}, {postcode}",
             "sampleMarker": SAMPLE_DATA_MARKER
         }
 
+    def get_state(self) -> Dict[str, Any]:
+        """Return the sequential generation state as a JSON-serialisable dict."""
+        return {"random": dump_random_state(self.random), "uniqueNext": self._unique_next}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore state captured by get_state().
+
+        Raises:
+            ValueError: If the state is malformed
+        """
+        try:
+            load_random_state(self.random, state["random"])
+            self._unique_next = int(state.get("uniqueNext", 0))
+        except (AttributeError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid address generator state: {e}")
+
     def generate_addresses(self, count: int) -> List[Dict[str, str]]:
         """
         Generate multiple UK addresses.
@@ -183,23 +534,49 @@ class CouncilServiceGenerator:
     - Realistic request types per category
     - Status tracking (new, in_progress, resolved)
     - Priority levels
-    - Timestamps
+    - Timestamps relative to a fixed reference time
+    - Optional volume-weighted category selection
     """
 
-    def __init__(self, seed: Optional[int] = None):
-        """Initialize service request generator with optional seed."""
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        config: Optional[CompiledConfig] = None,
+        weighted: bool = False,
+        reference_time: Optional[datetime] = None,
+        compact: bool = False
+    ):
+        """
+        Initialize service request generator.
+
+        Args:
+            seed: Random seed for deterministic generation
+            config: Compiled configuration tables; defaults to the shared
+                process-wide tables
+            weighted: Draw categories in proportion to configured request
+                volume instead of rotating through them evenly
+            reference_time: Time that references and timestamps are relative
+                to; defaults to the current time, captured once
+            compact: Return ServiceRequestRecord objects instead of dicts
+        """
         self.seed = seed
-        self.random = random.Random(seed)
+        self.weighted = weighted
+        self.compact = compact
+        if compact:
+            self._record_type = _compact_record_type("ServiceRequestRecord")
+        self.config = config or get_compiled_config()
+        self.clock = ReferenceClock(reference_time)
+        self.random = spawn_random(seed, "serviceRequests")
+        self.counter_stream = CounterStream(seed, "serviceRequests")
 
     def _generate_reference(self, category_code: str, index: int) -> str:
         """Generate a service request reference number."""
-        timestamp = datetime.now().strftime("%Y%m")
-        return f"{SAMPLE_DATA_PREFIX} {category_code}-{timestamp}-{index:05d}"
+        return f"{SAMPLE_DATA_PREFIX} {category_code}-{self.clock.month}-{index:05d}"
 
-    def _generate_timestamp(self, days_ago: int) -> str:
-        """Generate a timestamp within the last N days."""
-        date = datetime.now() - timedelta(days=self.random.randint(0, days_ago))
-        return date.isoformat()
+    def _generate_timestamp(self, days_ago: int, rng: Optional[Any] = None) -> str:
+        """Generate a timestamp within the last N days of the reference time."""
+        rng = rng or self.random
+        return self.clock.days_ago(rng.randint(0, days_ago))
 
     def generate_request(
         self,
@@ -216,36 +593,126 @@ class CouncilServiceGenerator:
         Returns:
             Dict with complete service request data
         """
+        return self._build_request(self.random, category, index)
+
+    def request_at(self, index: int, category: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate the service request for an index in random-access mode.
+
+        The result depends only on (seed, index, category). Without a
+        category, categories rotate by index as in generate_requests(), or
+        are drawn by weight in weighted mode.
+
+        Args:
+            index: Request index
+            category: Specific category name or None to rotate by index
+
+        Returns:
+            Dict with complete service request data
+        """
+        if category is None and not self.weighted:
+            categories = self.config.categories
+            category = categories[index % len(categories)].name
+
+        return self._build_request(self.counter_stream.at(index), category, index)
+
+    def _build_request(
+        self,
+        rng: Any,
+        category: Optional[str],
+        index: int
+    ) -> Dict[str, Any]:
+        """Build a service request from a random.Random-compatible draw source."""
+        config = self.config
+
         # Select category
-        if category:
-            category_data = next(
-                (c for c in COUNCIL_SERVICES["categories"] if c["name"] == category),
-                None
-            )
-            if not category_data:
-                category_data = self.random.choice(COUNCIL_SERVICES["categories"])
-        else:
-            category_data = self.random.choice(COUNCIL_SERVICES["categories"])
+        category_data = config.category(category) if category else None
+        if category_data is None:
+            if self.weighted:
+                category_data = config.categories[config.category_sampler.sample(rng)]
+            else:
+                category_data = rng.choice(config.categories)
 
         # Generate request details
-        request_type = self.random.choice(category_data["types"])
-        status = self.random.choice(["new", "in_progress", "resolved"])
-        priority = self.random.choice(["low", "medium", "high"])
-
-        # Generate category code for reference
-        category_code = ''.join([word[0] for word in category_data["name"].split()])
+        request_type = rng.choice(category_data.types)
+        status = rng.choice(config.statuses)
+        priority = rng.choice(config.priorities)
+
+        if self.compact:
+            submitted_at = self._generate_timestamp(30, rng)
+            return self._record_type(
+                index,
+                category_data.name,
+                category_data.code,
+                request_type,
+                status,
+                priority,
+                self.clock.month,
+                submitted_at,
+                self._generate_timestamp(7, rng)
+            )
 
         return {
-            "reference": self._generate_reference(category_code.upper(), index),
-            "category": category_data["name"],
+            "reference": self._generate_reference(category_data.code, index),
+            "category": category_data.name,
             "requestType": request_type,
             "status": status,
             "priority": priority,
-            "submittedAt": self._generate_timestamp(30),
-            "lastUpdated": self._generate_timestamp(7),
+            "submittedAt": self._generate_timestamp(30, rng),
+            "lastUpdated": self._generate_timestamp(7, rng),
             "sampleMarker": SAMPLE_DATA_MARKER
         }
 
+    def iter_arrivals(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+        daily_volume: float = 1000.0
+    ) -> Iterator[Any]:
+        """
+        Simulate time-ordered request arrivals over a span of time.
+
+        Unlike generate_requests(), which spreads requests uniformly over
+        the last 30 days, arrivals follow hourly, weekly and seasonal
+        patterns with storm bursts (see arrivals.ArrivalSimulator).
+
+        Args:
+            start: Start of the window
+            end: End of the window, at which statuses are taken; defaults
+                to the reference time
+            daily_volume: Long-run average requests per day
+
+        Returns:
+            Iterator of service requests sorted by submittedAt
+        """
+        # Imported on use: most callers never simulate arrivals
+        from .arrivals import ArrivalSimulator
+
+        return ArrivalSimulator(
+            self.seed,
+            start,
+            end or self.clock.reference_time,
+            daily_volume,
+            config=self.config,
+            compact=self.compact
+        ).iter_requests()
+
+    def get_state(self) -> Dict[str, Any]:
+        """Return the sequential generation state as a JSON-serialisable dict."""
+        return {"random": dump_random_state(self.random)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore state captured by get_state().
+
+        Raises:
+            ValueError: If the state is malformed
+        """
+        try:
+            load_random_state(self.random, state["random"])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid service generator state: {e}")
+
     def generate_requests(
         self,
         count: int,
@@ -261,23 +728,42 @@ class CouncilServiceGenerator:
         Returns:
             List of service request dictionaries
         """
-        requests = []
+        return list(self.iter_requests(count, category_distribution))
 
+    def iter_requests(
+        self,
+        count: int,
+        category_distribution: Optional[Dict[str, int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generate service requests.
+
+        Yields the same records, in the same order, as generate_requests().
+
+        Args:
+            count: Total number of requests to generate
+            category_distribution: Optional dict of category name -> count
+
+        Yields:
+            Service request dictionaries
+        """
         if category_distribution:
             # Generate specific distribution
             index = 0
             for category, cat_count in category_distribution.items():
                 for _ in range(cat_count):
-                    requests.append(self.generate_request(category, index))
+                    yield self.generate_request(category, index)
                     index += 1
+        elif self.weighted:
+            # Categories drawn in proportion to configured volume
+            for i in range(count):
+                yield self.generate_request(None, i)
         else:
             # Even distribution across categories
-            categories = [c["name"] for c in COUNCIL_SERVICES["categories"]]
+            categories = [c.name for c in self.config.categories]
             for i in range(count):
                 category = categories[i % len(categories)]
-                requests.append(self.generate_request(category, i))
-
-        return requests
+                yield self.generate_request(category, i)
 
 
 class CouncilDataGenerator:
@@ -293,13 +779,31 @@ class CouncilDataGenerator:
     - Volume controls
     - JSON schema validation
     - Complete resident records (name + address + service requests)
+    - Optional counter-based mode where any record is computable from
+      (seed, index) alone
+    - Optional weighted names, cities and service categories
+    - Checkpoint/resume of sequential generation via get_state()/set_state()
+    - Optional per-stage profiling
+    - Optional compact __slots__ records instead of nested dicts
+    - Optional households sharing one address object between residents
+    - Optional guaranteed-unique addresses and postcodes
+    - Optional content digest of each generated dataset in its metadata
     """
 
     def __init__(
         self,
         seed: Optional[int] = None,
         council_name: str = "Sample Council",
-        region: str = "Sample Region"
+        region: str = "Sample Region",
+        counter_based: bool = False,
+        config: Optional[CompiledConfig] = None,
+        weighted: bool = False,
+        reference_time: Optional[datetime] = None,
+        profiler: Optional["GenerationProfiler"] = None,
+        compact: bool = False,
+        households: bool = False,
+        unique_addresses: bool = False,
+        digest: bool = False
     ):
         """
         Initialize comprehensive data generator.
@@ -308,83 +812,307 @@ class CouncilDataGenerator:
             seed: Random seed for deterministic generation
             council_name: Name of council for context
             region: Geographic region for context
+            counter_based: Derive every record from a hash of (seed, stream,
+                index) so any slice can be generated independently. A random
+                seed is drawn (and recorded) if none is given.
+            config: Compiled configuration tables shared with the
+                sub-generators; defaults to the process-wide tables
+            weighted: Sample names, cities and service categories by the
+                configured weights with alias tables (names then repeat)
+            reference_time: Time that createdAt, references and service
+                timestamps are relative to. Defaults to the current time,
+                captured once; pass a fixed value for fully reproducible output.
+            profiler: Optional profiler timing the name, address and service
+                request stages of each generate()/generate_stream() run. Its
+                report is added to metadata as "profile".
+            compact: Emit ResidentRecord and ServiceRequestRecord objects
+                (see records.py) instead of nested dicts. They use a fraction
+                of the memory and convert with to_dict()/to_json().
+            households: Group consecutive residents into households whose
+                sizes follow config.UK_HOUSEHOLD_SIZES. Members share one
+                address object and get a householdId (the index of the first
+                member). This saves memory, not output size: serialised
+                residents still embed the full address.
+            unique_addresses: Never repeat an address (or, up to the size of
+                the postcode space, a postcode); see UKAddressGenerator
+            digest: Record a BLAKE2b digest of each dataset's canonical JSON
+                in metadata as "digest" (see digest.py), so datasets can be
+                compared without diffing them. Off by default: encoding every
+                record adds roughly half again to generation time.
         """
+        if counter_based and seed is None:
+            seed = random.getrandbits(64)
+
         self.seed = seed
         self.council_name = council_name
         self.region = region
-
-        # Initialize sub-generators with same seed
-        self.name_generator = UKNameGenerator(seed)
-        self.address_generator = UKAddressGenerator(seed)
-        self.service_generator = CouncilServiceGenerator(seed)
-        self.random = random.Random(seed)
+        self.counter_based = counter_based
+        self.weighted = weighted
+        self.compact = compact
+        if compact:
+            self._record_type = _compact_record_type("ResidentRecord")
+        self.households = households
+        self.unique_addresses = unique_addresses
+        self.digest = digest
+        self.config = config or get_compiled_config()
+        self.clock = ReferenceClock(reference_time)
+
+        # Initialize sub-generators with the same seed; each draws from its
+        # own independent stream of it (see rng.spawn_random). Names may be
+        # reused once the combination space is exhausted so large volumes
+        # still succeed.
+        self.name_generator = UKNameGenerator(
+            seed, allow_reuse=True, config=self.config, weighted=weighted, compact=compact
+        )
+        self.address_generator = UKAddressGenerator(
+            seed, config=self.config, weighted=weighted, compact=compact, unique=unique_addresses
+        )
+        self.service_generator = CouncilServiceGenerator(
+            seed,
+            config=self.config,
+            weighted=weighted,
+            reference_time=self.clock.reference_time,
+            compact=compact
+        )
+        self.random = spawn_random(seed, "council")
+
+        # Index after the last resident drawn, shared by service requests:
+        # where resume=True continues from
+        self._next_index = 0
+
+        # Current household as (first resident index, shared address). In
+        # sequential mode, also the members still to come and the address
+        # generator state the address was drawn from (for checkpoints).
+        self._household: Optional[Tuple[int, Any]] = None
+        self._household_remaining = 0
+        self._household_address_state: Optional[Dict[str, Any]] = None
+        self._household_block: Optional[Tuple[int, List[int]]] = None
+        self._household_stream = CounterStream(seed, "households")
+
+        self.profiler = profiler
+        if profiler is not None:
+            self._instrument(profiler)
+
+    def _instrument(self, profiler: "GenerationProfiler") -> None:
+        """Wrap the sub-generators' record builders with stage timers."""
+        from .profiling import ADDRESSES, NAMES, SERVICE_REQUESTS
+
+        names = self.name_generator
+        names.generate_name = profiler.wrap(NAMES, names.generate_name)
+        names.name_at = profiler.wrap(NAMES, names.name_at)
+
+        addresses = self.address_generator
+        addresses.generate_address = profiler.wrap(ADDRESSES, addresses.generate_address)
+        addresses.address_at = profiler.wrap(ADDRESSES, addresses.address_at)
+
+        services = self.service_generator
+        services.generate_request = profiler.wrap(SERVICE_REQUESTS, services.generate_request)
+        services.request_at = profiler.wrap(SERVICE_REQUESTS, services.request_at)
+
+    @property
+    def next_index(self) -> int:
+        """Index after the last resident drawn; where resume=True continues."""
+        return self._next_index
 
     def generate_resident(self, resident_id: int) -> Dict[str, Any]:
         """
         Generate a complete resident record.
 
+        In counter-based mode the record depends only on (seed, resident_id).
+        In sequential mode it is drawn from the shared generator state.
+        Either way next_index moves past resident_id.
+
         Args:
             resident_id: Unique resident identifier
 
         Returns:
-            Dict with name, address, and metadata
+            Dict with name, address, and metadata (a ResidentRecord in
+            compact mode)
         """
-        name = self.name_generator.generate_name()
-        address = self.address_generator.generate_address()
+        household_index = None
+        if self.counter_based:
+            name = self.name_generator.name_at(resident_id)
+            if self.households:
+                household_index, address = self._household_at(resident_id)
+            else:
+                address = self.address_generator.address_at(resident_id)
+        else:
+            name = self.name_generator.generate_name()
+            if self.households:
+                household_index, address = self._next_household_member(resident_id)
+            else:
+                address = self.address_generator.generate_address()
+        self._next_index = resident_id + 1
+
+        if self.compact:
+            return self._record_type(
+                resident_id,
+                name,
+                address,
+                self.council_name,
+                self.region,
+                self.clock.iso,
+                household_index
+            )
 
-        return {
+        resident = {
             "residentId": f"{SAMPLE_DATA_PREFIX} RES-{resident_id:06d}",
             "name": name,
             "address": address,
             "councilName": self.council_name,
             "region": self.region,
-            "createdAt": datetime.now().isoformat(),
+            "createdAt": self.clock.iso,
             "sampleMarker": SAMPLE_DATA_MARKER
         }
+        if household_index is not None:
+            resident["householdId"] = f"{SAMPLE_DATA_PREFIX} HH-{household_index:06d}"
+        return resident
+
+    def _draw_household_size(self, rng: Any) -> int:
+        """Draw a household size from the configured distribution."""
+        config = self.config
+        return config.household_sizes[config.household_size_sampler.sample(rng)]
+
+    def _next_household_member(self, resident_id: int) -> Tuple[int, Any]:
+        """Household of the next sequential resident, starting a new one if full."""
+        if self._household_remaining == 0:
+            addresses = self.address_generator
+            self._household_remaining = self._draw_household_size(addresses.random)
+            self._household_address_state = addresses.get_state()
+            self._household = (resident_id, addresses.generate_address())
+
+        self._household_remaining -= 1
+        return self._household
+
+    def _household_at(self, resident_id: int) -> Tuple[int, Any]:
+        """Household of a resident in counter-based mode."""
+        block, offset = divmod(resident_id, HOUSEHOLD_BLOCK_SIZE)
+
+        if self._household_block is None or self._household_block[0] != block:
+            # Household start offsets within the block; the last household
+            # is cut short at the block boundary
+            rng = self._household_stream.at(block)
+            starts = []
+            position = 0
+            while position < HOUSEHOLD_BLOCK_SIZE:
+                starts.append(position)
+                position += self._draw_household_size(rng)
+            self._household_block = (block, starts)
+
+        starts = self._household_block[1]
+        start = block * HOUSEHOLD_BLOCK_SIZE + starts[bisect_right(starts, offset) - 1]
+        if self._household is None or self._household[0] != start:
+            self._household = (start, self.address_generator.address_at(start))
+
+        return self._household
+
+    def generate_request(self, index: int) -> Dict[str, Any]:
+        """
+        Generate the service request at an index of the dataset.
+
+        Categories rotate by index as in generate(), or are drawn by weight
+        in weighted mode. In counter-based mode the record depends only on
+        (seed, index).
+
+        Args:
+            index: Service request index
+
+        Returns:
+            Dict with complete service request data
+        """
+        if self.counter_based:
+            return self.service_generator.request_at(index)
+
+        category = None
+        if not self.weighted:
+            categories = self.config.categories
+            category = categories[index % len(categories)].name
+
+        return self.service_generator.generate_request(category, index)
 
     def generate(
         self,
         data_volume: int = 100,
-        include_service_requests: bool = True
+        include_service_requests: bool = True,
+        parallel: int = 1,
+        start_index: Optional[int] = None,
+        count: Optional[int] = None,
+        resume: bool = False
     ) -> Dict[str, Any]:
         """
         Generate complete dataset for a scenario.
 
+        Records are numbered from 0 unless start_index or resume say
+        otherwise, so a dataset can be extended without regenerating its
+        earlier records:
+
+            first = generator.generate(count=100_000)
+            rest = generator.generate(count=900_000, resume=True)
+
         Args:
             data_volume: Number of resident records to generate
             include_service_requests: Whether to generate service requests
+            parallel: Number of worker processes. Values above 1 split the
+                index range into shards and require counter-based mode; the
+                merged output is identical to single-process generation.
+            start_index: Index of the first record (default 0).
+                Counter-based mode can start anywhere. Sequential mode draws
+                records in order, so an explicit index must be next_index.
+            count: Number of records to generate; overrides data_volume
+            resume: Continue from next_index, where the previous call or a
+                restored checkpoint stopped, instead of from 0
 
         Returns:
             Dict with complete dataset and metadata
         """
-        start_time = datetime.now()
+        if parallel < 1:
+            raise ValueError("parallel must be at least 1")
+        if parallel > 1 and not self.counter_based:
+            raise ValueError("parallel generation requires counter_based=True")
 
-        # Generate residents
-        residents = [
-            self.generate_resident(i) for i in range(data_volume)
-        ]
+        if count is not None:
+            data_volume = count
+        resident_start = self._resolve_start_index(start_index, resume)
 
-        # Generate service requests if requested
-        service_requests = []
-        if include_service_requests:
-            service_requests = self.service_generator.generate_requests(
-                count=data_volume
+        retries_before = self._start_profile()
+        start_time = datetime.now()
+
+        if parallel > 1:
+            # Imported on use: process pools pull in multiprocessing
+            from .parallel import generate_sharded
+
+            residents, service_requests = generate_sharded(
+                self._shard_config(),
+                data_volume,
+                include_service_requests,
+                parallel,
+                start_index=resident_start,
+                profiler=self.profiler
             )
+            self._next_index = resident_start + data_volume
+        else:
+            # Generate residents
+            residents = list(self._resident_range(resident_start, data_volume))
+
+            # Generate service requests if requested
+            service_requests = []
+            if include_service_requests:
+                service_requests = list(
+                    self.iter_service_requests(data_volume, resident_start)
+                )
+
+        digest = None
+        if self.digest:
+            from .digest import dataset_digest
 
+            digest = dataset_digest(residents, service_requests)
         end_time = datetime.now()
-        generation_time = (end_time - start_time).total_seconds()
+        profile = self._finish_profile(len(residents) + len(service_requests), retries_before)
 
         return {
-            "metadata": {
-                "councilName": self.council_name,
-                "region": self.region,
-                "generatedAt": end_time.isoformat(),
-                "generationTime": generation_time,
-                "seed": self.seed,
-                "dataVolume": data_volume,
-                "sampleMarker": SAMPLE_DATA_MARKER,
-                "version": "1.0.0"
-            },
+            "metadata": self._build_metadata(
+                data_volume, start_time, end_time, resident_start, profile, digest
+            ),
             "residents": residents,
             "serviceRequests": service_requests,
             "recordCounts": {
@@ -394,10 +1122,378 @@ class CouncilDataGenerator:
             }
         }
 
+    def iter_residents(
+        self,
+        count: int,
+        start_index: Optional[int] = None,
+        resume: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generate resident records.
+
+        Args:
+            count: Number of resident records to generate
+            start_index: First resident index (default 0). Any index in
+                counter-based mode; sequential mode only accepts next_index.
+            resume: Start at next_index instead of 0
+
+        Yields:
+            Resident records, identical to those built by generate()
+        """
+        return self._resident_range(self._resolve_start_index(start_index, resume), count)
+
+    def _resident_range(self, start_index: int, count: int) -> Iterator[Dict[str, Any]]:
+        """Residents for an already resolved index range."""
+        return (self.generate_resident(i) for i in range(start_index, start_index + count))
+
+    def iter_service_requests(
+        self,
+        count: int,
+        start_index: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generate service requests.
+
+        Requests share the residents' indices and do not move next_index.
+        Sequential requests are drawn from the service stream in call
+        order, so a range generated without requests shifts later ones;
+        their ids still match the residents'.
+
+        Args:
+            count: Number of service requests to generate
+            start_index: First request index, normally that of the residents
+                the requests accompany (default 0)
+
+        Yields:
+            Service request records, identical to those built by generate()
+        """
+        start_index = start_index or 0
+        if start_index < 0:
+            raise ValueError("start_index must be non-negative")
+        return (self.generate_request(i) for i in range(start_index, start_index + count))
+
+    def _shard_config(self) -> Dict[str, Any]:
+        """Constructor arguments that recreate this generator in a worker."""
+        return {
+            "seed": self.seed,
+            "council_name": self.council_name,
+            "region": self.region,
+            "counter_based": self.counter_based,
+            "weighted": self.weighted,
+            "reference_time": self.clock.reference_time,
+            "compact": self.compact,
+            "households": self.households,
+            "unique_addresses": self.unique_addresses,
+            "config": self.config
+        }
+
+    def _resolve_start_index(self, start_index: Optional[int], resume: bool) -> int:
+        """
+        Default and check the first index of a slice.
+
+        Slices start at 0 unless resumed. Sequential mode draws records in
+        index order from shared state, so an explicit start can only be
+        next_index; counter-based mode can start anywhere.
+        """
+        if start_index is None:
+            return self._next_index if resume else 0
+        if start_index < 0:
+            raise ValueError("start_index must be non-negative")
+        if (resume or not self.counter_based) and start_index != self._next_index:
+            raise ValueError(
+                f"Generation resumes at index {self._next_index}, not "
+                f"{start_index}; restore a checkpoint with set_state() or use "
+                f"counter_based=True"
+            )
+        return start_index
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Capture a checkpoint of the generator as a JSON-serialisable dict.
+
+        Restoring it with set_state() on a generator created with the same
+        arguments continues sequential generation exactly where it stopped,
+        so an interrupted run can resume from its last checkpoint and a
+        dataset can be extended without regenerating earlier records.
+
+        Returns:
+            Checkpoint dict
+        """
+        return {
+            "version": STATE_VERSION,
+            "seed": self.seed,
+            "counterBased": self.counter_based,
+            "weighted": self.weighted,
+            "nextIndex": self._next_index,
+            "random": dump_random_state(self.random),
+            "nameGenerator": self.name_generator.get_state(),
+            "addressGenerator": self.address_generator.get_state(),
+            "serviceGenerator": self.service_generator.get_state(),
+            "household": self._household_checkpoint()
+        }
+
+    def _household_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Sequential household in progress, if any, for get_state()."""
+        if self.counter_based or not self._household_remaining:
+            return None
+        return {
+            "index": self._household[0],
+            "remaining": self._household_remaining,
+            "addressState": self._household_address_state
+        }
+
+    def _restore_household(self, household: Optional[Dict[str, Any]]) -> None:
+        """Rebuild a sequential household in progress from a checkpoint."""
+        self._household = None
+        self._household_remaining = 0
+        self._household_address_state = None
+        if not household:
+            return
+
+        addresses = self.address_generator
+        current_state = addresses.get_state()
+        try:
+            addresses.set_state(household["addressState"])
+            self._household = (int(household["index"]), addresses.generate_address())
+            self._household_remaining = int(household["remaining"])
+            self._household_address_state = household["addressState"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid household state: {e}")
+        finally:
+            addresses.set_state(current_state)
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a checkpoint captured by get_state().
+
+        Args:
+            state: Checkpoint dict, possibly after a JSON round trip
+
+        Raises:
+            ValueError: If the checkpoint is malformed or was taken from a
+                generator with a different seed or mode
+        """
+        try:
+            version = state["version"]
+            settings = (state["seed"], state["counterBased"], state["weighted"])
+            next_index = int(state["nextIndex"])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid generator state: {e}")
+
+        if version != STATE_VERSION:
+            raise ValueError(f"Unsupported generator state version {version}")
+        if settings != (self.seed, self.counter_based, self.weighted):
+            raise ValueError("Generator state was captured with a different seed or mode")
+
+        self.name_generator.set_state(state.get("nameGenerator"))
+        self.address_generator.set_state(state.get("addressGenerator"))
+        self.service_generator.set_state(state.get("serviceGenerator"))
+        load_random_state(self.random, state.get("random"))
+        self._restore_household(state.get("household"))
+        self._next_index = next_index
+
+    def generate_stream(
+        self,
+        data_volume: int = 100,
+        include_service_requests: bool = True,
+        start_index: Optional[int] = None,
+        resume: bool = False
+    ) -> "DatasetStream":
+        """
+        Generate a dataset as a lazy stream with constant memory use.
+
+        For a given seed the stream yields exactly the records that
+        generate() would return. Metadata (including the same digest, if
+        enabled) and record counts are available on the returned stream
+        once it has been exhausted.
+
+        Args:
+            data_volume: Number of resident records to generate
+            include_service_requests: Whether to generate service requests
+            start_index: Index of the first record, as for generate()
+            resume: Continue from next_index, as for generate()
+
+        Returns:
+            DatasetStream yielding (record_kind, record) tuples
+        """
+        from .digest import DatasetDigest
+        from .streaming import DatasetStream
+
+        resident_start = self._resolve_start_index(start_index, resume)
+        records = data_volume * (2 if include_service_requests else 1)
+        retries_before = self._start_profile()
+        start_time = datetime.now()
+        digest = DatasetDigest() if self.digest else None
+
+        return DatasetStream(
+            residents=self._resident_range(resident_start, data_volume),
+            service_requests=(
+                self.iter_service_requests(data_volume, resident_start)
+                if include_service_requests else iter(())
+            ),
+            build_metadata=lambda: self._build_metadata(
+                data_volume,
+                start_time,
+                datetime.now(),
+                resident_start,
+                self._finish_profile(records, retries_before),
+                digest.hexdigest() if digest is not None else None
+            ),
+            digest=digest
+        )
+
+    def aiter_records(
+        self,
+        data_volume: int = 100,
+        include_service_requests: bool = True,
+        batch_size: int = 1000,
+        max_pending: int = 4,
+        start_index: Optional[int] = None,
+        resume: bool = False
+    ) -> "AsyncRecordStream":
+        """
+        Generate a dataset as an async iterator of record batches.
+
+        Records are generated in a worker thread and handed over through a
+        bounded queue, so generation overlaps with the consumer's awaits
+        and pauses whenever max_pending batches are waiting. Batches hold
+        exactly the records that generate_stream() would yield.
+
+        Args:
+            data_volume: Number of resident records to generate
+            include_service_requests: Whether to generate service requests
+            batch_size: Records per batch
+            max_pending: Batches generated ahead of the consumer
+            start_index: Index of the first record, as for generate()
+            resume: Continue from next_index, as for generate()
+
+        Returns:
+            AsyncRecordStream yielding lists of (record_kind, record) tuples
+        """
+        # Imported on use: asyncio is slow to import
+        from .aio import AsyncRecordStream
+
+        return AsyncRecordStream(
+            self.generate_stream(data_volume, include_service_requests, start_index, resume),
+            batch_size=batch_size,
+            max_pending=max_pending
+        )
+
+    def generate_batch(
+        self,
+        n: int,
+        include_service_requests: bool = True,
+        start_index: int = 0
+    ) -> "RecordBatch":
+        """
+        Generate a batch of records with the batch engine.
+
+        The indices into the name, address and service tables are drawn
+        with one random.choices() call per column and held as
+        struct-of-arrays; record dicts are only built when the batch is
+        indexed or iterated. Output is
+        deterministic for a given seed and call sequence.
+
+        Unlike generate(), names within a batch are not deduplicated.
+
+        Args:
+            n: Number of residents (and service requests) to generate
+            include_service_requests: Whether to generate service requests
+            start_index: Index of the first record, used for ids and references
+
+        Returns:
+            RecordBatch with lazily materialised residents and service requests
+
+        Raises:
+            ValueError: If the generator uses households, unique addresses,
+                compact records or counter-based mode, none of which the
+                batch engine implements
+        """
+        unsupported = {
+            "households": self.households,
+            "unique_addresses": self.unique_addresses,
+            "compact": self.compact,
+            "counter_based": self.counter_based
+        }
+        for option, enabled in unsupported.items():
+            if enabled:
+                raise ValueError(f"generate_batch() does not support {option}=True")
+
+        from .batch import RecordBatch, ResidentBatch, ServiceRequestBatch
+
+        residents = ResidentBatch(
+            self.config,
+            self.random,
+            n,
+            start_index,
+            self.council_name,
+            self.region,
+            self.clock.iso,
+            weighted=self.weighted
+        )
+
+        service_requests = []
+        if include_service_requests:
+            service_requests = ServiceRequestBatch(
+                self.config, self.random, n, start_index, self.clock, weighted=self.weighted
+            )
+
+        return RecordBatch(residents, service_requests)
+
+    def _build_metadata(
+        self,
+        data_volume: int,
+        start_time: datetime,
+        end_time: datetime,
+        start_index: int = 0,
+        profile: Optional[Dict[str, Any]] = None,
+        digest: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build dataset metadata for a completed generation run."""
+        metadata = {
+            "councilName": self.council_name,
+            "region": self.region,
+            "generatedAt": end_time.isoformat(),
+            "generationTime": (end_time - start_time).total_seconds(),
+            "seed": self.seed,
+            "referenceTime": self.clock.iso,
+            "startIndex": start_index,
+            "dataVolume": data_volume,
+            "sampleMarker": SAMPLE_DATA_MARKER,
+            "version": "1.0.0"
+        }
+        if digest is not None:
+            from .digest import DIGEST_ALGORITHM
+
+            metadata["digest"] = digest
+            metadata["digestAlgorithm"] = DIGEST_ALGORITHM
+        if profile is not None:
+            metadata["profile"] = profile
+        return metadata
+
+    def _start_profile(self) -> int:
+        """Start a profiled run; returns the name retry count so far."""
+        if self.profiler is None:
+            return 0
+        self.profiler.start_run()
+        return self.name_generator.cycle_walks
+
+    def _finish_profile(self, records: int, retries_before: int) -> Optional[Dict[str, Any]]:
+        """Finish a profiled run and return its report, or None if not profiling."""
+        if self.profiler is None:
+            return None
+        return self.profiler.finish_run(
+            records, self.name_generator.cycle_walks - retries_before
+        )
+
     def validate_data(self, data: Dict[str, Any]) -> bool:
         """
         Validate generated data structure.
 
+        If the metadata records a digest, the records are re-digested and
+        must match it, which catches any record altered, lost or reordered
+        since generation.
+
         Args:
             data: Generated dataset
 
@@ -421,4 +1517,14 @@ class CouncilDataGenerator:
         if len(data["serviceRequests"]) != data["recordCounts"]["serviceRequests"]:
             raise ValueError("Service request count mismatch")
 
+        expected = data["metadata"].get("digest")
+        if expected is not None:
+            from .digest import DIGEST_ALGORITHM, dataset_digest
+
+            algorithm = data["metadata"].get("digestAlgorithm", DIGEST_ALGORITHM)
+            if algorithm != DIGEST_ALGORITHM:
+                raise ValueError(f"Unsupported digest algorithm {algorithm}")
+            if dataset_digest(data["residents"], data["serviceRequests"]) != expected:
+                raise ValueError("Dataset digest mismatch")
+
         return True
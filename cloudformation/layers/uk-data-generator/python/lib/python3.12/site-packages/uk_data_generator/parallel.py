@@ -0,0 +1,259 @@
+"""
+Multi-process sharded generation for UK council sample data.
+
+Splits the record index range into contiguous shards, generates each shard
+in a separate process using counter-based mode, and merges the shards in
+index order. Because counter-based records depend only on (seed, index),
+the merged output is identical to single-process generation.
+
+generate_councils() runs whole councils, rather than shards of one
+council, across the same kind of pool.
+
+Note: AWS Lambda does not provide /dev/shm, so process pools are not
+available there. Use sharding on multi-core build hosts and backfills.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+)
+
+if TYPE_CHECKING:
+    from .profiling import GenerationProfiler
+
+
+def shard_ranges(total: int, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split [0, total) into contiguous (start, count) ranges.
+
+    Args:
+        total: Number of records
+        shards: Number of shards
+
+    Returns:
+        List of (start_index, count) tuples in index order, without empty shards
+    """
+    if shards < 1:
+        raise ValueError("Number of shards must be at least 1")
+
+    base, remainder = divmod(total, shards)
+    ranges = []
+    start = 0
+    for shard in range(shards):
+        count = base + (1 if shard < remainder else 0)
+        if count:
+            ranges.append((start, count))
+        start += count
+
+    return ranges
+
+
+def _generate_shard(
+    generator_config: Dict[str, Any],
+    start_index: int,
+    count: int,
+    include_service_requests: bool,
+    profile: bool = False
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Generate one shard in a worker process, with its stage timings if profiling."""
+    # Imported here to avoid a circular import with generators
+    from .generators import CouncilDataGenerator
+
+    profiler = None
+    if profile:
+        from .profiling import GenerationProfiler
+
+        profiler = GenerationProfiler()
+    generator = CouncilDataGenerator(profiler=profiler, **generator_config)
+    residents = list(generator.iter_residents(count, start_index))
+    service_requests = []
+    if include_service_requests:
+        service_requests = list(generator.iter_service_requests(count, start_index))
+
+    stages = profiler.report()["stages"] if profiler is not None else None
+    return residents, service_requests, stages
+
+
+def generate_sharded(
+    generator_config: Dict[str, Any],
+    data_volume: int,
+    include_service_requests: bool,
+    workers: int,
+    start_index: int = 0,
+    profiler: Optional["GenerationProfiler"] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Generate residents and service requests across a process pool.
+
+    Args:
+        generator_config: CouncilDataGenerator constructor arguments; must
+            select counter-based mode with a concrete seed
+        data_volume: Number of residents (and service requests)
+        include_service_requests: Whether to generate service requests
+        workers: Number of worker processes
+        start_index: Index of the first record
+        profiler: Profiler of the current run; each shard's stage timings
+            are added to it
+
+    Returns:
+        Tuple of (residents, service_requests) merged in index order
+    """
+    ranges = shard_ranges(data_volume, workers)
+    residents: List[Dict[str, Any]] = []
+    service_requests: List[Dict[str, Any]] = []
+
+    with ProcessPoolExecutor(max_workers=len(ranges) or 1) as executor:
+        futures = [
+            executor.submit(
+                _generate_shard,
+                generator_config,
+                start_index + start,
+                count,
+                include_service_requests,
+                profiler is not None
+            )
+            for start, count in ranges
+        ]
+
+        # Merge in submission (index) order regardless of completion order
+        for future in futures:
+            shard_residents, shard_requests, stages = future.result()
+            residents.extend(shard_residents)
+            service_requests.extend(shard_requests)
+            if stages is not None:
+                profiler.add_stages(stages)
+
+    return residents, service_requests
+
+
+class CouncilSpec(NamedTuple):
+    """One council's dataset in a generate_councils() batch."""
+    council_name: str
+    region: str
+    data_volume: int = 100
+    seed: Optional[int] = None
+
+
+def _warm_worker() -> None:
+    """Compile the configuration tables once per worker process."""
+    from .compiled import get_compiled_config
+
+    get_compiled_config()
+
+
+def _generate_council(
+    spec: CouncilSpec,
+    generator_options: Dict[str, Any],
+    include_service_requests: bool
+) -> Dict[str, Any]:
+    """Generate one council's dataset."""
+    # Imported here to avoid a circular import with generators
+    from .generators import CouncilDataGenerator
+
+    generator = CouncilDataGenerator(
+        seed=spec.seed,
+        council_name=spec.council_name,
+        region=spec.region,
+        **generator_options
+    )
+    return generator.generate(spec.data_volume, include_service_requests)
+
+
+def generate_councils(
+    specs: Iterable[Sequence[Any]],
+    workers: int = 1,
+    include_service_requests: bool = True,
+    ordered: bool = False,
+    reference_time: Optional[datetime] = None,
+    **generator_options: Any
+) -> Iterator[Tuple[CouncilSpec, Dict[str, Any]]]:
+    """
+    Generate datasets for many councils, yielding each as it completes.
+
+    Every generator shares the process-wide compiled configuration, and
+    worker processes are reused across councils, so per-council setup is
+    only the seeded sub-generator state. At most two councils per worker
+    are in flight at a time, so finished datasets do not pile up while the
+    consumer is busy.
+
+    Example:
+        specs = [("Leeds City Council", "Yorkshire", 10_000, 1),
+                 ("Bristol City Council", "South West", 5_000, 2)]
+        for spec, data in generate_councils(specs, workers=4):
+            upload(spec.council_name, data)
+
+    Args:
+        specs: CouncilSpec or (council_name, region, data_volume, seed) tuples
+        workers: Worker processes; 1 generates in this process, which also
+            works where process pools are unavailable (e.g. AWS Lambda)
+        include_service_requests: Whether to generate service requests
+        ordered: Yield datasets in spec order rather than completion order
+        reference_time: Time every council's timestamps are relative to;
+            defaults to the current time, captured once for the whole batch
+        **generator_options: Other CouncilDataGenerator arguments applied to
+            every council (e.g. counter_based, weighted, households)
+
+    Returns:
+        Iterator of (spec, dataset) tuples, datasets as returned by generate()
+    """
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+    for option in ("seed", "council_name", "region", "config", "profiler"):
+        if option in generator_options:
+            raise ValueError(f"{option} cannot be set for a batch of councils")
+
+    generator_options["reference_time"] = reference_time or datetime.now()
+    specs = (spec if isinstance(spec, CouncilSpec) else CouncilSpec(*spec) for spec in specs)
+    return _iter_councils(specs, workers, include_service_requests, ordered, generator_options)
+
+
+def _iter_councils(
+    specs: Iterator[CouncilSpec],
+    workers: int,
+    include_service_requests: bool,
+    ordered: bool,
+    generator_options: Dict[str, Any]
+) -> Iterator[Tuple[CouncilSpec, Dict[str, Any]]]:
+    """Generate councils for generate_councils(), keeping a bounded window in flight."""
+    if workers == 1:
+        for spec in specs:
+            yield spec, _generate_council(spec, generator_options, include_service_requests)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as executor:
+        pending = {}
+        submitted = 0
+        next_to_yield = 0
+        finished: Dict[int, Tuple[CouncilSpec, Dict[str, Any]]] = {}
+
+        def submit_next() -> bool:
+            nonlocal submitted
+            spec = next(specs, None)
+            if spec is None:
+                return False
+            future = executor.submit(
+                _generate_council, spec, generator_options, include_service_requests
+            )
+            pending[future] = (submitted, spec)
+            submitted += 1
+            return True
+
+        while True:
+            while len(pending) + len(finished) < 2 * workers and submit_next():
+                pass
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                position, spec = pending.pop(future)
+                finished[position] = (spec, future.result())
+
+            if ordered:
+                while next_to_yield in finished:
+                    yield finished.pop(next_to_yield)
+                    next_to_yield += 1
+            else:
+                for position in sorted(finished):
+                    yield finished.pop(position)
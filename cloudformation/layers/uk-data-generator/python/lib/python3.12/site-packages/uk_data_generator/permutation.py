@@ -0,0 +1,85 @@
+"""
+Seeded bijective index permutations.
+
+Maps every index in [0, size) to a distinct index in [0, size) using a
+small Feistel network with cycle walking. Because the mapping is a
+bijection, allocating the next unique combination from a finite space
+costs constant time and needs no record of what has already been used.
+"""
+
+from typing import Optional
+import random
+
+# Feistel rounds; four rounds are plenty for shuffling sample data
+FEISTEL_ROUNDS = 4
+
+_ROUND_MULTIPLIER = 0x45D9F3B
+_WORD_MASK = 0xFFFFFFFF
+
+
+class IndexPermutation:
+    """
+    Seeded random permutation of the integers [0, size).
+
+    Indices are encrypted with a balanced Feistel network over the smallest
+    even-width bit domain that covers size. Results that fall outside the
+    range are re-encrypted (cycle walking); because the domain is less than
+    four times size, that takes fewer than four rounds on average.
+
+    Example:
+        perm = IndexPermutation(750, key=42)
+        perm[0], perm[1], ...  # every value in 0..749 exactly once
+    """
+
+    def __init__(self, size: int, key: Optional[int] = None):
+        """
+        Initialize permutation.
+
+        Args:
+            size: Number of elements in the permuted range
+            key: Permutation key; None draws a random key
+        """
+        if size < 1:
+            raise ValueError("Permutation size must be at least 1")
+
+        self.size = size
+        self.key = key if key is not None else random.getrandbits(64)
+
+        half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_bits = half_bits
+        self._half_mask = (1 << half_bits) - 1
+
+        key_random = random.Random(self.key)
+        self._round_keys = tuple(
+            key_random.getrandbits(32) for _ in range(FEISTEL_ROUNDS)
+        )
+
+        # Extra encryptions caused by cycle walking, for instrumentation
+        self.cycle_walks = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError("Permutation index out of range")
+
+        value = self._encrypt(index)
+        while value >= self.size:
+            self.cycle_walks += 1
+            value = self._encrypt(value)
+
+        return value
+
+    def _encrypt(self, value: int) -> int:
+        half_bits = self._half_bits
+        half_mask = self._half_mask
+        left = value >> half_bits
+        right = value & half_mask
+
+        for round_key in self._round_keys:
+            mixed = ((right ^ round_key) * _ROUND_MULTIPLIER) & _WORD_MASK
+            mixed ^= mixed >> 16
+            left, right = right, left ^ (mixed & half_mask)
+
+        return (left << half_bits) | right
@@ -0,0 +1,219 @@
+"""
+Compact record types for UK council sample data.
+
+A resident built as nested dicts costs three dict objects and repeats every
+key, the sample marker, council name and region per record. The classes
+here store only the varying fields in __slots__ and derive the rest
+(full name, formatted address, ids and references, sample markers) on
+demand, which cuts memory several-fold for large in-memory datasets.
+
+Every record converts to the exact dict the generators produce by default
+with to_dict(), or to JSON with to_json().
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+from .config import SAMPLE_DATA_MARKER, SAMPLE_DATA_PREFIX
+
+
+class Record(ABC):
+    """Base class for compact records; subclasses must implement to_dict()."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as the generators' nested dict format."""
+
+    def to_json(self, **kwargs) -> str:
+        """Return the record as JSON; kwargs are passed to json.dumps()."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def _values(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class NameRecord(Record):
+    """UK name; fullName is derived."""
+
+    __slots__ = ("first_name", "last_name", "gender")
+
+    def __init__(self, first_name: str, last_name: str, gender: str):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.gender = gender
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "firstName": self.first_name,
+            "lastName": self.last_name,
+            "fullName": self.full_name,
+            "gender": self.gender,
+            "sampleMarker": SAMPLE_DATA_MARKER
+        }
+
+
+class AddressRecord(Record):
+    """UK address; addressLine1 and formattedAddress are derived."""
+
+    __slots__ = ("street_number", "street_name", "street_type", "district", "city", "postcode")
+
+    def __init__(
+        self,
+        street_number: int,
+        street_name: str,
+        street_type: str,
+        district: str,
+        city: str,
+        postcode: str
+    ):
+        self.street_number = street_number
+        self.street_name = street_name
+        self.street_type = street_type
+        self.district = district
+        self.city = city
+        self.postcode = postcode
+
+    @property
+    def address_line1(self) -> str:
+        return f"{self.street_number} {self.street_name} {self.street_type}"
+
+    @property
+    def formatted_address(self) -> str:
+        return f"{self.address_line1}, {self.district}, {self.city}, {self.postcode}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        address_line1 = self.address_line1
+        return {
+            "addressLine1": address_line1,
+            "addressLine2": self.district,
+            "city": self.city,
+            "postcode": self.postcode,
+            "formattedAddress": f"{address_line1}, {self.district}, {self.city}, {self.postcode}",
+            "sampleMarker": SAMPLE_DATA_MARKER
+        }
+
+
+class ResidentRecord(Record):
+    """
+    Resident with a name and address; residentId is derived from the index.
+
+    council_name, region and created_at are shared string references. In
+    household mode, household_index is the index of the household's first
+    resident and address is shared by every member.
+    """
+
+    __slots__ = (
+        "index", "name", "address", "council_name", "region", "created_at", "household_index"
+    )
+
+    def __init__(
+        self,
+        index: int,
+        name: NameRecord,
+        address: AddressRecord,
+        council_name: str,
+        region: str,
+        created_at: str,
+        household_index: Optional[int] = None
+    ):
+        self.index = index
+        self.name = name
+        self.address = address
+        self.council_name = council_name
+        self.region = region
+        self.created_at = created_at
+        self.household_index = household_index
+
+    @property
+    def resident_id(self) -> str:
+        return f"{SAMPLE_DATA_PREFIX} RES-{self.index:06d}"
+
+    @property
+    def household_id(self) -> Optional[str]:
+        if self.household_index is None:
+            return None
+        return f"{SAMPLE_DATA_PREFIX} HH-{self.household_index:06d}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = {
+            "residentId": self.resident_id,
+            "name": self.name.to_dict(),
+            "address": self.address.to_dict(),
+            "councilName": self.council_name,
+            "region": self.region,
+            "createdAt": self.created_at,
+            "sampleMarker": SAMPLE_DATA_MARKER
+        }
+        if self.household_index is not None:
+            record["householdId"] = self.household_id
+        return record
+
+
+class ServiceRequestRecord(Record):
+    """Council service request; the reference is derived from its parts."""
+
+    __slots__ = (
+        "index", "category", "code", "request_type", "status", "priority",
+        "month", "submitted_at", "last_updated"
+    )
+
+    def __init__(
+        self,
+        index: int,
+        category: str,
+        code: str,
+        request_type: str,
+        status: str,
+        priority: str,
+        month: str,
+        submitted_at: str,
+        last_updated: str
+    ):
+        self.index = index
+        self.category = category
+        self.code = code
+        self.request_type = request_type
+        self.status = status
+        self.priority = priority
+        self.month = month
+        self.submitted_at = submitted_at
+        self.last_updated = last_updated
+
+    @property
+    def reference(self) -> str:
+        return f"{SAMPLE_DATA_PREFIX} {self.code}-{self.month}-{self.index:05d}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "reference": self.reference,
+            "category": self.category,
+            "requestType": self.request_type,
+            "status": self.status,
+            "priority": self.priority,
+            "submittedAt": self.submitted_at,
+            "lastUpdated": self.last_updated,
+            "sampleMarker": SAMPLE_DATA_MARKER
+        }
+
+
+def as_dict(record: Any) -> Dict[str, Any]:
+    """Return a record as a dict, converting compact records."""
+    return record.to_dict() if isinstance(record, Record) else record
@@ -0,0 +1,206 @@
+"""
+Random sources derived from a dataset seed.
+
+Counter-based draws: every record's draws are derived from a keyed BLAKE2b
+hash of (seed, stream, index), so record N can be produced without
+generating records 0..N-1. This is the basis for slicing, sharding and
+spot-checking large datasets.
+
+Sequential draws: spawn_random() gives each named stream of a seed its own
+random.Random seeded from a hash of (seed, stream), in the manner of
+NumPy's SeedSequence.spawn(), so generators sharing one dataset seed draw
+from independent streams instead of replaying the same one.
+"""
+
+import hashlib
+import random
+import struct
+from typing import Any, List, Optional, Sequence
+
+_WORDS_PER_BLOCK = 16
+_BLOCK_FORMAT = "<16I"
+_COUNTER_FORMAT = "<QQ"
+_SPAWN_PERSON = b"uk-data-spawn"
+
+
+def _seed_key(seed: int) -> bytes:
+    """Hash key for every stream derived from a seed."""
+    return hashlib.blake2b(str(seed).encode("utf-8"), digest_size=64).digest()
+
+
+def spawn_random(seed: Optional[int], stream: str) -> random.Random:
+    """
+    Return an independent sequential random source for a named stream.
+
+    The source is a random.Random seeded with a 256-bit BLAKE2b hash of
+    (seed, stream), so different streams of one seed are decorrelated and
+    adding a stream never shifts the draws of another. Bulk draws
+    (choices(k=...), getrandbits(), randbytes()) work as usual.
+
+    Args:
+        seed: Dataset seed; None seeds from OS entropy
+        stream: Stream name
+
+    Returns:
+        Seeded random.Random
+    """
+    if seed is None:
+        return random.Random()
+
+    digest = hashlib.blake2b(
+        stream.encode("utf-8"), digest_size=32, key=_seed_key(seed), person=_SPAWN_PERSON
+    ).digest()
+    return random.Random(int.from_bytes(digest, "little"))
+
+
+class CounterRandom:
+    """
+    Deterministic draw source for a single record.
+
+    Provides the subset of the random.Random interface used by the
+    generators (random, randint, randrange, choice, choices, getrandbits),
+    drawing 32-bit words from successive hash blocks of (seed, stream,
+    index). Instances are cheap and intended to be used for one record.
+    """
+
+    __slots__ = ("_base", "_index", "_block", "_words", "_position")
+
+    def __init__(self, base: Any, index: int):
+        """
+        Initialize draws for one record.
+
+        Args:
+            base: Keyed hash object for the (seed, stream) pair
+            index: Record index within the stream
+        """
+        if index < 0:
+            raise ValueError("Counter index must be non-negative")
+
+        self._base = base
+        self._index = index
+        self._block = 0
+        self._refill()
+
+    def _refill(self) -> None:
+        hasher = self._base.copy()
+        hasher.update(struct.pack(_COUNTER_FORMAT, self._index, self._block))
+        self._words = struct.unpack(_BLOCK_FORMAT, hasher.digest())
+        self._position = 0
+        self._block += 1
+
+    def _next_word(self) -> int:
+        if self._position == _WORDS_PER_BLOCK:
+            self._refill()
+        word = self._words[self._position]
+        self._position += 1
+        return word
+
+    def getrandbits(self, k: int) -> int:
+        """Return an integer with k random bits."""
+        value = 0
+        bits = 0
+        while bits < k:
+            value |= self._next_word() << bits
+            bits += 32
+        return value & ((1 << k) - 1)
+
+    def randbelow(self, n: int) -> int:
+        """Return a random integer in [0, n)."""
+        if n <= 0:
+            raise ValueError("Upper bound must be positive")
+        if n <= 0xFFFFFFFF:
+            # Multiply-shift reduction; bias is at most n / 2**32
+            return (self._next_word() * n) >> 32
+
+        k = n.bit_length()
+        value = self.getrandbits(k)
+        while value >= n:
+            value = self.getrandbits(k)
+        return value
+
+    def random(self) -> float:
+        """Return a random float in [0.0, 1.0)."""
+        high = self._next_word() >> 5
+        low = self._next_word() >> 6
+        return (high * 67108864.0 + low) * (1.0 / 9007199254740992.0)
+
+    def randrange(self, start: int, stop: Optional[int] = None) -> int:
+        """Return a random integer from range(start, stop)."""
+        if stop is None:
+            return self.randbelow(start)
+        return start + self.randbelow(stop - start)
+
+    def randint(self, a: int, b: int) -> int:
+        """Return a random integer in [a, b], including both end points."""
+        return a + self.randbelow(b - a + 1)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        """Return a random element from a non-empty sequence."""
+        return seq[self.randbelow(len(seq))]
+
+    def choices(self, population: Sequence[Any], k: int = 1) -> List[Any]:
+        """Return k elements chosen uniformly with replacement."""
+        n = len(population)
+        return [population[self.randbelow(n)] for _ in range(k)]
+
+
+class CounterStream:
+    """
+    Family of random-access draw sources for one (seed, stream) pair.
+
+    Example:
+        stream = CounterStream(42, "address")
+        rng = stream.at(5_000_000)  # draws for record 5,000,000 only
+    """
+
+    def __init__(self, seed: Optional[int], stream: str):
+        """
+        Initialize counter stream.
+
+        Args:
+            seed: Dataset seed; None draws a random key
+            stream: Stream name separating independent draw families
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        self.seed = seed
+        self.stream = stream
+        self._base = hashlib.blake2b(stream.encode("utf-8"), digest_size=64, key=_seed_key(seed))
+
+    def at(self, index: int) -> CounterRandom:
+        """Return the draw source for a record index."""
+        return CounterRandom(self._base, index)
+
+
+def dump_random_state(rng: random.Random) -> List[Any]:
+    """
+    Return the state of a random.Random as a JSON-serialisable list.
+
+    Args:
+        rng: Generator whose state to capture
+
+    Returns:
+        [version, internal state words, gauss_next], as from getstate()
+    """
+    version, internal_state, gauss_next = rng.getstate()
+    return [version, list(internal_state), gauss_next]
+
+
+def load_random_state(rng: random.Random, state: Sequence[Any]) -> None:
+    """
+    Restore random.Random state captured by dump_random_state().
+
+    Args:
+        rng: Generator to restore
+        state: Value returned by dump_random_state(), possibly after a JSON
+            round trip
+
+    Raises:
+        ValueError: If the state is malformed
+    """
+    try:
+        version, internal_state, gauss_next = state
+        rng.setstate((version, tuple(internal_state), gauss_next))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid random state: {e}")
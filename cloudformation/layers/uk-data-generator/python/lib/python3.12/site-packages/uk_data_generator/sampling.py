@@ -0,0 +1,159 @@
+"""
+Weighted sampling with Vose's alias method.
+
+An AliasTable is built once from a list of weights in O(n); afterwards
+every weighted draw costs one uniform random number and two table lookups,
+the same as an unweighted choice. random.choices with weights, by
+contrast, bisects cumulative weights on every draw.
+"""
+
+from math import exp, floor, lgamma, log, sqrt
+from typing import Any, List, Sequence, Tuple
+
+# Rates from which poisson() switches from multiplication to PTRS
+_PTRS_THRESHOLD = 10.0
+
+
+class AliasTable:
+    """
+    Constant-time sampler for a discrete weighted distribution.
+
+    Example:
+        table = AliasTable([1140, 550, 810])
+        index = table.sample(rng)  # 0, 1 or 2 in proportion to weight
+    """
+
+    __slots__ = ("size", "_probability", "_alias")
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Build alias table.
+
+        Args:
+            weights: Non-negative weights, at least one of them positive
+        """
+        size = len(weights)
+        if size == 0:
+            raise ValueError("AliasTable needs at least one weight")
+        if any(w < 0 for w in weights):
+            raise ValueError("Weights must be non-negative")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("At least one weight must be positive")
+
+        scaled = [w * size / total for w in weights]
+        probability = [0.0] * size
+        alias = [0] * size
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Whatever remains is 1.0 up to floating point error
+        for i in large + small:
+            probability[i] = 1.0
+            alias[i] = i
+
+        self.size = size
+        self._probability: Tuple[float, ...] = tuple(probability)
+        self._alias: Tuple[int, ...] = tuple(alias)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def sample(self, rng: Any) -> int:
+        """
+        Draw one index.
+
+        A single uniform draw selects both the column and the coin flip.
+
+        Args:
+            rng: random.Random-compatible draw source
+
+        Returns:
+            Index into the weighted table
+        """
+        u = rng.random() * self.size
+        column = int(u)
+        if u - column < self._probability[column]:
+            return column
+        return self._alias[column]
+
+    def sample_many(self, rng: Any, count: int) -> List[int]:
+        """
+        Draw count indices in one bulk pass.
+
+        Args:
+            rng: random.Random-compatible draw source
+            count: Number of indices to draw
+
+        Returns:
+            List of indices
+        """
+        size = self.size
+        probability = self._probability
+        alias = self._alias
+        rand = rng.random
+        result = []
+        append = result.append
+        for _ in range(count):
+            u = rand() * size
+            column = int(u)
+            append(column if u - column < probability[column] else alias[column])
+        return result
+
+
+def poisson(rng: Any, lam: float) -> int:
+    """
+    Draw a Poisson-distributed count.
+
+    Small rates multiply uniforms (Knuth); rates of 10 and above use
+    Hormann's transformed rejection (PTRS), which needs about two uniforms
+    per draw however large the rate.
+
+    Args:
+        rng: random.Random-compatible draw source
+        lam: Expected count (non-negative)
+
+    Returns:
+        Count
+    """
+    if lam < _PTRS_THRESHOLD:
+        if lam <= 0:
+            return 0
+        limit = exp(-lam)
+        count = 0
+        product = rng.random()
+        while product > limit:
+            count += 1
+            product *= rng.random()
+        return count
+
+    slam = sqrt(lam)
+    log_lam = log(lam)
+    b = 0.931 + 2.53 * slam
+    a = -0.059 + 0.02483 * b
+    inv_alpha = 1.1239 + 1.1328 / (b - 3.4)
+    v_r = 0.9277 - 3.6224 / (b - 2)
+
+    while True:
+        u = rng.random() - 0.5
+        v = rng.random()
+        us = 0.5 - abs(u)
+        k = floor((2 * a / us + b) * u + lam + 0.43)
+        if us >= 0.07 and v <= v_r:
+            return k
+        if k < 0 or (us < 0.013 and v > us):
+            continue
+        if (log(v) + log(inv_alpha) - log(a / (us * us) + b)
+                <= -lam + k * log_lam - lgamma(k + 1)):
+            return k
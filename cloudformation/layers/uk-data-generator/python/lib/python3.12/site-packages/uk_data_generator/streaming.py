@@ -0,0 +1,101 @@
+"""
+Streaming dataset support for UK council sample data.
+
+Records are yielded lazily so peak memory stays constant regardless of
+data volume. Metadata and record counts become available once the stream
+has been fully consumed, along with the dataset's content digest.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .digest import DatasetDigest
+
+# Record kinds yielded by DatasetStream
+RESIDENT = "resident"
+SERVICE_REQUEST = "serviceRequest"
+
+
+class DatasetStream:
+    """
+    Lazily generated dataset.
+
+    Iterating yields (record_kind, record) tuples in the same order that
+    CouncilDataGenerator.generate() builds its lists: all residents first,
+    then all service requests. Once exhausted, metadata and recordCounts
+    are populated. If a digest is given, every record is added to it as it
+    is yielded, so the generator can record it in metadata.
+
+    A stream can only be consumed once.
+    """
+
+    def __init__(
+        self,
+        residents: Iterator[Dict[str, Any]],
+        service_requests: Iterator[Dict[str, Any]],
+        build_metadata: Callable[[], Dict[str, Any]],
+        digest: Optional["DatasetDigest"] = None
+    ):
+        """
+        Initialize dataset stream.
+
+        Args:
+            residents: Iterator of resident records
+            service_requests: Iterator of service request records
+            build_metadata: Called once the stream is exhausted to build metadata
+            digest: Optional digest updated with every record yielded
+        """
+        self._residents = residents
+        self._service_requests = service_requests
+        self._build_metadata = build_metadata
+        self._digest = digest
+        self._counts = {"residents": 0, "serviceRequests": 0}
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._started = False
+
+    def __iter__(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        if self._started:
+            raise RuntimeError("DatasetStream can only be consumed once")
+        self._started = True
+        return self._records()
+
+    def _records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        counts = self._counts
+        digest = self._digest
+
+        for resident in self._residents:
+            counts["residents"] += 1
+            if digest is not None:
+                digest.update(RESIDENT, resident)
+            yield RESIDENT, resident
+
+        for request in self._service_requests:
+            counts["serviceRequests"] += 1
+            if digest is not None:
+                digest.update(SERVICE_REQUEST, request)
+            yield SERVICE_REQUEST, request
+
+        self._metadata = self._build_metadata()
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every record has been yielded."""
+        return self._metadata is not None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Dataset metadata, available once the stream is exhausted."""
+        if self._metadata is None:
+            raise RuntimeError("Metadata is only available once the stream is exhausted")
+        return self._metadata
+
+    @property
+    def record_counts(self) -> Dict[str, int]:
+        """Record counts, available once the stream is exhausted."""
+        if self._metadata is None:
+            raise RuntimeError("Record counts are only available once the stream is exhausted")
+        return {
+            "residents": self._counts["residents"],
+            "serviceRequests": self._counts["serviceRequests"],
+            "total": self._counts["residents"] + self._counts["serviceRequests"]
+        }
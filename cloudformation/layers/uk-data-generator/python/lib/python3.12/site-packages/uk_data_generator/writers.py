@@ -0,0 +1,279 @@
+"""
+Streaming writers for generated UK council sample data.
+
+Writers take a stream of records and write them straight to any file-like
+object through a bounded buffer, so a dataset never needs to be held in
+memory or serialised as one giant JSON document.
+
+Formats:
+- NDJSONWriter: one JSON object per line
+- CSVWriter: flattened columns (name.firstName, address.postcode, ...)
+
+Either writer can gzip its output with compress=True, and both accept
+compact records (records.py) as well as dicts.
+"""
+
+import csv
+import io
+import json
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Union
+from .profiling import SERIALISATION, GenerationProfiler
+from .records import as_dict
+
+# Default bounded buffer size before data is flushed to the file object
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# zlib window bits selecting a gzip container
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def flatten_record(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten nested dicts into dotted column names.
+
+    Example:
+        {"name": {"firstName": "James"}} -> {"name.firstName": "James"}
+
+    Args:
+        record: Record to flatten
+        prefix: Column name prefix for nested values
+
+    Returns:
+        Flat dict of column name -> value
+    """
+    flat = {}
+    for key, value in record.items():
+        column = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, f"{column}."))
+        else:
+            flat[column] = value
+    return flat
+
+
+class RecordWriter(ABC):
+    """
+    Base class for buffered record writers.
+
+    Encoded records accumulate in a bounded buffer that is flushed to the
+    file object whenever it reaches buffer_size. Subclasses implement
+    _encode() to turn a record into text.
+
+    Attributes:
+        records_written: Number of records written
+        bytes_written: Bytes written to the file object (after compression)
+    """
+
+    def __init__(
+        self,
+        fileobj: Union[BinaryIO, io.TextIOBase],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compress: bool = False,
+        compress_level: int = 6,
+        profiler: Optional[GenerationProfiler] = None
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            fileobj: Binary or text file-like object to write to; must be
+                binary when compress is True
+            buffer_size: Buffered characters before flushing
+            compress: Write gzip-compressed output
+            compress_level: zlib compression level (1-9)
+            profiler: Optional profiler; encoding and flushing are timed as
+                its "serialisation" stage
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+
+        self._text_output = isinstance(fileobj, io.TextIOBase)
+        if compress and self._text_output:
+            raise ValueError("Compressed output requires a binary file object")
+
+        self.fileobj = fileobj
+        self.buffer_size = buffer_size
+        self._compressor = (
+            zlib.compressobj(compress_level, zlib.DEFLATED, _GZIP_WBITS)
+            if compress else None
+        )
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        self.closed = False
+
+        self.records_written = 0
+        self.bytes_written = 0
+
+        if profiler is not None:
+            self._encode = profiler.wrap(SERIALISATION, self._encode)
+            self._drain = profiler.wrap(SERIALISATION, self._drain)
+
+    @abstractmethod
+    def _encode(self, record: Dict[str, Any]) -> str:
+        """Encode one record as text, including any line terminator."""
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write a single record."""
+        if self.closed:
+            raise ValueError("Writer is closed")
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+
+        text = self._encode(record)
+        self._buffer.append(text)
+        self._buffered += len(text)
+        self.records_written += 1
+
+        if self._buffered >= self.buffer_size:
+            self._drain()
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write every record from an iterable.
+
+        Args:
+            records: Record stream, e.g. CouncilDataGenerator.iter_residents()
+
+        Returns:
+            Number of records written by this call
+        """
+        before = self.records_written
+        for record in records:
+            self.write(record)
+        return self.records_written - before
+
+    def _drain(self) -> None:
+        """Move buffered text to the file object."""
+        if not self._buffer:
+            return
+
+        text = "".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+
+        if self._text_output:
+            self.fileobj.write(text)
+            self.bytes_written += len(text.encode("utf-8"))
+            return
+
+        data = text.encode("utf-8")
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        if data:
+            self.fileobj.write(data)
+            self.bytes_written += len(data)
+
+    def flush(self) -> None:
+        """Flush buffered records to the file object."""
+        self._drain()
+        if hasattr(self.fileobj, "flush"):
+            self.fileobj.flush()
+
+    def close(self) -> None:
+        """Flush remaining records and finish compressed output.
+
+        The underlying file object is left open.
+        """
+        if self.closed:
+            return
+
+        self._drain()
+        if self._compressor is not None:
+            tail = self._compressor.flush()
+            self.fileobj.write(tail)
+            self.bytes_written += len(tail)
+        if hasattr(self.fileobj, "flush"):
+            self.fileobj.flush()
+
+        self._end_time = time.perf_counter()
+        self.closed = True
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds between the first write and close (or now)."""
+        if self._start_time is None:
+            return 0.0
+        end = self._end_time if self._end_time is not None else time.perf_counter()
+        return end - self._start_time
+
+    @property
+    def records_per_second(self) -> float:
+        """Write throughput in records per second."""
+        elapsed = self.elapsed_seconds
+        return self.records_written / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Write throughput in output bytes per second."""
+        elapsed = self.elapsed_seconds
+        return self.bytes_written / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Writer counters as a dict suitable for logging or metadata."""
+        return {
+            "recordsWritten": self.records_written,
+            "bytesWritten": self.bytes_written,
+            "elapsedSeconds": self.elapsed_seconds,
+            "recordsPerSecond": self.records_per_second,
+            "bytesPerSecond": self.bytes_per_second
+        }
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class NDJSONWriter(RecordWriter):
+    """Write records as newline-delimited JSON."""
+
+    def __init__(self, fileobj, **kwargs):
+        super().__init__(fileobj, **kwargs)
+        self._dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        return self._dumps(as_dict(record)) + "\n"
+
+
+class CSVWriter(RecordWriter):
+    """
+    Write records as CSV with nested fields flattened into columns.
+
+    Columns are taken from fieldnames or, if not given, from the first
+    record written. A header row is written before the first record.
+    """
+
+    def __init__(self, fileobj, fieldnames: Optional[List[str]] = None, **kwargs):
+        """
+        Initialize CSV writer.
+
+        Args:
+            fileobj: File-like object to write to
+            fieldnames: Flattened column names; defaults to the first record's
+            **kwargs: RecordWriter options (buffer_size, compress, ...)
+        """
+        super().__init__(fileobj, **kwargs)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self._line = io.StringIO()
+        self._csv_writer = csv.writer(self._line, lineterminator="\n")
+
+    def _row(self, values: List[Any]) -> str:
+        self._line.seek(0)
+        self._line.truncate()
+        self._csv_writer.writerow(values)
+        return self._line.getvalue()
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        flat = flatten_record(as_dict(record))
+        header = ""
+        if self.fieldnames is None:
+            self.fieldnames = list(flat)
+        if self.records_written == 0:
+            header = self._row(self.fieldnames)
+        return header + self._row([flat.get(column, "") for column in self.fieldnames])
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+UK Data Generator Benchmark Suite
+
+Measures wall time, records/sec and tracemalloc peak for each generator, for
+full CouncilDataGenerator.generate() and for generate_batch() with every
+record built, at 1e2 to 1e6 records, and compares results against a saved
+JSON baseline. Also reports the package's cold import time.
+
+Usage:
+    python3 benchmark_uk_data_generator.py [--max-records 1000000]
+        [--save baseline.json] [--compare baseline.json] [--threshold 0.2]
+
+--compare exits with status 1 if any benchmark's throughput falls more than
+--threshold (a fraction) below the baseline, or if a benchmark that was run
+has no baseline entry (including when nothing was run at all). Baselines are
+machine-specific: compare results from the same host.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add the layer to Python path
+sys.path.insert(0, os.path.join(
+    os.path.dirname(__file__),
+    '../cloudformation/layers/uk-data-generator/python/lib/python3.12/site-packages'
+))
+
+from uk_data_generator import (
+    UKNameGenerator,
+    UKAddressGenerator,
+    CouncilServiceGenerator,
+    CouncilDataGenerator
+)
+
+SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_THRESHOLD = 0.2
+SEED = 42
+
+LAYER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    '../cloudformation/layers/uk-data-generator/python/lib/python3.12/site-packages'
+)
+
+
+def bench_names(count):
+    """Generate count names; returns records produced"""
+    generator = UKNameGenerator(seed=SEED, allow_reuse=True)
+    for _ in range(count):
+        generator.generate_name()
+    return count
+
+
+def bench_addresses(count):
+    """Generate count addresses; returns records produced"""
+    generator = UKAddressGenerator(seed=SEED)
+    for _ in range(count):
+        generator.generate_address()
+    return count
+
+
+def bench_service_requests(count):
+    """Generate count service requests; returns records produced"""
+    generator = CouncilServiceGenerator(seed=SEED)
+    for _ in generator.iter_requests(count):
+        pass
+    return count
+
+
+def bench_generate(count):
+    """Generate a full dataset of count residents; returns records produced"""
+    data = CouncilDataGenerator(seed=SEED).generate(data_volume=count)
+    return data['recordCounts']['total']
+
+
+def bench_batch(count):
+    """Generate a batch of count residents and build every record; returns records produced"""
+    batch = CouncilDataGenerator(seed=SEED).generate_batch(count)
+    records = 0
+    for _ in batch.residents:
+        records += 1
+    for _ in batch.service_requests:
+        records += 1
+    return records
+
+
+BENCHMARKS = {
+    'names': bench_names,
+    'addresses': bench_addresses,
+    'serviceRequests': bench_service_requests,
+    'generate': bench_generate,
+    'batch': bench_batch
+}
+
+
+def measure(benchmark, count, repeat=1, trace_memory=True):
+    """
+    Run one benchmark at one size.
+
+    Wall time is the best of repeat untraced runs; peak memory comes from a
+    separate traced run, since tracing slows allocation-heavy code.
+    """
+    best = None
+    records = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = benchmark(count)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            benchmark(count)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'records': records,
+        'wallSeconds': best,
+        'recordsPerSecond': records / best if best > 0 else 0.0,
+        'peakTracedMemoryBytes': peak
+    }
+
+
+IMPORT_PROBE = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+loaded = sorted(set(sys.modules) - before)
+modules = [m for m in loaded if m.split('.')[0] == 'uk_data_generator']
+import json
+print(json.dumps({'importMicroseconds': round(elapsed * 1e6), 'modules': modules,
+                  'loaded': loaded}))
+"""
+
+
+def measure_import_time(statement='import uk_data_generator'):
+    """
+    Cold import cost of the package in a fresh interpreter.
+
+    Returns:
+        Dict with importMicroseconds (wall time of statement), modules
+        (the uk_data_generator modules it loaded) and loaded (every module
+        it loaded, stdlib included)
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', IMPORT_PROBE, statement],
+        env={**os.environ, 'PYTHONPATH': LAYER_PATH},
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output)
+
+
+def run_benchmarks(sizes, names=None, repeat=1, trace_memory=True, report=print):
+    """Run benchmarks across sizes and return results in baseline format"""
+    results = {}
+    for name, benchmark in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        results[name] = {}
+        for count in sizes:
+            result = measure(benchmark, count, repeat, trace_memory)
+            results[name][str(count)] = result
+            peak = result['peakTracedMemoryBytes']
+            report(
+                f"  {name:<16}{count:>10,}  {result['wallSeconds']:>9.3f}s  "
+                f"{result['recordsPerSecond']:>12,.0f} rec/s"
+                + (f"  {peak / 1024 / 1024:>8.1f} MiB" if peak is not None else "")
+            )
+
+    return {
+        'createdAt': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare throughput against a baseline.
+
+    Returns:
+        List of (benchmark, size, baseline rec/s, current rec/s, change)
+        tuples for every benchmark whose throughput fell by more than
+        threshold. Benchmarks missing from either side are skipped; see
+        missing_from_baseline().
+    """
+    regressions = []
+    for name, sizes in current['results'].items():
+        for size, result in sizes.items():
+            base = baseline.get('results', {}).get(name, {}).get(size)
+            if not base or not base.get('recordsPerSecond'):
+                continue
+
+            change = result['recordsPerSecond'] / base['recordsPerSecond'] - 1
+            if change < -threshold:
+                regressions.append(
+                    (name, size, base['recordsPerSecond'], result['recordsPerSecond'], change)
+                )
+
+    return regressions
+
+
+def missing_from_baseline(baseline, current):
+    """
+    Find benchmarks that were run but cannot be compared.
+
+    Returns:
+        List of (benchmark, size) pairs in current with no usable
+        throughput in baseline. Baseline entries that were not run are
+        not reported.
+    """
+    missing = []
+    for name, sizes in current['results'].items():
+        for size in sizes:
+            base = baseline.get('results', {}).get(name, {}).get(size)
+            if not base or not base.get('recordsPerSecond'):
+                missing.append((name, size))
+
+    return missing
+
+
+def main(argv=None):
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark the UK data generator")
+    parser.add_argument('--max-records', type=float, default=1e6,
+                        help="Largest size to run (default: 1e6)")
+    parser.add_argument('--benchmark', action='append', choices=list(BENCHMARKS),
+                        help="Benchmark to run (repeatable; default: all)")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help="Timed runs per size; the best is kept (default: 1)")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Skip the traced run that measures peak memory")
+    parser.add_argument('--save', help="Write results to a JSON baseline file")
+    parser.add_argument('--compare', help="Compare results against a JSON baseline file")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed throughput drop as a fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in SIZES if size <= args.max_records]
+
+    print("Running UK data generator benchmarks...")
+    print("=" * 60)
+    for label, statement in (
+        ('import', 'import uk_data_generator'),
+        ('first use', 'from uk_data_generator import CouncilDataGenerator')
+    ):
+        cost = measure_import_time(statement)
+        print(f"  {label:<16}{cost['importMicroseconds'] / 1000:>20.1f}ms  "
+              f"{len(cost['modules'])} module(s)")
+    current = run_benchmarks(
+        sizes,
+        names=args.benchmark,
+        repeat=args.repeat,
+        trace_memory=not args.no_memory
+    )
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResults saved to: {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+
+        compared = sum(len(sizes) for sizes in current['results'].values())
+        missing = missing_from_baseline(baseline, current)
+        regressions = compare_results(baseline, current, args.threshold)
+        print("\n" + "=" * 60)
+        if not compared:
+            print("\n❌ No benchmarks were run, so nothing was compared")
+            return 1
+        if missing:
+            print(f"\n❌ {len(missing)} benchmark(s) have no entry in {args.compare}:")
+            for name, size in missing:
+                print(f"  - {name} @ {int(size):,}")
+        if regressions:
+            print(f"\n❌ {len(regressions)} throughput regression(s) beyond "
+                  f"{args.threshold:.0%}:")
+            for name, size, base_rate, rate, change in regressions:
+                print(f"  - {name} @ {int(size):,}: {base_rate:,.0f} -> "
+                      f"{rate:,.0f} rec/s ({change:+.0%})")
+        if missing or regressions:
+            return 1
+
+        print(f"\n✓ No throughput regressions beyond {args.threshold:.0%}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
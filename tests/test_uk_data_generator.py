@@ -5,10 +5,20 @@ Tests all generators for correctness, determinism, and UK data validity.
 """
 
 import unittest
+import contextlib
 import re
 import sys
 import os
-from datetime import datetime
+import io
+import csv
+import gzip
+import json
+import tempfile
+import hashlib
+import random
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 
 # Add the layer to Python path for testing
 sys.path.insert(0, os.path.join(
@@ -20,14 +30,52 @@ from uk_data_generator import (
     UKNameGenerator,
     UKAddressGenerator,
     CouncilServiceGenerator,
-    CouncilDataGenerator
+    CouncilDataGenerator,
+    DatasetStream,
+    AsyncRecordStream,
+    NameSpaceExhaustedError,
+    AddressSpaceExhaustedError,
+    NDJSONWriter,
+    CSVWriter,
+    GenerationProfiler,
+    CouncilSpec,
+    ArrivalSimulator,
+    FOILetterGenerator,
+    CarParkSensorHistory,
+    generate_councils,
+    DatasetCache
 )
+from uk_data_generator.clock import ReferenceClock
+from uk_data_generator.permutation import IndexPermutation
+from uk_data_generator.address_space import AddressSpace
+from uk_data_generator.compiled import CompiledConfig, get_compiled_config
+from uk_data_generator.datapack import DataPack, DataPackError, write_datapack
+from uk_data_generator.sampling import AliasTable, poisson
+from uk_data_generator.records import ResidentRecord, ServiceRequestRecord
+from uk_data_generator.cache import cache_key
+from uk_data_generator.parallel import shard_ranges
+from uk_data_generator.rng import spawn_random
+from uk_data_generator import foi
+from uk_data_generator.digest import DatasetDigest, dataset_digest
+from uk_data_generator.__main__ import main as cli_main
 from uk_data_generator.config import (
     UK_FIRST_NAMES,
     UK_SURNAMES,
+    UK_CITIES,
+    COUNCIL_SERVICES,
+    CAR_PARK_SENSORS,
+    SERVICE_ARRIVAL_PATTERNS,
     SAMPLE_DATA_MARKER
 )
 
+# Fixed reference time for tests that compare datasets across generators
+REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+
+
+def make_generator(seed=42, **kwargs):
+    """Seeded CouncilDataGenerator with timestamps pinned to REFERENCE_TIME."""
+    return CouncilDataGenerator(seed=seed, reference_time=REFERENCE_TIME, **kwargs)
+
 
 class TestUKNameGenerator(unittest.TestCase):
     """Test UK name generation (AC-3.1.1, AC-3.1.6, AC-3.1.8)"""
@@ -106,6 +154,35 @@ class TestUKNameGenerator(unittest.TestCase):
         differences = sum(1 for i in range(10) if names1[i]['fullName'] != names2[i]['fullName'])
         self.assertGreater(differences, 0, "Different seeds should produce different names")
 
+    def test_full_combination_space_is_unique(self):
+        """Test every combination is allocated exactly once before exhaustion"""
+        generator = UKNameGenerator(seed=42)
+        space = (len(UK_FIRST_NAMES['male']) + len(UK_FIRST_NAMES['female'])) * len(UK_SURNAMES)
+        names = generator.generate_names(space)
+
+        self.assertEqual(len(set(n['fullName'] for n in names)), space)
+
+    def test_exhausted_space_raises(self):
+        """Test an explicit error once a gender's combinations are used up"""
+        generator = UKNameGenerator(seed=42)
+        for _ in range(len(UK_FIRST_NAMES['female']) * len(UK_SURNAMES)):
+            generator.generate_name('female')
+
+        with self.assertRaises(NameSpaceExhaustedError):
+            generator.generate_name('female')
+
+        # The other gender is unaffected
+        self.assertEqual(generator.generate_name('male')['gender'], 'male')
+
+    def test_allow_reuse_continues_after_exhaustion(self):
+        """Test reuse mode starts a fresh permutation instead of raising"""
+        generator = UKNameGenerator(seed=42, allow_reuse=True)
+        space = len(UK_FIRST_NAMES['male']) * len(UK_SURNAMES)
+        names = [generator.generate_name('male') for _ in range(space * 2)]
+
+        self.assertEqual(len(set(n['fullName'] for n in names[:space])), space)
+        self.assertEqual(len(set(n['fullName'] for n in names[space:])), space)
+
 
 class TestUKAddressGenerator(unittest.TestCase):
     """Test UK address generation (AC-3.1.2, AC-3.1.6, AC-3.1.8)"""
@@ -361,5 +438,1689 @@ class TestCouncilDataGenerator(unittest.TestCase):
             )
 
 
+class TestStreamingGeneration(unittest.TestCase):
+    """Test lazy streaming generation with constant memory"""
+
+    REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+
+    def test_stream_matches_generate(self):
+        """Test streamed records are identical to generate() for a seed"""
+        data = CouncilDataGenerator(seed=42, reference_time=self.REFERENCE_TIME).generate(50)
+        stream = CouncilDataGenerator(
+            seed=42, reference_time=self.REFERENCE_TIME
+        ).generate_stream(data_volume=50)
+        self.assertIsInstance(stream, DatasetStream)
+
+        residents = []
+        service_requests = []
+        for kind, record in stream:
+            if kind == 'resident':
+                residents.append(record)
+            else:
+                self.assertEqual(kind, 'serviceRequest')
+                service_requests.append(record)
+
+        self.assertEqual(residents, data['residents'])
+        self.assertEqual(service_requests, data['serviceRequests'])
+
+    def test_metadata_after_exhaustion(self):
+        """Test metadata and counts are only available once exhausted"""
+        stream = CouncilDataGenerator(seed=42).generate_stream(data_volume=10)
+
+        with self.assertRaises(RuntimeError):
+            stream.metadata
+
+        for _ in stream:
+            pass
+
+        self.assertTrue(stream.exhausted)
+        self.assertEqual(stream.metadata['dataVolume'], 10)
+        self.assertEqual(stream.metadata['sampleMarker'], SAMPLE_DATA_MARKER)
+        self.assertEqual(
+            stream.record_counts,
+            {'residents': 10, 'serviceRequests': 10, 'total': 20}
+        )
+
+    def test_stream_without_service_requests(self):
+        """Test streaming residents only"""
+        stream = CouncilDataGenerator(seed=42).generate_stream(
+            data_volume=5,
+            include_service_requests=False
+        )
+        kinds = [kind for kind, _ in stream]
+
+        self.assertEqual(kinds, ['resident'] * 5)
+        self.assertEqual(stream.record_counts['serviceRequests'], 0)
+
+    def test_stream_consumed_once(self):
+        """Test a stream cannot be iterated twice"""
+        stream = CouncilDataGenerator(seed=42).generate_stream(data_volume=1)
+        list(stream)
+
+        with self.assertRaises(RuntimeError):
+            iter(stream)
+
+
+class TestBatchGeneration(unittest.TestCase):
+    """Test struct-of-arrays batch generation engine"""
+
+    POSTCODE_PATTERN = re.compile(r'^[A-Z]{1,2}\d{1,2}\s\d[A-Z]{2}$')
+
+    def test_batch_record_counts(self):
+        """Test batch sizes and record counts"""
+        batch = CouncilDataGenerator(seed=42).generate_batch(100)
+
+        self.assertEqual(len(batch.residents), 100)
+        self.assertEqual(len(batch.service_requests), 100)
+        self.assertEqual(
+            batch.record_counts,
+            {'residents': 100, 'serviceRequests': 100, 'total': 200}
+        )
+
+    def test_batch_records_match_generator_format(self):
+        """Test lazily built dicts have the same shape as generate()"""
+        generator = CouncilDataGenerator(seed=42, council_name="Test Council")
+        data = generator.generate(data_volume=1)
+        batch = generator.generate_batch(20, start_index=10)
+
+        resident = batch.residents[0]
+        self.assertEqual(resident.keys(), data['residents'][0].keys())
+        self.assertEqual(resident['name'].keys(), data['residents'][0]['name'].keys())
+        self.assertEqual(resident['address'].keys(), data['residents'][0]['address'].keys())
+        self.assertEqual(resident['residentId'], '[SAMPLE] RES-000010')
+        self.assertEqual(resident['councilName'], "Test Council")
+
+        for resident in batch.residents:
+            self.assertIn(resident['name']['firstName'], UK_FIRST_NAMES[resident['name']['gender']])
+            self.assertIn(resident['name']['lastName'], UK_SURNAMES)
+            self.assertIsNotNone(self.POSTCODE_PATTERN.match(resident['address']['postcode']))
+
+        request = batch.service_requests[-1]
+        self.assertEqual(request.keys(), data['serviceRequests'][0].keys())
+        self.assertIn('[SAMPLE]', request['reference'])
+
+    def test_batch_category_rotation(self):
+        """Test batch requests rotate categories like generate_requests()"""
+        batch = CouncilDataGenerator(seed=42).generate_batch(8, start_index=0)
+        requests = CouncilServiceGenerator(seed=42).generate_requests(8)
+
+        self.assertEqual(
+            [r['category'] for r in batch.service_requests],
+            [r['category'] for r in requests]
+        )
+
+    def test_deterministic_batch_generation(self):
+        """Test batch output is deterministic for a seed"""
+        batch1 = CouncilDataGenerator(seed=42).generate_batch(50)
+        batch2 = CouncilDataGenerator(seed=42).generate_batch(50)
+
+        for r1, r2 in zip(batch1.residents, batch2.residents):
+            self.assertEqual(r1['name'], r2['name'])
+            self.assertEqual(r1['address'], r2['address'])
+
+    def test_batch_without_service_requests(self):
+        """Test residents-only batch"""
+        batch = CouncilDataGenerator(seed=42).generate_batch(5, include_service_requests=False)
+
+        self.assertEqual(len(batch.service_requests), 0)
+        self.assertEqual(len(batch), 5)
+
+    def test_batch_rejects_unsupported_modes(self):
+        """Test batches refuse modes they do not implement instead of ignoring them"""
+        for option in ('households', 'unique_addresses', 'compact', 'counter_based'):
+            generator = CouncilDataGenerator(seed=42, **{option: True})
+
+            with self.assertRaisesRegex(ValueError, option):
+                generator.generate_batch(5)
+
+
+class TestIndexPermutation(unittest.TestCase):
+    """Test seeded bijective index permutations"""
+
+    def test_permutation_is_bijective(self):
+        """Test every index maps to a distinct index in range"""
+        for size in (1, 2, 3, 750, 1000, 4097):
+            permutation = IndexPermutation(size, key=7)
+            values = [permutation[i] for i in range(size)]
+            self.assertEqual(sorted(values), list(range(size)))
+
+    def test_permutation_is_keyed(self):
+        """Test the same key reproduces the order and a different key changes it"""
+        order1 = [IndexPermutation(750, key=1)[i] for i in range(750)]
+        order2 = [IndexPermutation(750, key=1)[i] for i in range(750)]
+        order3 = [IndexPermutation(750, key=2)[i] for i in range(750)]
+
+        self.assertEqual(order1, order2)
+        self.assertNotEqual(order1, order3)
+
+    def test_out_of_range_index(self):
+        """Test indices outside the range are rejected"""
+        permutation = IndexPermutation(10, key=1)
+
+        with self.assertRaises(IndexError):
+            permutation[10]
+
+
+class TestCounterBasedGeneration(unittest.TestCase):
+    """Test random-access records derived from (seed, stream, index)"""
+
+    REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+
+    def test_slice_matches_full_generation(self):
+        """Test an independently generated slice matches the full dataset"""
+        full = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME
+        ).generate(data_volume=60)
+        generator = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME
+        )
+
+        residents = list(generator.iter_residents(20, start_index=40))
+        requests = list(generator.iter_service_requests(20, start_index=40))
+
+        self.assertEqual(residents, full['residents'][40:])
+        self.assertEqual(requests, full['serviceRequests'][40:])
+
+    def test_record_independent_of_call_order(self):
+        """Test a record is the same however many records came before it"""
+        generator1 = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME
+        )
+        generator2 = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME
+        )
+        for i in range(100):
+            generator1.generate_resident(i)
+
+        self.assertEqual(
+            generator1.generate_resident(5_000_000),
+            generator2.generate_resident(5_000_000)
+        )
+        self.assertEqual(generator1.generate_request(123), generator2.generate_request(123))
+
+    def test_names_unique_within_space(self):
+        """Test counter-based names are unique across the combination space"""
+        generator = CouncilDataGenerator(seed=42, counter_based=True)
+        space = (len(UK_FIRST_NAMES['male']) + len(UK_FIRST_NAMES['female'])) * len(UK_SURNAMES)
+        names = [r['name']['fullName'] for r in generator.iter_residents(space)]
+
+        self.assertEqual(len(set(names)), space)
+
+    def test_different_seeds_differ(self):
+        """Test different seeds produce different counter-based records"""
+        resident1 = CouncilDataGenerator(seed=1, counter_based=True).generate_resident(0)
+        resident2 = CouncilDataGenerator(seed=2, counter_based=True).generate_resident(0)
+
+        self.assertNotEqual(
+            (resident1['name'], resident1['address']),
+            (resident2['name'], resident2['address'])
+        )
+
+    def test_start_index_requires_counter_mode(self):
+        """Test sequential mode rejects independent slices"""
+        generator = CouncilDataGenerator(seed=42)
+
+        with self.assertRaises(ValueError):
+            generator.iter_residents(10, start_index=5)
+
+
+class TestParallelGeneration(unittest.TestCase):
+    """Test multi-process sharded generation"""
+
+    REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+
+    def test_shard_ranges(self):
+        """Test index ranges are contiguous and cover every record"""
+        self.assertEqual(shard_ranges(10, 3), [(0, 4), (4, 3), (7, 3)])
+        self.assertEqual(shard_ranges(2, 4), [(0, 1), (1, 1)])
+        self.assertEqual(shard_ranges(0, 2), [])
+
+    def test_parallel_matches_single_process(self):
+        """Test sharded output is identical to single-process output"""
+        single = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME
+        ).generate(data_volume=101)
+        sharded = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME
+        ).generate(data_volume=101, parallel=3)
+
+        self.assertEqual(sharded['residents'], single['residents'])
+        self.assertEqual(sharded['serviceRequests'], single['serviceRequests'])
+        self.assertEqual(sharded['recordCounts'], single['recordCounts'])
+
+    def test_parallel_requires_counter_mode(self):
+        """Test sequential mode rejects parallel generation"""
+        with self.assertRaises(ValueError):
+            CouncilDataGenerator(seed=42).generate(data_volume=10, parallel=2)
+
+    def test_cli_writes_dataset(self):
+        """Test the command line entry point writes a valid dataset"""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'dataset.json')
+            exit_code = cli_main([
+                '--seed', '7', '--volume', '12', '--parallel', '2',
+                '--council', 'Test Council', '--output', output
+            ])
+
+            with open(output) as f:
+                data = json.load(f)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(data['recordCounts']['total'], 24)
+        self.assertEqual(data['metadata']['councilName'], 'Test Council')
+        self.assertTrue(CouncilDataGenerator().validate_data(data))
+
+
+class TestStreamingWriters(unittest.TestCase):
+    """Test buffered NDJSON/CSV writers"""
+
+    def test_ndjson_round_trip(self):
+        """Test NDJSON output contains one record per line"""
+        residents = CouncilDataGenerator(seed=42).generate(data_volume=20)['residents']
+        output = io.BytesIO()
+
+        with NDJSONWriter(output, buffer_size=256) as writer:
+            written = writer.write_records(iter(residents))
+
+        lines = output.getvalue().decode('utf-8').splitlines()
+        self.assertEqual(written, 20)
+        self.assertEqual([json.loads(line) for line in lines], residents)
+        self.assertEqual(writer.records_written, 20)
+        self.assertEqual(writer.bytes_written, len(output.getvalue()))
+
+    def test_gzip_ndjson(self):
+        """Test gzip-compressed NDJSON decompresses to the records"""
+        generator = CouncilDataGenerator(seed=42)
+        requests = list(generator.iter_service_requests(50))
+        output = io.BytesIO()
+
+        with NDJSONWriter(output, compress=True) as writer:
+            writer.write_records(requests)
+
+        lines = gzip.decompress(output.getvalue()).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], requests)
+        self.assertEqual(writer.bytes_written, len(output.getvalue()))
+
+    def test_csv_flattens_nested_fields(self):
+        """Test CSV output flattens name and address into columns"""
+        residents = list(CouncilDataGenerator(seed=42).iter_residents(10))
+        output = io.StringIO()
+
+        with CSVWriter(output) as writer:
+            writer.write_records(residents)
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(len(rows), 10)
+        self.assertIn('name.fullName', rows[0])
+        self.assertIn('address.postcode', rows[0])
+        self.assertEqual(rows[3]['name.fullName'], residents[3]['name']['fullName'])
+        self.assertEqual(rows[3]['address.postcode'], residents[3]['address']['postcode'])
+
+    def test_compressed_text_output_rejected(self):
+        """Test gzip output requires a binary file object"""
+        with self.assertRaises(ValueError):
+            NDJSONWriter(io.StringIO(), compress=True)
+
+    def test_incomplete_writer_rejected(self):
+        """Test a writer without _encode() fails when instantiated"""
+        from uk_data_generator.writers import RecordWriter
+
+        class Incomplete(RecordWriter):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete(io.StringIO())
+
+    def test_writer_stats(self):
+        """Test throughput counters are reported"""
+        output = io.BytesIO()
+        writer = NDJSONWriter(output)
+        writer.write_records(CouncilDataGenerator(seed=42).iter_residents(5))
+        writer.close()
+
+        stats = writer.stats()
+        self.assertEqual(stats['recordsWritten'], 5)
+        self.assertEqual(stats['bytesWritten'], len(output.getvalue()))
+        self.assertGreaterEqual(stats['recordsPerSecond'], 0)
+
+
+class TestCompiledConfig(unittest.TestCase):
+    """Test compiled, indexed configuration tables"""
+
+    def test_config_shared_across_generators(self):
+        """Test every generator shares the process-wide compiled tables"""
+        generator1 = CouncilDataGenerator(seed=1)
+        generator2 = CouncilDataGenerator(seed=2)
+        config = get_compiled_config()
+
+        self.assertIs(generator1.config, config)
+        self.assertIs(generator2.config, config)
+        self.assertIs(generator1.name_generator.config, config)
+        self.assertIs(generator1.address_generator.config, config)
+        self.assertIs(generator1.service_generator.config, config)
+
+    def test_tables_match_source_config(self):
+        """Test compiled tables mirror config.py"""
+        config = get_compiled_config()
+
+        self.assertEqual(config.surnames, tuple(UK_SURNAMES))
+        self.assertEqual([c.name for c in config.cities], [c['name'] for c in UK_CITIES])
+        self.assertEqual(
+            [c.name for c in config.categories],
+            [c['name'] for c in COUNCIL_SERVICES['categories']]
+        )
+        self.assertEqual(config.city('Leeds').postcode_prefix, 'LS')
+        self.assertIsNone(config.city('Atlantis'))
+
+    def test_precomputed_category_codes(self):
+        """Test category codes are precomputed and used in references"""
+        config = get_compiled_config()
+        self.assertEqual(config.category('Waste & Recycling').code, 'W&R')
+        self.assertEqual(config.category('Council Tax').code, 'CT')
+
+        request = CouncilServiceGenerator(seed=42).generate_request('Council Tax', 3)
+        self.assertTrue(request['reference'].startswith('[SAMPLE] CT-'))
+
+
+class TestWeightedSampling(unittest.TestCase):
+    """Test alias-method weighted sampling"""
+
+    def test_alias_table_matches_weights(self):
+        """Test sample frequencies follow the weights"""
+        weights = [50, 30, 15, 5, 0]
+        table = AliasTable(weights)
+        draws = Counter(table.sample_many(random.Random(42), 100000))
+
+        for index, weight in enumerate(weights):
+            self.assertAlmostEqual(draws[index] / 100000, weight / 100, delta=0.01)
+        self.assertEqual(draws[4], 0)
+
+    def test_single_and_bulk_draws_agree(self):
+        """Test sample() and sample_many() consume draws identically"""
+        table = AliasTable([3, 1, 1])
+        rng1 = random.Random(7)
+        rng2 = random.Random(7)
+
+        self.assertEqual(
+            [table.sample(rng1) for _ in range(100)],
+            table.sample_many(rng2, 100)
+        )
+
+    def test_invalid_weights(self):
+        """Test empty, negative and all-zero weights are rejected"""
+        for weights in ([], [1, -1], [0, 0]):
+            with self.assertRaises(ValueError):
+                AliasTable(weights)
+
+    def test_weighted_generation_skew(self):
+        """Test weighted mode skews cities and categories by configured weight"""
+        data = CouncilDataGenerator(seed=42, weighted=True).generate(data_volume=4000)
+        cities = Counter(r['address']['city'] for r in data['residents'])
+        categories = Counter(r['category'] for r in data['serviceRequests'])
+
+        self.assertGreater(cities['Birmingham'], cities['Leeds'])
+        self.assertGreater(cities['Leeds'], cities['Manchester'])
+        self.assertGreater(categories['Waste & Recycling'], categories['Housing'])
+
+        surnames = Counter(r['name']['lastName'] for r in data['residents'])
+        self.assertEqual(surnames.most_common(1)[0][0], 'Smith')
+
+    def test_weighted_generation_deterministic(self):
+        """Test weighted output is deterministic for a seed"""
+        data1 = CouncilDataGenerator(seed=42, weighted=True).generate(data_volume=20)
+        data2 = CouncilDataGenerator(seed=42, weighted=True).generate(data_volume=20)
+
+        self.assertEqual(
+            [r['name'] for r in data1['residents']],
+            [r['name'] for r in data2['residents']]
+        )
+
+
+class TestDataPacks(unittest.TestCase):
+    """Test memory-mapped binary vocabulary packs"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'vocab.ukdp')
+        self.surnames = ['Surname%05d' % i for i in range(5000)] + ['Ó Briain']
+        write_datapack(self.path, {
+            'surnames': self.surnames,
+            'postcode_districts.Leeds': ['LS1', 'LS2', 'LS6', 'LS17'],
+            'empty': []
+        })
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test tables read back lazily with the written strings"""
+        with DataPack(self.path) as pack:
+            self.assertEqual(set(pack), {'surnames', 'postcode_districts.Leeds', 'empty'})
+            surnames = pack['surnames']
+            self.assertEqual(len(surnames), len(self.surnames))
+            self.assertEqual(surnames[0], 'Surname00000')
+            self.assertEqual(surnames[-1], 'Ó Briain')
+            self.assertEqual(list(surnames), self.surnames)
+            self.assertEqual(len(pack['empty']), 0)
+
+    def test_missing_table_and_bad_file(self):
+        """Test missing tables raise KeyError and non-pack files DataPackError"""
+        with DataPack(self.path) as pack:
+            self.assertNotIn('street_names', pack)
+            with self.assertRaises(KeyError):
+                pack['street_names']
+
+        bad_path = os.path.join(self.tmp.name, 'bad.ukdp')
+        with open(bad_path, 'wb') as f:
+            f.write(b'not a data pack at all')
+        with self.assertRaises(DataPackError):
+            DataPack(bad_path)
+
+    def test_generators_use_pack_vocabularies(self):
+        """Test a pack-backed config replaces surnames and postcode districts"""
+        with DataPack(self.path) as pack:
+            config = CompiledConfig(pack)
+            generator = CouncilDataGenerator(seed=42, config=config)
+            data = generator.generate(data_volume=50)
+
+            for resident in data['residents']:
+                self.assertIn(resident['name']['lastName'], self.surnames)
+
+            address = generator.address_generator.generate_address('Leeds')
+            self.assertIn(address['postcode'].split()[0], ['LS1', 'LS2', 'LS6', 'LS17'])
+
+            batch = generator.generate_batch(50)
+            for resident in batch.residents:
+                self.assertIn(resident['name']['lastName'], self.surnames)
+
+    def test_batch_with_large_tables(self):
+        """Test batch columns widen for pack tables beyond 65535 entries"""
+        path = os.path.join(self.tmp.name, 'large.ukdp')
+        size = 70000
+        write_datapack(path, {
+            'surnames': ['Surname%06d' % i for i in range(size)],
+            'street_names': ['Street%06d' % i for i in range(size)],
+            'first_names.male': ['Male%06d' % i for i in range(size)]
+        })
+        with DataPack(path) as pack:
+            config = CompiledConfig(pack)
+            for weighted in (False, True):
+                generator = CouncilDataGenerator(seed=42, config=config, weighted=weighted)
+                batch = generator.generate_batch(500, include_service_requests=False)
+                surnames = [int(r['name']['lastName'][7:]) for r in batch.residents]
+                self.assertTrue(all(0 <= i < size for i in surnames))
+                self.assertGreater(max(surnames), 65535)
+                streets = [r['address']['addressLine1'] for r in batch.residents]
+                self.assertTrue(all('Street' in street for street in streets))
+
+    def test_pack_reaches_workers_and_cache_key(self):
+        """Test sharded runs and cache keys use the generator's pack"""
+        with DataPack(self.path) as pack:
+            generator = make_generator(counter_based=True, config=CompiledConfig(pack))
+            single = generator.generate(data_volume=20)
+            sharded = generator.generate(data_volume=20, parallel=2)
+            self.assertEqual(sharded['residents'], single['residents'])
+            for resident in sharded['residents']:
+                self.assertIn(resident['name']['lastName'], self.surnames)
+
+            default = make_generator(counter_based=True)
+            self.assertNotEqual(
+                cache_key(DatasetCache.dataset_params(generator, 20, True)),
+                cache_key(DatasetCache.dataset_params(default, 20, True))
+            )
+
+
+class TestReferenceClock(unittest.TestCase):
+    """Test fixed reference time and precomputed timestamp tables"""
+
+    REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+
+    def test_days_ago_table(self):
+        """Test day offsets map to ISO timestamps, extending past the table"""
+        clock = ReferenceClock(self.REFERENCE_TIME, max_days=7)
+        self.assertEqual(clock.iso, '2025-11-01T09:30:00')
+        self.assertEqual(clock.month, '202511')
+        self.assertEqual(clock.days_ago(0), '2025-11-01T09:30:00')
+        self.assertEqual(clock.days_ago(7), '2025-10-25T09:30:00')
+        self.assertEqual(clock.days_ago(40), '2025-09-22T09:30:00')
+        with self.assertRaises(ValueError):
+            clock.days_ago(-1)
+
+    def test_fixed_reference_time_is_reproducible(self):
+        """Test generate() output is fully identical for a fixed reference time"""
+        data1 = CouncilDataGenerator(seed=42, reference_time=self.REFERENCE_TIME).generate(50)
+        data2 = CouncilDataGenerator(seed=42, reference_time=self.REFERENCE_TIME).generate(50)
+
+        self.assertEqual(data1['residents'], data2['residents'])
+        self.assertEqual(data1['serviceRequests'], data2['serviceRequests'])
+        self.assertEqual(data1['metadata']['referenceTime'], '2025-11-01T09:30:00')
+
+        for resident in data1['residents']:
+            self.assertEqual(resident['createdAt'], '2025-11-01T09:30:00')
+        for request in data1['serviceRequests']:
+            self.assertIn('-202511-', request['reference'])
+            self.assertLessEqual(request['submittedAt'], '2025-11-01T09:30:00')
+            self.assertGreaterEqual(request['submittedAt'], '2025-10-02T09:30:00')
+
+    def test_batch_and_parallel_share_reference_time(self):
+        """Test batch and sharded generation stamp the same timestamps"""
+        generator = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME
+        )
+        single = generator.generate(data_volume=30)
+        sharded = generator.generate(data_volume=30, parallel=2)
+        self.assertEqual(sharded['residents'], single['residents'])
+        self.assertEqual(sharded['serviceRequests'], single['serviceRequests'])
+
+        batch = CouncilDataGenerator(seed=42, reference_time=self.REFERENCE_TIME).generate_batch(20)
+        self.assertEqual(batch.residents[0]['createdAt'], '2025-11-01T09:30:00')
+        self.assertIn('-202511-', batch.service_requests[0]['reference'])
+
+
+class TestCheckpointResume(unittest.TestCase):
+    """Test incremental generation and checkpoint/resume"""
+
+    def test_sequential_extend(self):
+        """Test a sequential dataset is extended without regenerating records"""
+        full = make_generator().generate(data_volume=50)
+
+        for extend in ({'resume': True}, {'start_index': 30}):
+            generator = make_generator()
+            first = generator.generate(count=30)
+            rest = generator.generate(count=20, **extend)
+
+            self.assertEqual(first['residents'] + rest['residents'], full['residents'])
+            self.assertEqual(
+                first['serviceRequests'] + rest['serviceRequests'],
+                full['serviceRequests']
+            )
+            self.assertEqual(rest['metadata']['startIndex'], 30)
+            self.assertEqual(rest['residents'][0]['residentId'], '[SAMPLE] RES-000030')
+
+    def test_repeat_calls_start_at_zero(self):
+        """Test generate() numbers from 0 on every call unless resumed"""
+        generator = make_generator()
+        generator.generate(count=10)
+        again = generator.generate(count=10)
+
+        self.assertEqual(again['metadata']['startIndex'], 0)
+        self.assertEqual(again['residents'][0]['residentId'], '[SAMPLE] RES-000000')
+        self.assertEqual(generator.next_index, 10)
+
+    def test_ids_line_up_without_service_requests(self):
+        """Test requests share the residents' indices after a residents-only slice"""
+        generator = make_generator()
+        generator.generate(count=10, include_service_requests=False)
+        self.assertEqual(generator.next_index, 10)
+
+        for rest in (generator.generate(start_index=10, count=5),
+                     generator.generate(count=5, resume=True)):
+            start = rest['metadata']['startIndex']
+            self.assertEqual(
+                [int(r['residentId'].rsplit('-', 1)[1]) for r in rest['residents']],
+                [int(r['reference'].rsplit('-', 1)[1]) for r in rest['serviceRequests']]
+            )
+            self.assertEqual(rest['residents'][0]['residentId'], f'[SAMPLE] RES-{start:06d}')
+        self.assertEqual(generator.next_index, 20)
+
+    def test_checkpoint_round_trip(self):
+        """Test a JSON checkpoint resumes an interrupted run exactly"""
+        full = make_generator().generate(data_volume=40)
+
+        interrupted = make_generator()
+        residents = list(interrupted.iter_residents(25))
+        requests = list(interrupted.iter_service_requests(25))
+        checkpoint = json.loads(json.dumps(interrupted.get_state()))
+
+        resumed = make_generator()
+        resumed.set_state(checkpoint)
+        self.assertEqual(resumed.next_index, 25)
+        rest = resumed.generate(count=15, resume=True)
+        residents.extend(rest['residents'])
+        requests.extend(rest['serviceRequests'])
+
+        self.assertEqual(residents, full['residents'])
+        self.assertEqual(requests, full['serviceRequests'])
+
+    def test_counter_based_slice(self):
+        """Test counter-based generation of a slice, in one or more processes"""
+        full = make_generator(counter_based=True).generate(data_volume=60)
+        generator = make_generator(counter_based=True)
+
+        for parallel in (1, 2):
+            data = generator.generate(start_index=40, count=20, parallel=parallel)
+            self.assertEqual(data['residents'], full['residents'][40:])
+            self.assertEqual(data['serviceRequests'], full['serviceRequests'][40:])
+
+    def test_invalid_resume(self):
+        """Test mismatched checkpoints and out-of-order sequential slices fail"""
+        generator = make_generator()
+        generator.generate(count=10)
+
+        with self.assertRaises(ValueError):
+            generator.generate(start_index=0, count=10)
+        with self.assertRaises(ValueError):
+            CouncilDataGenerator(seed=7).set_state(generator.get_state())
+        with self.assertRaises(ValueError):
+            make_generator().set_state({'version': 1})
+
+
+class TestProfiling(unittest.TestCase):
+    """Test optional per-stage profiling"""
+
+    REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+
+    def test_disabled_by_default(self):
+        """Test nothing is wrapped and no profile is reported without a profiler"""
+        generator = CouncilDataGenerator(seed=42)
+        self.assertNotIn('generate_name', vars(generator.name_generator))
+        self.assertNotIn('request_at', vars(generator.service_generator))
+        self.assertNotIn('profile', generator.generate(data_volume=5)['metadata'])
+
+    def test_stage_report(self):
+        """Test stage counts, throughput and callback delivery"""
+        reports = []
+        profiler = GenerationProfiler(callback=reports.append, trace_memory=True)
+        generator = CouncilDataGenerator(
+            seed=42, reference_time=self.REFERENCE_TIME, profiler=profiler
+        )
+        data = generator.generate(data_volume=40)
+
+        self.assertEqual(len(reports), 1)
+        report = data['metadata']['profile']
+        self.assertEqual(report, reports[0])
+        self.assertEqual(report['records'], 80)
+        self.assertEqual(report['stages']['names']['calls'], 40)
+        self.assertEqual(report['stages']['addresses']['calls'], 40)
+        self.assertEqual(report['stages']['serviceRequests']['calls'], 40)
+        self.assertGreater(report['recordsPerSecond'], 0)
+        self.assertGreater(report['peakTracedMemoryBytes'], 0)
+        self.assertEqual(report['uniquenessRetries'], generator.name_generator.cycle_walks)
+
+        # Profiling does not change the generated records
+        plain = CouncilDataGenerator(seed=42, reference_time=self.REFERENCE_TIME).generate(40)
+        self.assertEqual(data['residents'], plain['residents'])
+        self.assertEqual(data['serviceRequests'], plain['serviceRequests'])
+
+    def test_stream_and_serialisation(self):
+        """Test streamed runs report once exhausted, with writer timings"""
+        profiler = GenerationProfiler()
+        generator = CouncilDataGenerator(seed=42, counter_based=True, profiler=profiler)
+        stream = generator.generate_stream(data_volume=25)
+
+        buffer = io.StringIO()
+        with NDJSONWriter(buffer, profiler=profiler) as writer:
+            writer.write_records(record for _, record in stream)
+
+        report = stream.metadata['profile']
+        self.assertEqual(report['records'], 50)
+        self.assertEqual(report['stages']['names']['calls'], 25)
+        self.assertIsNone(report['peakTracedMemoryBytes'])
+        self.assertGreaterEqual(profiler.report()['stages']['serialisation']['calls'], 50)
+
+    def test_parallel_stages(self):
+        """Test sharded runs sum each worker's stage timings into the report"""
+        profiler = GenerationProfiler()
+        generator = CouncilDataGenerator(
+            seed=42, counter_based=True, reference_time=self.REFERENCE_TIME, profiler=profiler
+        )
+        data = generator.generate(data_volume=30, parallel=2)
+
+        report = data['metadata']['profile']
+        self.assertEqual(report['records'], 60)
+        for stage in ('names', 'addresses', 'serviceRequests'):
+            self.assertEqual(report['stages'][stage]['calls'], 30)
+            self.assertGreater(report['stages'][stage]['seconds'], 0)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test the benchmark suite's measurement and baseline comparison"""
+
+    def test_run_and_compare(self):
+        """Test small runs produce baseline results and regressions are caught"""
+        from benchmark_uk_data_generator import compare_results, run_benchmarks
+
+        current = run_benchmarks([100], report=lambda line: None)
+        self.assertEqual(
+            set(current['results']),
+            {'names', 'addresses', 'serviceRequests', 'generate', 'batch'}
+        )
+        result = current['results']['generate']['100']
+        self.assertEqual(result['records'], 200)
+        self.assertGreater(result['recordsPerSecond'], 0)
+        self.assertGreater(result['peakTracedMemoryBytes'], 0)
+
+        self.assertEqual(compare_results(current, current), [])
+
+        faster = json.loads(json.dumps(current))
+        faster['results']['names']['100']['recordsPerSecond'] *= 2
+        regressions = compare_results(faster, current, threshold=0.2)
+        self.assertEqual([(name, size) for name, size, *_ in regressions], [('names', '100')])
+
+    def test_compare_fails_without_baseline_entries(self):
+        """Test --compare fails when current benchmarks have nothing to compare against"""
+        from benchmark_uk_data_generator import main, missing_from_baseline, run_benchmarks
+
+        current = run_benchmarks([100], names=['names'], report=lambda line: None)
+        self.assertEqual(missing_from_baseline(current, current), [])
+        self.assertEqual(missing_from_baseline({'results': {}}, current), [('names', '100')])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'baseline.json')
+            with open(path, 'w') as f:
+                json.dump({'results': {'addresses': current['results']['names']}}, f)
+
+            argv = ['--benchmark', 'names', '--no-memory', '--compare', path]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(argv + ['--max-records', '100']), 1)
+                self.assertEqual(main(argv + ['--max-records', '10']), 1)
+
+
+class TestCompactRecords(unittest.TestCase):
+    """Test __slots__ record types emitted in compact mode"""
+
+    REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+
+    def _pair(self, **kwargs):
+        plain = CouncilDataGenerator(seed=42, reference_time=self.REFERENCE_TIME, **kwargs)
+        compact = CouncilDataGenerator(
+            seed=42, reference_time=self.REFERENCE_TIME, compact=True, **kwargs
+        )
+        return plain.generate(data_volume=30), compact.generate(data_volume=30)
+
+    def test_to_dict_matches_dict_output(self):
+        """Test compact records convert to exactly the default dicts"""
+        for kwargs in ({}, {'counter_based': True}, {'weighted': True}):
+            plain, compact = self._pair(**kwargs)
+            self.assertIsInstance(compact['residents'][0], ResidentRecord)
+            self.assertIsInstance(compact['serviceRequests'][0], ServiceRequestRecord)
+            self.assertEqual([r.to_dict() for r in compact['residents']], plain['residents'])
+            self.assertEqual(
+                [r.to_dict() for r in compact['serviceRequests']],
+                plain['serviceRequests']
+            )
+
+    def test_record_fields_and_json(self):
+        """Test derived fields and JSON conversion"""
+        plain, compact = self._pair()
+        resident = compact['residents'][3]
+
+        self.assertFalse(hasattr(resident, '__dict__'))
+        self.assertEqual(resident.resident_id, '[SAMPLE] RES-000003')
+        self.assertEqual(resident.name.full_name, plain['residents'][3]['name']['fullName'])
+        self.assertEqual(
+            resident.address.formatted_address,
+            plain['residents'][3]['address']['formattedAddress']
+        )
+        self.assertEqual(json.loads(resident.to_json()), plain['residents'][3])
+        self.assertEqual(
+            compact['serviceRequests'][0].reference,
+            plain['serviceRequests'][0]['reference']
+        )
+
+    def test_incomplete_record_type_rejected(self):
+        """Test a record type without to_dict() fails when instantiated"""
+        from uk_data_generator.records import Record
+
+        class Incomplete(Record):
+            __slots__ = ()
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_writers_and_parallel_accept_records(self):
+        """Test writers serialise records and sharded runs return them"""
+        generator = CouncilDataGenerator(seed=42, counter_based=True, compact=True)
+        sharded = generator.generate(data_volume=20, parallel=2)
+        self.assertEqual(sharded['residents'], generator.generate(data_volume=20)['residents'])
+
+        buffer = io.StringIO()
+        with NDJSONWriter(buffer) as writer:
+            writer.write_records(sharded['residents'])
+        lines = buffer.getvalue().splitlines()
+        self.assertEqual(json.loads(lines[0]), sharded['residents'][0].to_dict())
+
+    def test_compact_uses_less_memory(self):
+        """Test compact residents take less traced memory than dicts"""
+        import tracemalloc
+
+        def traced_size(compact):
+            generator = CouncilDataGenerator(seed=42, counter_based=True, compact=compact)
+            tracemalloc.start()
+            try:
+                residents = list(generator.iter_residents(2000))
+                return tracemalloc.get_traced_memory()[0], residents
+            finally:
+                tracemalloc.stop()
+
+        dict_size, _ = traced_size(False)
+        compact_size, _ = traced_size(True)
+        self.assertLess(compact_size, dict_size / 2)
+
+
+class TestHouseholds(unittest.TestCase):
+    """Test household mode with shared addresses"""
+
+    def _check_households(self, residents):
+        households = {}
+        for resident in residents:
+            households.setdefault(resident['householdId'], []).append(resident)
+
+        for household_id, members in households.items():
+            self.assertEqual(household_id, members[0]['residentId'].replace('RES', 'HH'))
+            for member in members:
+                self.assertIs(member['address'], members[0]['address'])
+        return households
+
+    def test_sequential_households(self):
+        """Test residents share one address object per household"""
+        residents = make_generator(households=True).generate(data_volume=3000)['residents']
+        households = self._check_households(residents)
+
+        mean_size = len(residents) / len(households)
+        self.assertGreater(mean_size, 2.0)
+        self.assertLess(mean_size, 2.7)
+        self.assertLessEqual(max(len(m) for m in households.values()), 6)
+
+    def test_counter_based_households(self):
+        """Test counter-based households are random-access and sharded consistently"""
+        generator = make_generator(households=True, counter_based=True)
+        full = generator.generate(data_volume=300, include_service_requests=False)
+        self._check_households(full['residents'])
+
+        start = full['residents'][100:]
+        random_access = make_generator(households=True, counter_based=True)
+        self.assertEqual(list(random_access.iter_residents(200, 100)), start)
+        sharded = generator.generate(data_volume=300, include_service_requests=False, parallel=3)
+        self.assertEqual(sharded['residents'], full['residents'])
+
+    def test_checkpoint_mid_household(self):
+        """Test a checkpoint taken inside a household resumes it exactly"""
+        full = make_generator(households=True).generate(60, include_service_requests=False)
+
+        for split in range(1, 8):
+            interrupted = make_generator(households=True)
+            head = list(interrupted.iter_residents(split))
+            checkpoint = json.loads(json.dumps(interrupted.get_state()))
+
+            resumed = make_generator(households=True)
+            resumed.set_state(checkpoint)
+            tail = list(resumed.iter_residents(60 - split, resume=True))
+            self.assertEqual(head + tail, full['residents'])
+
+    def test_compact_households(self):
+        """Test compact residents share AddressRecords and report householdId"""
+        residents = make_generator(households=True, compact=True).generate(50)['residents']
+        plain = make_generator(households=True).generate(data_volume=50)['residents']
+
+        self.assertEqual([r.to_dict() for r in residents], plain)
+        shared = [r for r in residents if r.household_index != r.index]
+        self.assertTrue(shared)
+        for resident in shared:
+            self.assertIs(resident.address, residents[resident.household_index].address)
+
+
+class TestUniqueAddresses(unittest.TestCase):
+    """Test guaranteed-unique addresses and postcodes"""
+
+    POSTCODE_PATTERN = re.compile(r'^[A-Z]{1,2}\d{1,2} \d[A-Z]{2}$')
+
+    def test_sequential_unique(self):
+        """Test sequential unique mode never repeats an address or postcode"""
+        generator = UKAddressGenerator(seed=42, unique=True)
+        addresses = generator.generate_addresses(20000)
+
+        self.assertEqual(len({a['formattedAddress'] for a in addresses}), 20000)
+        self.assertEqual(len({a['postcode'] for a in addresses}), 20000)
+        for address in addresses[:200]:
+            self.assertRegex(address['postcode'], self.POSTCODE_PATTERN)
+            self.assertTrue(address['postcode'].startswith(
+                {'Birmingham': 'B', 'Manchester': 'M', 'Leeds': 'LS'}[address['city']]
+            ))
+
+    def test_counter_based_unique(self):
+        """Test random-access unique addresses are unique and shard consistently"""
+        generator = CouncilDataGenerator(seed=42, counter_based=True, unique_addresses=True)
+        data = generator.generate(data_volume=400, include_service_requests=False)
+        postcodes = [r['address']['postcode'] for r in data['residents']]
+        self.assertEqual(len(set(postcodes)), 400)
+
+        sharded = generator.generate(data_volume=400, include_service_requests=False, parallel=2)
+        self.assertEqual(
+            [r['address'] for r in sharded['residents']],
+            [r['address'] for r in data['residents']]
+        )
+
+    def test_address_space_bijection(self):
+        """Test postcodes repeat only across epochs, with a different street"""
+        space = AddressSpace(get_compiled_config(), key=7)
+        self.assertEqual(space.size, space.postcodes * space.streets)
+
+        for index in (0, 1, 12345):
+            first = space[index]
+            second = space[index + space.postcodes]
+            self.assertEqual(first.postcode, second.postcode)
+            self.assertNotEqual(
+                (first.street_number, first.street_name, first.street_type),
+                (second.street_number, second.street_name, second.street_type)
+            )
+        with self.assertRaises(IndexError):
+            space[space.size]
+
+    def test_errors_and_checkpoint(self):
+        """Test city restriction, exhaustion and checkpointing in unique mode"""
+        generator = UKAddressGenerator(seed=42, unique=True)
+        with self.assertRaises(ValueError):
+            generator.generate_address('Leeds')
+
+        generator.generate_addresses(5)
+        state = json.loads(json.dumps(generator.get_state()))
+        expected = generator.generate_address()
+
+        resumed = UKAddressGenerator(seed=42, unique=True)
+        resumed.set_state(state)
+        self.assertEqual(resumed.generate_address(), expected)
+
+        resumed._unique_next = resumed._address_space.size
+        with self.assertRaises(AddressSpaceExhaustedError):
+            resumed.generate_address()
+
+
+class TestDatasetCache(unittest.TestCase):
+    """Test the on-disk dataset cache"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.cache = DatasetCache(self.tempdir.name)
+
+    def test_miss_then_hit(self):
+        """Test a cached dataset matches fresh generation"""
+        first = self.cache.generate(make_generator(), data_volume=20)
+        second = self.cache.generate(make_generator(), data_volume=20)
+
+        self.assertEqual((self.cache.misses, self.cache.hits), (1, 1))
+        self.assertEqual(second, first)
+        self.assertEqual(second['residents'], make_generator().generate(20)['residents'])
+
+    def test_key_covers_parameters(self):
+        """Test any parameter change is a separate entry"""
+        self.cache.generate(make_generator(), data_volume=20)
+        self.cache.generate(make_generator(), data_volume=21)
+        self.cache.generate(make_generator(seed=43), data_volume=20)
+        self.cache.generate(make_generator(households=True), data_volume=20)
+        self.cache.generate(make_generator(), data_volume=20,
+                            include_service_requests=False)
+
+        self.assertEqual((self.cache.misses, self.cache.hits), (5, 0))
+        self.assertEqual(len(os.listdir(self.tempdir.name)), 5)
+
+    def test_corrupt_file_regenerated(self):
+        """Test integrity failures are discarded and treated as misses"""
+        expected = self.cache.generate(make_generator(), data_volume=20)
+        (name,) = os.listdir(self.tempdir.name)
+        path = os.path.join(self.tempdir.name, name)
+
+        with gzip.open(path, 'rb') as f:
+            header, payload = f.read().split(b'\n', 1)
+        with gzip.open(path, 'wb') as f:
+            f.write(header + b'\n' + payload.replace(b'SAMPLE', b'SAMPLF', 1))
+
+        regenerated = self.cache.generate(make_generator(), data_volume=20)
+        self.assertEqual(regenerated['residents'], expected['residents'])
+        self.assertEqual((self.cache.misses, self.cache.hits), (2, 0))
+
+        with open(path, 'wb') as f:
+            f.write(b'not gzip')
+        regenerated = self.cache.generate(make_generator(), data_volume=20)
+        self.assertEqual(regenerated['serviceRequests'], expected['serviceRequests'])
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted over the size cap"""
+        self.cache.generate(make_generator(seed=1), data_volume=50)
+        self.cache.generate(make_generator(seed=2), data_volume=50)
+        paths = sorted(os.listdir(self.tempdir.name))
+        self.assertEqual(len(paths), 2)
+
+        # Make seed 1 the most recently used, then cap the cache below two entries
+        for offset, seed in enumerate((2, 1)):
+            params = self.cache.dataset_params(make_generator(seed=seed), 50, True)
+            self.assertIsNotNone(self.cache.get(params))
+            path = self.cache._path(cache_key(params))
+            os.utime(path, (1000 + offset, 1000 + offset))
+        self.cache.max_bytes = self.cache.size_bytes() - 1
+        self.assertEqual(self.cache.evict(), 1)
+
+        self.assertIsNotNone(self.cache.get(
+            self.cache.dataset_params(make_generator(seed=1), 50, True)
+        ))
+        self.assertIsNone(self.cache.get(
+            self.cache.dataset_params(make_generator(seed=2), 50, True)
+        ))
+
+    def test_uncacheable_generators(self):
+        """Test unseeded, unfixed-time, compact and advanced generators are rejected"""
+        with self.assertRaises(ValueError):
+            self.cache.generate(CouncilDataGenerator(reference_time=REFERENCE_TIME), 5)
+        with self.assertRaises(ValueError):
+            self.cache.generate(CouncilDataGenerator(seed=42), data_volume=5)
+        with self.assertRaises(ValueError):
+            self.cache.generate(make_generator(compact=True), data_volume=5)
+
+        generator = make_generator()
+        generator.generate(5)
+        with self.assertRaises(ValueError):
+            self.cache.generate(generator, data_volume=5)
+
+
+    def test_generator_state_same_on_hit_and_miss(self):
+        """Test a miss rewinds the generator like a hit leaves it"""
+        for _ in range(2):
+            generator = make_generator()
+            data = self.cache.generate(generator, data_volume=15)
+            self.assertEqual(generator.next_index, 0)
+            self.assertEqual(generator.generate(15)['residents'], data['residents'])
+        self.assertEqual((self.cache.misses, self.cache.hits), (1, 1))
+
+
+class TestAsyncRecords(unittest.TestCase):
+    """Test the async batch iterator"""
+
+    def test_matches_stream(self):
+        """Test batches hold exactly the records generate_stream() yields"""
+        async def consume():
+            stream = make_generator().aiter_records(data_volume=95, batch_size=20)
+            batches = [batch async for batch in stream]
+            return batches, stream
+
+        batches, stream = asyncio.run(consume())
+        expected = list(make_generator().generate_stream(data_volume=95))
+
+        self.assertIsInstance(stream, AsyncRecordStream)
+        self.assertEqual([len(b) for b in batches], [20] * 9 + [10])
+        self.assertEqual([r for b in batches for r in b], expected)
+        self.assertEqual(stream.record_counts['total'], 190)
+        self.assertEqual(stream.metadata['dataVolume'], 95)
+
+    def test_backpressure(self):
+        """Test the producer stays at most max_pending batches ahead"""
+        generator = make_generator()
+
+        async def consume():
+            ahead = []
+            async with generator.aiter_records(
+                data_volume=500, include_service_requests=False,
+                batch_size=10, max_pending=2
+            ) as stream:
+                received = 0
+                async for batch in stream:
+                    received += len(batch)
+                    await asyncio.sleep(0.005)
+                    ahead.append(generator.next_index - received)
+            return ahead
+
+        ahead = asyncio.run(consume())
+        self.assertEqual(len(ahead), 50)
+        # Queued batches plus the one being filled
+        self.assertLessEqual(max(ahead), 3 * 10)
+
+    def test_early_exit_stops_producer(self):
+        """Test leaving the stream early stops generation"""
+        generator = make_generator()
+
+        async def consume():
+            async with generator.aiter_records(data_volume=100000, batch_size=10,
+                                               max_pending=1) as stream:
+                async for batch in stream:
+                    break
+            return stream
+
+        stream = asyncio.run(consume())
+        self.assertFalse(stream.exhausted)
+        self.assertLess(generator.next_index, 100)
+
+    def test_errors(self):
+        """Test producer errors reach the consumer and bad arguments fail"""
+        generator = make_generator()
+        with self.assertRaises(ValueError):
+            generator.aiter_records(batch_size=0)
+
+        async def consume():
+            async for batch in generator.aiter_records(data_volume=5):
+                pass
+
+        generator.generate_resident = None
+        with self.assertRaises(TypeError):
+            asyncio.run(consume())
+
+
+class TestMultiCouncilGeneration(unittest.TestCase):
+    """Test batch generation for many councils"""
+
+    REFERENCE_TIME = datetime(2025, 11, 1, 9, 30)
+    SPECS = [
+        ("Leeds City Council", "Yorkshire", 30, 1),
+        ("Bristol City Council", "South West", 10, 2),
+        ("Manchester City Council", "North West", 20, 3),
+    ]
+
+    def expected(self, council_name, region, volume, seed, **kwargs):
+        return CouncilDataGenerator(
+            seed=seed, council_name=council_name, region=region,
+            reference_time=self.REFERENCE_TIME, **kwargs
+        ).generate(volume)
+
+    def test_in_process_matches_single_generators(self):
+        """Test each dataset matches a standalone generator"""
+        results = list(generate_councils(self.SPECS, reference_time=self.REFERENCE_TIME))
+
+        self.assertEqual([spec for spec, _ in results], [CouncilSpec(*s) for s in self.SPECS])
+        for spec, data in results:
+            expected = self.expected(*spec)
+            self.assertEqual(data['residents'], expected['residents'])
+            self.assertEqual(data['serviceRequests'], expected['serviceRequests'])
+            self.assertEqual(data['metadata']['councilName'], spec.council_name)
+
+    def test_worker_pool(self):
+        """Test pooled results match and ordered=True keeps spec order"""
+        results = list(generate_councils(
+            self.SPECS * 2, workers=2, ordered=True,
+            reference_time=self.REFERENCE_TIME, counter_based=True
+        ))
+
+        self.assertEqual([spec.seed for spec, _ in results], [1, 2, 3, 1, 2, 3])
+        for spec, data in results:
+            self.assertEqual(
+                data['residents'], self.expected(*spec, counter_based=True)['residents']
+            )
+
+    def test_shared_reference_time(self):
+        """Test one default reference time applies to the whole batch"""
+        times = {
+            data['metadata']['referenceTime']
+            for _, data in generate_councils(self.SPECS, include_service_requests=False)
+        }
+        self.assertEqual(len(times), 1)
+
+    def test_invalid_arguments(self):
+        """Test per-council options and bad worker counts are rejected"""
+        with self.assertRaises(ValueError):
+            generate_councils(self.SPECS, workers=0)
+        with self.assertRaises(ValueError):
+            generate_councils(self.SPECS, seed=5)
+
+
+class TestLazyImport(unittest.TestCase):
+    """Test the package loads its submodules lazily"""
+
+    # Slow-to-import stdlib modules that only opt-in features need; import
+    # timings are reported by the benchmark suite rather than asserted here
+    HEAVY_MODULES = ('json', 'tracemalloc', 'mmap', 'asyncio', 'multiprocessing',
+                     'concurrent.futures')
+
+    def test_import_loads_only_package(self):
+        """Test importing the package loads no submodules or heavy stdlib modules"""
+        from benchmark_uk_data_generator import measure_import_time
+
+        cost = measure_import_time('import uk_data_generator')
+        self.assertEqual(cost['modules'], ['uk_data_generator'])
+        for module in self.HEAVY_MODULES + ('random', 'datetime'):
+            self.assertNotIn(module, cost['loaded'])
+
+    def test_first_use_skips_optional_modules(self):
+        """Test generating dicts does not load pools, asyncio, caches or opt-in features"""
+        from benchmark_uk_data_generator import measure_import_time
+
+        cost = measure_import_time(
+            'from uk_data_generator import CouncilDataGenerator\n'
+            'CouncilDataGenerator(seed=1).generate(5)'
+        )
+        self.assertIn('uk_data_generator.generators', cost['modules'])
+        for optional in ('parallel', 'aio', 'cache', 'writers', 'profiling', 'batch',
+                         'records', 'digest', 'datapack', 'streaming'):
+            self.assertNotIn(f'uk_data_generator.{optional}', cost['modules'])
+        for module in self.HEAVY_MODULES:
+            self.assertNotIn(module, cost['loaded'])
+
+    def test_public_names_resolve(self):
+        """Test every exported name resolves and unknown names fail"""
+        import uk_data_generator
+
+        for name in uk_data_generator.__all__:
+            self.assertIsNotNone(getattr(uk_data_generator, name))
+            self.assertIn(name, dir(uk_data_generator))
+        self.assertIs(uk_data_generator.CouncilDataGenerator, CouncilDataGenerator)
+        with self.assertRaises(AttributeError):
+            uk_data_generator.NoSuchGenerator
+
+
+class TestIndependentStreams(unittest.TestCase):
+    """Test sub-generators draw from independent streams of one seed"""
+
+    def test_spawned_streams(self):
+        """Test spawned streams are deterministic and distinct per name"""
+        draws = {
+            name: spawn_random(42, name).getrandbits(256)
+            for name in ('names', 'addresses', 'serviceRequests', 'council')
+        }
+        self.assertEqual(len(set(draws.values())), 4)
+        self.assertEqual(spawn_random(42, 'names').getrandbits(256), draws['names'])
+        self.assertNotEqual(spawn_random(43, 'names').getrandbits(256), draws['names'])
+        self.assertNotEqual(random.Random(42).getrandbits(256), draws['names'])
+
+    def test_sub_generators_decorrelated(self):
+        """Test sub-generators no longer replay the same random sequence"""
+        generator = CouncilDataGenerator(seed=42)
+        sources = [
+            generator.random,
+            generator.name_generator.random,
+            generator.address_generator.random,
+            generator.service_generator.random
+        ]
+        firsts = [[source.random() for _ in range(20)] for source in sources]
+        for i, first in enumerate(firsts):
+            for other in firsts[i + 1:]:
+                self.assertFalse(set(first) & set(other))
+
+    def test_standalone_generators_match_council(self):
+        """Test a sub-generator with the dataset seed reproduces its stream"""
+        name_generator = UKNameGenerator(seed=42, allow_reuse=True)
+        names = [name_generator.generate_name() for _ in range(20)]
+        addresses = UKAddressGenerator(seed=42).generate_addresses(20)
+        data = CouncilDataGenerator(seed=42).generate(20, include_service_requests=False)
+
+        self.assertEqual([r['name'] for r in data['residents']], names)
+        self.assertEqual([r['address'] for r in data['residents']], addresses)
+
+    def test_old_checkpoints_rejected(self):
+        """Test checkpoints from the shared-seed layout are not resumed"""
+        state = CouncilDataGenerator(seed=42).get_state()
+        state['version'] = 1
+        with self.assertRaises(ValueError):
+            CouncilDataGenerator(seed=42).set_state(state)
+
+
+class TestArrivalSimulator(unittest.TestCase):
+    """Test time-series service request arrivals"""
+
+    START = datetime(2024, 1, 1)
+    END = datetime(2025, 1, 1)
+
+    def test_sorted_and_consistent(self):
+        """Test arrivals are time-ordered with consistent lifecycles"""
+        end = datetime(2024, 2, 1)
+        requests = list(ArrivalSimulator(42, self.START, end, daily_volume=300).iter_requests())
+
+        submitted = [r['submittedAt'] for r in requests]
+        self.assertEqual(submitted, sorted(submitted))
+        self.assertGreaterEqual(submitted[0], self.START.isoformat())
+        self.assertLess(submitted[-1], end.isoformat())
+        for request in requests:
+            self.assertGreaterEqual(request['lastUpdated'], request['submittedAt'])
+            self.assertLessEqual(request['lastUpdated'], end.isoformat())
+            if request['status'] == 'new':
+                self.assertEqual(request['lastUpdated'], request['submittedAt'])
+            month = request['submittedAt'][:7].replace('-', '')
+            self.assertIn(f'-{month}-', request['reference'])
+
+        # Old requests are mostly resolved, recent ones mostly not
+        oldest = Counter(r['status'] for r in requests[:500])
+        newest = Counter(r['status'] for r in requests[-50:])
+        self.assertGreater(oldest['resolved'], 400)
+        self.assertGreater(newest['new'], newest['resolved'])
+
+    def test_volume_and_patterns(self):
+        """Test volume, weekday, hourly and January Council Tax patterns"""
+        simulator = ArrivalSimulator(7, self.START, self.END, daily_volume=200)
+        counts = Counter()
+        total = 0
+        for request in simulator.iter_requests():
+            when = datetime.fromisoformat(request['submittedAt'])
+            total += 1
+            counts['weekday' if when.weekday() < 5 else 'weekend'] += 1
+            counts['day' if 9 <= when.hour < 17 else 'night' if when.hour < 6 else 'other'] += 1
+            if request['category'] == 'Council Tax':
+                counts[f'ct{when.month}'] += 1
+
+        expected = simulator.expected_count()
+        self.assertAlmostEqual(total / expected, 1.0, delta=0.02)
+        self.assertGreater(counts['weekday'] / 5, 1.5 * counts['weekend'] / 2)
+        self.assertGreater(counts['day'], 10 * counts['night'])
+        self.assertGreater(counts['ct1'], 2.5 * counts['ct7'])
+
+    def test_storms_raise_highways_rate(self):
+        """Test storms multiply the Highways rate while they last"""
+        simulator = ArrivalSimulator(42, self.START, self.END)
+        self.assertTrue(simulator.storms)
+        storm = simulator.storms[0]
+        self.assertEqual(storm.category, 'Highways')
+        self.assertIn(storm.start.month, (10, 11, 12, 1, 2, 3))
+
+        calm = ArrivalSimulator(42, self.START, self.END, patterns={
+            **SERVICE_ARRIVAL_PATTERNS, 'storms': None
+        })
+        hour = storm.start.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        highways = simulator.config.category_index['Highways']
+        housing = simulator.config.category_index['Housing']
+        stormy_rates = simulator.hourly_rates(hour)
+        calm_rates = calm.hourly_rates(hour)
+        self.assertGreater(stormy_rates[highways], 2 * calm_rates[highways])
+        self.assertEqual(stormy_rates[housing], calm_rates[housing])
+
+    def test_windows_agree_and_deterministic(self):
+        """Test overlapping windows share arrivals and seeds reproduce"""
+        def arrivals(start, end, seed=3):
+            return [
+                (r['submittedAt'], r['category'], r['requestType'], r['reference'])
+                for r in ArrivalSimulator(seed, start, end, daily_volume=500).iter_requests()
+            ]
+
+        whole = arrivals(datetime(2024, 3, 1, 10, 30), datetime(2024, 3, 4))
+        part = arrivals(datetime(2024, 3, 2), datetime(2024, 3, 4))
+        self.assertEqual([a for a in whole if a[0] >= '2024-03-02'], part)
+        self.assertTrue(whole[0][0] >= '2024-03-01T10:30:00')
+        self.assertEqual(arrivals(datetime(2024, 3, 2), datetime(2024, 3, 4)), part)
+        self.assertNotEqual(arrivals(datetime(2024, 3, 2), datetime(2024, 3, 4), seed=4), part)
+
+    def test_consecutive_windows_have_disjoint_references(self):
+        """Test references are unique across consecutive windows"""
+        def references(start, end, compact=False):
+            simulator = ArrivalSimulator(3, start, end, daily_volume=2000, compact=compact)
+            return [r.reference if compact else r['reference'] for r in simulator.iter_requests()]
+
+        first = references(datetime(2024, 3, 1), datetime(2024, 3, 2, 12, 30))
+        second = references(datetime(2024, 3, 2, 12, 30), datetime(2024, 3, 4))
+        self.assertEqual(len(set(first)), len(first))
+        self.assertEqual(len(set(second)), len(second))
+        self.assertFalse(set(first) & set(second))
+        self.assertEqual(
+            references(datetime(2024, 3, 1), datetime(2024, 3, 4), compact=True),
+            first + second
+        )
+
+    def test_poisson_and_service_generator(self):
+        """Test the Poisson sampler and the CouncilServiceGenerator entry point"""
+        rng = random.Random(1)
+        for lam in (0.5, 4.0, 25.0, 400.0):
+            draws = [poisson(rng, lam) for _ in range(20000)]
+            self.assertAlmostEqual(sum(draws) / len(draws), lam, delta=0.05 * lam + 0.02)
+        self.assertEqual(poisson(rng, 0.0), 0)
+
+        generator = CouncilServiceGenerator(
+            seed=5, reference_time=datetime(2024, 6, 1), compact=True
+        )
+        records = list(generator.iter_arrivals(datetime(2024, 5, 30), daily_volume=100))
+        self.assertTrue(records)
+        self.assertIsInstance(records[0], ServiceRequestRecord)
+        self.assertLess(records[-1].submitted_at, '2024-06-01')
+        with self.assertRaises(ValueError):
+            ArrivalSimulator(1, self.END, self.START)
+
+
+class TestFOILetterGenerator(unittest.TestCase):
+    """Test FOI letters and their ground-truth PII offsets"""
+
+    EMAIL_PATTERN = re.compile(r'^[a-z0-9._]+@example\.(com|org|net)$')
+    PHONE_PATTERN = re.compile(r'^(07700 900\d{3}|0(113|121|161) 496 0\d{3})$')
+    POSTCODE_PATTERN = re.compile(r'^[A-Z]{1,2}\d{1,2} \d[A-Z]{2}$')
+
+    def test_offsets_match_entities(self):
+        """Test every entity span holds a value of its type"""
+        generator = FOILetterGenerator(seed=42, council_name="Leeds City Council")
+        types = Counter()
+        for letter in generator.iter_letters(200):
+            text = letter['text']
+            previous_end = 0
+            for entity in letter['entities']:
+                begin, end = entity['BeginOffset'], entity['EndOffset']
+                self.assertGreaterEqual(begin, previous_end)
+                previous_end = end
+                value = text[begin:end]
+                types[entity['Type']] += 1
+
+                if entity['Type'] == 'EMAIL':
+                    self.assertRegex(value, self.EMAIL_PATTERN)
+                elif entity['Type'] == 'PHONE':
+                    self.assertRegex(value, self.PHONE_PATTERN)
+                elif entity['Type'] == 'ADDRESS':
+                    # Full address, postcode or street line
+                    self.assertRegex(
+                        value.split('\n')[-1], f'{self.POSTCODE_PATTERN.pattern}|^\\d+ '
+                    )
+                elif entity['Type'] == 'NAME':
+                    self.assertRegex(value, r'^[A-Z][a-z]+ [A-Z][a-z]+$')
+
+        self.assertEqual(set(types), {'NAME', 'ADDRESS', 'EMAIL', 'PHONE', 'DATE_TIME'})
+
+    def test_every_pii_slot_is_labelled(self):
+        """Test each template labels every slot holding a name, address, contact or date"""
+        pii_slots = {
+            'name': 'NAME', 'third_party': 'NAME', 'address': 'ADDRESS',
+            'address_line': 'ADDRESS', 'postcode': 'ADDRESS', 'email': 'EMAIL',
+            'phone': 'PHONE', 'date': 'DATE_TIME'
+        }
+        other_slots = {'council', 'council_domain', 'topic', 'context', 'reference'}
+
+        for parts in foi._PARSED_TEMPLATES:
+            slots = [slot for _, slot in parts if slot is not None]
+            self.assertLessEqual(set(slots), set(pii_slots) | other_slots)
+            values = {slot: f'<{slot}>' for slot in pii_slots.keys() | other_slots}
+
+            pieces, entities = foi._render(parts, values)
+            text = ''.join(pieces)
+            labelled = [(e['Type'], text[e['BeginOffset']:e['EndOffset']]) for e in entities]
+            self.assertEqual(
+                labelled,
+                [(pii_slots[slot], f'<{slot}>') for slot in slots if slot in pii_slots]
+            )
+
+    def test_text_outside_entities_has_no_pii(self):
+        """Test redacting the entities removes every name, email and phone"""
+        generator = FOILetterGenerator(seed=7)
+        for letter in generator.iter_letters(100):
+            text = letter['text']
+            redacted = text
+            for entity in reversed(letter['entities']):
+                redacted = (redacted[:entity['BeginOffset']] + f"[{entity['Type']}]"
+                            + redacted[entity['EndOffset']:])
+            self.assertNotIn('@example.', redacted)
+            self.assertNotRegex(redacted, r'07700 900\d{3}| 496 0\d{3}')
+            self.assertIn(SAMPLE_DATA_MARKER, redacted)
+
+    def test_deterministic(self):
+        """Test the same seed produces the same corpus"""
+        first = FOILetterGenerator(seed=5).generate_letters(20)
+        second = FOILetterGenerator(seed=5).generate_letters(20)
+        self.assertEqual(first, second)
+        self.assertEqual(first[3]['documentId'], '[SAMPLE] FOI-000003')
+        self.assertNotEqual(FOILetterGenerator(seed=6).generate_letters(20), first)
+
+
+class TestCarParkSensorHistory(unittest.TestCase):
+    """Test backfilled smart car park sensor readings"""
+
+    START = datetime(2025, 11, 1)
+
+    def test_layout_and_time_order(self):
+        """Test every sensor reports once per step, in time order"""
+        history = CarParkSensorHistory(42, self.START, self.START + timedelta(hours=3))
+        readings = list(history.iter_readings())
+        self.assertEqual(len(readings), history.reading_count)
+        self.assertEqual(history.reading_count, 50 * 180)
+
+        sensors = [reading['sensor_id'] for reading in readings[:50]]
+        self.assertEqual(sensors[0], 'GF-01')
+        self.assertEqual(sensors[20], 'L1-01')
+        self.assertEqual(sensors[-1], 'L2-15')
+        self.assertEqual(Counter(r['zone'] for r in readings[:50]),
+                         {'ground': 20, 'level1': 15, 'level2': 15})
+
+        timestamps = [reading['timestamp'] for reading in readings]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual(timestamps[0], '2025-11-01T00:00:00Z')
+        self.assertEqual(timestamps[-1], '2025-11-01T02:59:00Z')
+        first = readings[0]
+        self.assertEqual(first['ttl'], int(datetime(2025, 11, 8, tzinfo=timezone.utc).timestamp()))
+        self.assertEqual(first['sampleMarker'], SAMPLE_DATA_MARKER)
+        for reading in readings:
+            self.assertIsInstance(reading['occupied'], bool)
+            self.assertTrue(0.92 <= reading['confidence'] <= 0.99)
+            self.assertTrue(10.0 <= reading['battery_level'] <= 100.0)
+
+    def test_occupancy_converges_to_targets(self):
+        """Test long-run occupancy per zone matches each band's target"""
+        for band in ('peak', 'offPeak', 'night'):
+            # Hold the whole history in one band
+            settings = dict(
+                CAR_PARK_SENSORS,
+                peakHours=list(range(24)) if band == 'peak' else [],
+                nightHours=list(range(24)) if band == 'night' else []
+            )
+            history = CarParkSensorHistory(
+                1, self.START, self.START + timedelta(days=2), settings=settings
+            )
+            occupied = Counter()
+            for _, states, _, _ in history.iter_steps():
+                for (_, zone), state in zip(history.sensors, states):
+                    occupied[zone] += state
+            steps = history.step_count
+            for zone, target in CAR_PARK_SENSORS['targets'][band].items():
+                sensors = CAR_PARK_SENSORS['zones'][zone]['sensors']
+                self.assertAlmostEqual(occupied[zone] / (steps * sensors), target, delta=0.07)
+
+    def test_state_persists(self):
+        """Test spaces change state far less often than independent draws would"""
+        history = CarParkSensorHistory(3, self.START, self.START + timedelta(days=1))
+        previous = None
+        changes = 0
+        for _, states, _, _ in history.iter_steps():
+            if previous is not None:
+                changes += sum(a != b for a, b in zip(previous, states))
+            previous = states
+        # Independent draws at ~50% occupancy would change about half the time
+        self.assertLess(changes / (50 * history.step_count), 0.05)
+        self.assertGreater(changes, 0)
+
+    def test_batches_and_determinism(self):
+        """Test batches cover the readings and the same seed repeats them"""
+        end = self.START + timedelta(hours=2)
+        history = CarParkSensorHistory(9, self.START, end, interval_minutes=5, ttl_days=None)
+        batches = list(history.iter_batches())
+        self.assertTrue(all(len(batch) == 25 for batch in batches[:-1]))
+        readings = [reading for batch in batches for reading in batch]
+        self.assertEqual(readings, list(CarParkSensorHistory(
+            9, self.START, end, interval_minutes=5, ttl_days=None
+        ).iter_readings()))
+        self.assertEqual(len(readings), 50 * 24)
+        self.assertEqual(readings[50]['timestamp'], '2025-11-01T00:05:00Z')
+        self.assertNotIn('ttl', readings[0])
+        self.assertNotEqual(
+            list(CarParkSensorHistory(10, self.START, end, interval_minutes=5).iter_readings())
+            [:50], readings[:50]
+        )
+
+        with self.assertRaises(ValueError):
+            CarParkSensorHistory(1, end, self.START)
+        with self.assertRaises(ValueError):
+            next(history.iter_batches(0))
+
+
+class TestDatasetDigest(unittest.TestCase):
+    """Test dataset content digests"""
+
+    def test_matches_canonical_json(self):
+        """Test the digest is BLAKE2b-256 of the dataset's canonical JSON"""
+        generator = make_generator(digest=True)
+        data = generator.generate(data_volume=120)
+        canonical = json.dumps(
+            {'residents': data['residents'], 'serviceRequests': data['serviceRequests']},
+            sort_keys=True, separators=(',', ':')
+        )
+        expected = hashlib.blake2b(canonical.encode(), digest_size=32).hexdigest()
+        self.assertEqual(data['metadata']['digest'], expected)
+        self.assertEqual(data['metadata']['digestAlgorithm'], 'blake2b-256')
+
+        # Survives a JSON round trip and detects tampering
+        stored = json.loads(json.dumps(data))
+        self.assertTrue(generator.validate_data(stored))
+        stored['serviceRequests'][5]['status'] = 'tampered'
+        with self.assertRaises(ValueError):
+            generator.validate_data(stored)
+        reordered = json.loads(json.dumps(data))
+        reordered['residents'].reverse()
+        with self.assertRaises(ValueError):
+            generator.validate_data(reordered)
+
+    def test_paths_agree(self):
+        """Test streamed, async, compact and parallel runs share the digest"""
+        digest = make_generator(digest=True).generate(data_volume=150)['metadata']['digest']
+
+        stream = make_generator(digest=True).generate_stream(data_volume=150)
+        list(stream)
+        self.assertEqual(stream.metadata['digest'], digest)
+
+        async def consume():
+            records = make_generator(digest=True).aiter_records(data_volume=150, batch_size=40)
+            async for _ in records:
+                pass
+            return records.metadata['digest']
+
+        self.assertEqual(asyncio.run(consume()), digest)
+        compact = make_generator(digest=True, compact=True).generate(data_volume=150)
+        self.assertEqual(compact['metadata']['digest'], digest)
+
+        single = make_generator(digest=True, counter_based=True).generate(data_volume=150)
+        sharded = make_generator(digest=True, counter_based=True).generate(150, parallel=2)
+        self.assertEqual(sharded['metadata']['digest'], single['metadata']['digest'])
+        self.assertNotEqual(single['metadata']['digest'], digest)
+
+    def test_incremental_digest(self):
+        """Test chunking does not change the digest and order is enforced"""
+        data = make_generator(digest=True).generate(data_volume=30, include_service_requests=False)
+        digest = DatasetDigest(chunk_size=7)
+        for resident in data['residents']:
+            digest.update('resident', resident)
+        self.assertEqual(digest.hexdigest(), data['metadata']['digest'])
+        self.assertEqual(dataset_digest(data['residents'], []), data['metadata']['digest'])
+        self.assertNotEqual(dataset_digest([], data['residents']), data['metadata']['digest'])
+
+        with self.assertRaises(RuntimeError):
+            digest.update('resident', data['residents'][0])
+        out_of_order = DatasetDigest()
+        out_of_order.update('serviceRequest', {})
+        with self.assertRaises(ValueError):
+            out_of_order.update('resident', {})
+
+    def test_records_changed_after_yield(self):
+        """Test consumers changing yielded records do not change the digest"""
+        digest = make_generator(digest=True).generate(data_volume=60)['metadata']['digest']
+
+        stream = make_generator(digest=True).generate_stream(data_volume=60)
+        for _, record in stream:
+            record['loadedAt'] = '2025-11-02T00:00:00'
+        self.assertEqual(stream.metadata['digest'], digest)
+
+        async def consume():
+            records = make_generator(digest=True).aiter_records(data_volume=60, batch_size=7)
+            async for batch in records:
+                for _, record in batch:
+                    record['sampleMarker'] = 'LOADED'
+            return records.metadata['digest']
+
+        self.assertEqual(asyncio.run(consume()), digest)
+
+    def test_disabled(self):
+        """Test the digest is off by default and digest=False leaves it out"""
+        data = CouncilDataGenerator(seed=42).generate(data_volume=10)
+        self.assertNotIn('digest', data['metadata'])
+        data = make_generator().generate(data_volume=10)
+        self.assertNotIn('digest', data['metadata'])
+        self.assertTrue(CouncilDataGenerator().validate_data(data))
+        stream = make_generator().generate_stream(data_volume=10)
+        list(stream)
+        self.assertNotIn('digest', stream.metadata)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)